@@ -0,0 +1,231 @@
+"""
+Background jobs for long GraphRAG queries.
+
+Clients behind proxies with short timeouts submit a query, get a job id straight
+away and poll for the result. A fixed pool of workers runs the queued jobs;
+finished jobs are kept for a TTL. Cancelling a running job cancels its task, which
+aborts the awaited LLM, embeddings and Qdrant calls; a graph query already running
+in a worker thread finishes, but no further step starts.
+"""
+
+import asyncio
+import math
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import REGISTRY
+
+logger = setup_logging()
+
+JOBS_QUEUED_METRIC = "graphrag_jobs_queued"
+JOBS_RUNNING_METRIC = "graphrag_jobs_running"
+JOBS_FINISHED_METRIC = "graphrag_jobs_finished_total"
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobQueueFull(Exception):
+    """Too many jobs are waiting; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Job queue is full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class Job:
+    """A submitted query and, once finished, its result or error."""
+
+    id: str
+    request: Any
+    status: JobStatus = "queued"
+    stage: str | None = None
+    result: Any = None
+    error: str | None = None
+    submitted_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    _work: Callable[["Job"], Coroutine[Any, Any, Any]] | None = field(default=None, repr=False)
+    _task: asyncio.Task[Any] | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a final status."""
+        return self.status in ("succeeded", "failed", "cancelled")
+
+
+class JobManager:
+    """Run submitted jobs on a bounded worker pool and keep their results for a while.
+
+    Args:
+        workers: Jobs run at the same time.
+        max_pending: Queued jobs allowed before `submit` raises JobQueueFull.
+        ttl_seconds: How long a finished job stays available.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: asyncio.Queue[Job] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._queued = 0
+        self._running = 0
+        # Moving average of job duration, for Retry-After estimates
+        self._job_seconds = 10.0
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Jobs being run."""
+        return self._running
+
+    def submit(self, work: Callable[[Job], Coroutine[Any, Any, Any]], request: Any = None) -> Job:
+        """Queue a job.
+
+        Args:
+            work: Coroutine function doing the job and returning its result; it may
+                update `job.stage` as it goes.
+            request: What was asked for, kept on the job for display.
+
+        Returns:
+            The queued job.
+
+        Raises:
+            JobQueueFull: `max_pending` jobs are already waiting.
+        """
+        self._purge()
+        if self.queued >= self.max_pending:
+            retry_after = max(1, math.ceil(self._job_seconds * (self.queued + 1) / self.workers))
+            raise JobQueueFull(retry_after)
+        queue = self._start_workers()
+        job = Job(id=secrets.token_urlsafe(12), request=request, submitted_at=self._clock(), _work=work)
+        self._jobs[job.id] = job
+        self._queued += 1
+        queue.put_nowait(job)
+        self._publish()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """The job with this id, unless it is unknown or expired."""
+        self._purge()
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """Cancel a queued or running job (finished jobs are left as they are).
+
+        Returns:
+            The job, or None if it is unknown or expired.
+        """
+        job = self.get(job_id)
+        if job is None or job.done:
+            return job
+        if job.status == "queued":
+            # Left in the queue; the worker that picks it up skips it
+            self._queued -= 1
+        elif job._task is not None:
+            # The task stops at its next await; its worker moves on once it has
+            job._task.cancel()
+        self._finish(job, "cancelled")
+        return job
+
+    async def close(self) -> None:
+        """Stop the workers, cancelling the running jobs."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        while self._queue is not None and not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job.status == "queued":
+                self._queued -= 1
+                self._finish(job, "cancelled")
+        self._queue = None
+
+    def _start_workers(self) -> asyncio.Queue[Job]:
+        # Started on first use, inside the server's event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._workers = [asyncio.create_task(self._work(self._queue)) for _ in range(self.workers)]
+        return self._queue
+
+    async def _work(self, queue: asyncio.Queue[Job]) -> None:
+        while True:
+            job = await queue.get()
+            if job.status == "queued":
+                self._queued -= 1
+                await self._run_job(job)
+
+    async def _run_job(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = self._clock()
+        self._running += 1
+        self._publish()
+        assert job._work is not None
+        task = job._task = asyncio.create_task(job._work(job))
+        try:
+            # Wait without letting a cancelled job cancel the worker
+            await asyncio.wait([task])
+        except asyncio.CancelledError:
+            task.cancel()
+            self._finish(job, "cancelled")
+            raise
+        finally:
+            self._running -= 1
+            self._publish()
+        self._job_seconds = 0.8 * self._job_seconds + 0.2 * (self._clock() - job.started_at)
+        if job.done:
+            return  # cancelled through `cancel`
+        if task.cancelled():
+            self._finish(job, "cancelled")
+        elif (error := task.exception()) is not None:
+            logger.error(f"Job {job.id} failed: {error}", exc_info=error)
+            job.error = str(error) or type(error).__name__
+            self._finish(job, "failed")
+        else:
+            job.result = task.result()
+            self._finish(job, "succeeded")
+
+    def _finish(self, job: Job, status: JobStatus) -> None:
+        if job.done:
+            return
+        job.status = status
+        job.finished_at = self._clock()
+        job._task = job._work = None
+        REGISTRY.inc(JOBS_FINISHED_METRIC, status=status)
+        self._publish()
+        logger.info(f"Job {job.id} {status}")
+
+    def _purge(self) -> None:
+        now = self._clock()
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at >= self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _publish(self) -> None:
+        REGISTRY.set_gauge(JOBS_QUEUED_METRIC, self._queued)
+        REGISTRY.set_gauge(JOBS_RUNNING_METRIC, self._running)
@@ -0,0 +1,70 @@
+"""
+HTTP-level metrics for the API server.
+
+`MetricsMiddleware` counts in-flight requests and times every request by route
+template (so `/api/graphrag-query` is one series however many queries it serves).
+Streamed responses are timed until their last chunk is sent.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from biomedical_graphrag.utils.metrics_util import REGISTRY
+
+HTTP_IN_FLIGHT_METRIC = "graphrag_http_requests_in_flight"
+HTTP_DURATION_METRIC = "graphrag_http_request_duration_seconds"
+CACHE_HIT_RATIO_METRIC = "graphrag_cache_hit_ratio"
+
+# Counters with a `result` label of hit/miss, published as hit ratios at scrape time
+_CACHE_COUNTERS = {"answer": "graphrag_answer_cache_requests_total"}
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording in-flight requests and request latency."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._in_flight = 0
+        REGISTRY.set_gauge(HTTP_IN_FLIGHT_METRIC, 0)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection, timing HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._in_flight += 1
+        REGISTRY.set_gauge(HTTP_IN_FLIGHT_METRIC, self._in_flight)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._in_flight -= 1
+            REGISTRY.set_gauge(HTTP_IN_FLIGHT_METRIC, self._in_flight)
+            route = scope.get("route")
+            REGISTRY.histogram(
+                HTTP_DURATION_METRIC,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            ).observe(time.perf_counter() - start)
+
+
+def publish_cache_hit_ratios() -> None:
+    """Set the hit-ratio gauge of every cache from its hit/miss counters."""
+    for cache, counter in _CACHE_COUNTERS.items():
+        results = {
+            labels.get("result"): value for name, labels, value in REGISTRY.counters() if name == counter
+        }
+        total = results.get("hit", 0.0) + results.get("miss", 0.0)
+        if total:
+            REGISTRY.set_gauge(CACHE_HIT_RATIO_METRIC, results.get("hit", 0.0) / total, cache=cache)
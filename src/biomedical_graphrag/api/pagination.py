@@ -0,0 +1,147 @@
+"""
+Cursors for paging deeper into a search's retrieval ranking.
+
+A search keeps its embedded retrieval request (`GraphRAGResult.retrieval`). The
+first response opens a session holding that request and the ids of the papers
+served so far, and hands out an opaque cursor `<session>.<offset>`. Fetching a
+page re-runs the stored request with the served papers filtered out, so deeper
+pages cost one Qdrant query: no tool selection, embeddings or summary.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from biomedical_graphrag.application.services.hybrid_service.qdrant_query import RetrievalQuery
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not issued by this server."""
+
+
+class ExpiredCursorError(LookupError):
+    """The cursor's session expired or was evicted; run the search again."""
+
+
+@dataclass
+class _Session:
+    query: "RetrievalQuery"
+    expires_at: float
+    served: list[int | str] = field(default_factory=list)
+
+
+@dataclass
+class CursorPage:
+    """What a cursor points at: the search's retrieval and the papers served before the page."""
+
+    session_id: str
+    offset: int
+    query: "RetrievalQuery"
+    exclude_ids: list[int | str]
+
+
+class PageCursors:
+    """Retrieval sessions behind result-page cursors, with TTL and LRU eviction.
+
+    A cursor records how many results came before its page, so fetching the same
+    cursor twice returns the same page.
+
+    Args:
+        ttl_seconds: Lifetime of a session since its last page.
+        max_entries: Sessions kept before the least recently used one is evicted.
+        max_depth: Deepest result (offset + page size) a client can page to.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_depth: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_depth = max_depth
+        self._clock = clock
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, query: "RetrievalQuery | None", results: list[dict], limit: int) -> str | None:
+        """Start a session after a search's first page.
+
+        Args:
+            query: The search's retrieval; None (e.g. no retrieval tool ran) disables paging.
+            results: The papers returned on the first page.
+            limit: The first page's size.
+
+        Returns:
+            The cursor of the second page, or None when there is nothing further to fetch.
+        """
+        if query is None or not self._has_more(0, results, limit):
+            return None
+        session_id = secrets.token_urlsafe(12)
+        self._sessions[session_id] = _Session(query=query, expires_at=self._clock() + self.ttl_seconds)
+        self._evict()
+        return self.advance(CursorPage(session_id, 0, query, []), results, limit)
+
+    def resolve(self, cursor: str) -> CursorPage:
+        """Look up the page a cursor points at.
+
+        Raises:
+            InvalidCursorError: The cursor is malformed.
+            ExpiredCursorError: Its session is gone.
+        """
+        session_id, _, offset = cursor.rpartition(".")
+        if not session_id or not offset.isdigit():
+            raise InvalidCursorError(f"Malformed cursor: {cursor!r}")
+        session = self._sessions.get(session_id)
+        if session is None or session.expires_at <= self._clock():
+            self._sessions.pop(session_id, None)
+            raise ExpiredCursorError("Cursor expired; run the search again")
+        if int(offset) > len(session.served):
+            raise InvalidCursorError(f"Cursor {cursor!r} is past the served results")
+        self._sessions.move_to_end(session_id)
+        return CursorPage(session_id, int(offset), session.query, session.served[: int(offset)])
+
+    def page_size(self, page: CursorPage, limit: int) -> int:
+        """The requested page size, capped so the page ends at `max_depth`."""
+        return max(0, min(limit, self.max_depth - page.offset))
+
+    def advance(self, page: CursorPage, results: list[dict], limit: int) -> str | None:
+        """Record a fetched page.
+
+        Args:
+            page: The resolved cursor.
+            results: The papers returned for it.
+            limit: The requested page size.
+
+        Returns:
+            The cursor of the following page, or None at the end of the ranking.
+        """
+        session = self._sessions.get(page.session_id)
+        if session is None:
+            return None
+        session.served = [*session.served[: page.offset], *(r["id"] for r in results)]
+        session.expires_at = self._clock() + self.ttl_seconds
+        offset = page.offset + len(results)
+        if not self._has_more(page.offset, results, limit):
+            return None
+        return f"{page.session_id}.{offset}"
+
+    def _has_more(self, offset: int, results: list[dict], limit: int) -> bool:
+        # A short page means the ranking is exhausted
+        return bool(results) and len(results) >= limit and offset + len(results) < self.max_depth
+
+    def _evict(self) -> None:
+        now = self._clock()
+        for session_id in [k for k, s in self._sessions.items() if s.expires_at <= now]:
+            del self._sessions[session_id]
+        while len(self._sessions) > self.max_entries:
+            self._sessions.popitem(last=False)
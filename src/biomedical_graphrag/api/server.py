@@ -2,64 +2,106 @@
 FastAPI server for PubMed Navigator API.
 
 Provides endpoints for:
-- Health check
-- Neo4j graph statistics
-- Hybrid GraphRAG search (Qdrant + Neo4j)
+- Health (liveness) and readiness checks
+- Neo4j graph statistics (cached, with ETag revalidation)
+- Hybrid GraphRAG search (Qdrant + Neo4j), blocking or streamed as server-sent events
+- Background search jobs: submit, poll and cancel
+- Batch GraphRAG search, streamed back as newline-delimited JSON
+- Deeper pages of a search's retrieval ranking, by cursor
+- Prometheus metrics
 """
 
 import asyncio
-from contextlib import asynccontextmanager
-from typing import Any
-
-from fastapi import FastAPI, HTTPException
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from contextlib import aclosing, asynccontextmanager, suppress
+from functools import partial
+from typing import Annotated, Any, Literal
+
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
-
+from starlette.background import BackgroundTask
+
+from biomedical_graphrag.api.jobs import Job, JobQueueFull
+from biomedical_graphrag.api.metrics import MetricsMiddleware, publish_cache_hit_ratios
+from biomedical_graphrag.api.pagination import ExpiredCursorError, InvalidCursorError
+from biomedical_graphrag.api.services import ServiceContainer
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.utils.admission_util import AdmissionRejected, AdmissionSlot
 from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import REGISTRY, render_prometheus
 
 logger = setup_logging()
 
-# Lazy-loaded modules (for faster startup / health checks)
-_services_loaded = False
-_neo4j_query_class = None
-_run_tools_sequence = None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler: owns the service container."""
+    logger.info("Starting PubMed Navigator API server")
+    services = ServiceContainer()
+    app.state.services = services
+    # Load and warm up in the background so the liveness check answers immediately
+    startup = asyncio.create_task(services.start())
+    yield
+    logger.info("Shutting down PubMed Navigator API server")
+    startup.cancel()
+    with suppress(asyncio.CancelledError):
+        await startup
+    await services.close()
 
-def _load_services() -> None:
-    """Lazily load heavy services on first request."""
-    global _services_loaded, _neo4j_query_class, _run_tools_sequence
 
-    if _services_loaded:
-        return
+async def get_services(request: Request) -> ServiceContainer:
+    """Endpoint dependency: the app's service container, once loaded."""
+    services: ServiceContainer = request.app.state.services
+    try:
+        await services.wait_loaded()
+    except RuntimeError as e:
+        logger.error(f"Services unavailable: {e}")
+        raise HTTPException(status_code=503, detail="Services unavailable") from e
+    return services
 
-    logger.info("Loading GraphRAG services...")
-    from biomedical_graphrag.application.services.hybrid_service.neo4j_query import (
-        Neo4jGraphQuery,
-    )
-    from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
-        run_tools_sequence_and_summarize,
+
+Services = Annotated[ServiceContainer, Depends(get_services)]
+
+
+def _overloaded(error: AdmissionRejected) -> HTTPException:
+    """503 telling the client when to retry a request that was not admitted."""
+    logger.warning(f"Rejected search: {error}")
+    return HTTPException(
+        status_code=503,
+        detail="Server is busy, retry later",
+        headers={"Retry-After": str(error.retry_after)},
     )
 
-    _neo4j_query_class = Neo4jGraphQuery
-    _run_tools_sequence = run_tools_sequence_and_summarize
-    _services_loaded = True
-    logger.info("GraphRAG services loaded successfully")
 
+async def _admit(services: ServiceContainer) -> AdmissionSlot:
+    """Take a pipeline slot for a streamed response, or fail fast with a 503."""
+    try:
+        return await services.admission.acquire()
+    except AdmissionRejected as e:
+        raise _overloaded(e) from e
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan handler."""
-    logger.info("Starting PubMed Navigator API server")
-    # Preload services in background after startup
-    asyncio.create_task(_preload_services())
-    yield
-    logger.info("Shutting down PubMed Navigator API server")
+
+async def _admit_many(services: ServiceContainer, count: int) -> list[AdmissionSlot]:
+    """Take `count` pipeline slots (all or none), or fail fast with a 503."""
+    slots: list[AdmissionSlot] = []
+    try:
+        for _ in range(count):
+            slots.append(await _admit(services))
+    except BaseException:
+        for slot in slots:
+            slot.release()
+        raise
+    return slots
 
 
-async def _preload_services() -> None:
-    """Preload services in background after health check passes."""
-    await asyncio.sleep(2)  # Wait for health check to pass first
-    await asyncio.to_thread(_load_services)
+def _release_all(slots: list[AdmissionSlot]) -> None:
+    for slot in slots:
+        slot.release()
 
 
 app = FastAPI(
@@ -77,6 +119,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress large JSON / NDJSON responses (server-sent events are never compressed)
+app.add_middleware(GZipMiddleware, minimum_size=settings.graphrag.gzip_minimum_bytes, compresslevel=6)
+# Request latency and in-flight metrics (added last, so it wraps everything else)
+app.add_middleware(MetricsMiddleware)
+
+
+TraceLevel = Literal["names", "counts", "full"]
+_TRACE_DESCRIPTION = (
+    "Trace detail: `names` (tool names and timings), `counts` (plus arguments and result counts) "
+    "or `full` (plus graph tool results; retrieved papers are referenced by id)."
+)
 
 
 # Request/Response models
@@ -86,6 +139,37 @@ class SearchRequest(BaseModel):
     query: str = Field(..., description="The search query")
     limit: int = Field(default=5, ge=1, le=5, description="Maximum number of results (vector search)")
     mode: str = Field(default="graphrag", description="Search mode: graphrag (Qdrant + Neo4j context engineering)")
+    planner: bool | None = Field(
+        default=None,
+        description="Plan retrieval and graph tools in a single LLM call (defaults to server setting)",
+    )
+    trace: TraceLevel | None = Field(
+        default=None, description=_TRACE_DESCRIPTION + " Defaults to the server setting."
+    )
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch search request body."""
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.graphrag.batch_max_queries,
+        description="The search queries",
+    )
+    limit: int = Field(default=5, ge=1, le=5, description="Maximum number of results per query")
+    planner: bool | None = Field(
+        default=None,
+        description="Plan retrieval and graph tools in a single LLM call (defaults to server setting)",
+    )
+    trace: TraceLevel = Field(default="counts", description=_TRACE_DESCRIPTION)
+
+
+class PapersPageRequest(BaseModel):
+    """Result page request body."""
+
+    cursor: str = Field(..., description="`next_cursor` of a search response or of the previous page")
+    limit: int = Field(default=5, ge=1, le=20, description="Maximum number of results on the page")
 
 
 class TraceStep(BaseModel):
@@ -95,6 +179,8 @@ class TraceStep(BaseModel):
     arguments: dict[str, Any] | None = None
     result_count: int | None = None
     results: Any = None
+    result_ids: list[str] | None = None
+    duration_ms: float | None = None
 
 
 class SearchResponse(BaseModel):
@@ -104,6 +190,25 @@ class SearchResponse(BaseModel):
     results: list[dict[str, Any]] = []
     trace: list[TraceStep] = []
     metadata: dict[str, Any] = {}
+    next_cursor: str | None = None
+
+
+class JobResponse(BaseModel):
+    """Search job status; `result` is set once the job succeeded."""
+
+    job_id: str
+    status: str
+    stage: str | None = None
+    result: SearchResponse | None = None
+    error: str | None = None
+    duration_ms: float | None = None
+
+
+class PapersPageResponse(BaseModel):
+    """Result page response body."""
+
+    results: list[dict[str, Any]] = []
+    next_cursor: str | None = None
 
 
 class Neo4jStatsResponse(BaseModel):
@@ -121,117 +226,444 @@ class HealthResponse(BaseModel):
     status: str = "healthy"
 
 
+def _result_id(result: dict, idx: int) -> str:
+    """Id of a Qdrant hit in the formatted `results` (the PMID when there is one)."""
+    paper = result.get("payload", {}).get("paper", {})
+    return str(paper.get("pmid") or result.get("id", f"result-{idx}"))
+
+
+def _format_results(qdrant_results: list[dict], limit: int) -> list[dict[str, Any]]:
+    """Format Qdrant results for the frontend."""
+    formatted_results = []
+    for idx, result in enumerate(qdrant_results[:limit]):
+        payload = result.get("payload", {})
+        paper = payload.get("paper", {})
+        formatted_results.append({
+            "id": _result_id(result, idx),
+            "title": paper.get("title", "Untitled"),
+            "abstract": paper.get("abstract", ""),
+            "authors": [
+                (a.get("name", "") if isinstance(a, dict) else str(a))
+                for a in paper.get("authors", [])
+            ],
+            "journal": paper.get("journal", ""),
+            "year": paper.get("publication_date", ""),
+            "pmid": paper.get("pmid", ""),
+            "score": result.get("score", 0),
+        })
+    return formatted_results
+
+
+def _is_qdrant_hits(results: Any) -> bool:
+    return isinstance(results, list) and bool(results) and all(
+        isinstance(r, dict) and "payload" in r for r in results
+    )
+
+
+def _trace_step(tool: Any, level: TraceLevel | None) -> TraceStep:
+    """Trace entry for a tool execution at the requested level of detail.
+
+    Retrieved papers are already in the response's `results`, so at the `full` level
+    a retrieval step lists their ids instead of repeating the payloads.
+    """
+    level = level or settings.graphrag.trace_level
+    step = TraceStep(name=tool.name, duration_ms=tool.duration_ms)
+    if level == "names":
+        return step
+    step.arguments = tool.arguments
+    step.result_count = tool.result_count
+    if level == "full":
+        if _is_qdrant_hits(tool.results):
+            step.result_ids = [_result_id(r, idx) for idx, r in enumerate(tool.results)]
+        else:
+            step.results = tool.results
+    return step
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Encode one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 # Endpoints
 @app.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    """Health check endpoint."""
+    """Health check endpoint (liveness; answers while services are still loading)."""
     return HealthResponse(status="healthy")
 
 
-@app.get("/api/neo4j/stats", response_model=Neo4jStatsResponse)
-async def get_neo4j_stats() -> Neo4jStatsResponse:
-    """Get Neo4j graph statistics."""
-    try:
-        _load_services()
-        neo4j = _neo4j_query_class()
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus metrics.
+
+    Latency histograms per pipeline phase (`graphrag_phase_duration_seconds`, labelled e.g. by
+    LLM step, Qdrant tool or Neo4j tool), token counters, cache and coalescing counters,
+    admission queue gauges, and HTTP latency and in-flight requests.
+    """
+    publish_cache_hit_ratios()
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/ready", response_model=HealthResponse)
+async def readiness_check(request: Request) -> HealthResponse:
+    """Readiness endpoint: 200 once the shared clients are connected and the caches are warm."""
+    services: ServiceContainer = request.app.state.services
+    if not await services.ensure_ready():
+        raise HTTPException(status_code=503, detail="Services not ready")
+    return HealthResponse(status="ready")
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
 
-        try:
-            # Get node counts by label
-            node_labels_result = neo4j.query("""
-                CALL db.labels() YIELD label
-                CALL apoc.cypher.run('MATCH (n:`' + label + '`) RETURN count(n) as count', {}) YIELD value
-                RETURN label, value.count as count
-                ORDER BY count DESC
-            """)
-
-            # Fallback if APOC not available
-            if not node_labels_result:
-                node_labels_result = neo4j.query("""
-                    MATCH (n)
-                    WITH labels(n) as nodeLabels
-                    UNWIND nodeLabels as label
-                    RETURN label, count(*) as count
-                    ORDER BY count DESC
-                """)
-
-            # Get relationship counts by type
-            rel_types_result = neo4j.query("""
-                MATCH ()-[r]->()
-                RETURN type(r) as type, count(r) as count
-                ORDER BY count DESC
-            """)
-
-            # Get totals
-            totals = neo4j.query("""
-                MATCH (n) WITH count(n) as nodes
-                MATCH ()-[r]->() WITH nodes, count(r) as rels
-                RETURN nodes, rels
-            """)
-
-            total_nodes = totals[0]["nodes"] if totals else 0
-            total_rels = totals[0]["rels"] if totals else 0
-
-            return Neo4jStatsResponse(
-                nodeLabels=[{"label": r["label"], "count": r["count"]} for r in node_labels_result],
-                relationshipTypes=[{"type": r["type"], "count": r["count"]} for r in rel_types_result],
-                totalNodes=total_nodes,
-                totalRelationships=total_rels,
-            )
-        finally:
-            neo4j.close()
 
+@app.get("/api/neo4j/stats", response_model=Neo4jStatsResponse)
+async def get_neo4j_stats(request: Request, response: Response, services: Services) -> Any:
+    """
+    Get Neo4j graph statistics.
+
+    Served from a cache refreshed in the background once older than `NEO4J__STATS_TTL_SECONDS`.
+    Clients can poll with `If-None-Match` and get an empty 304 while the statistics are unchanged.
+    """
+    try:
+        counts = await services.graph_stats.get()
     except Exception as e:
         logger.error(f"Error fetching Neo4j stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch Neo4j stats")
 
+    stats = Neo4jStatsResponse(
+        nodeLabels=counts["labels"],
+        relationshipTypes=counts["relationship_types"],
+        totalNodes=counts["nodes"],
+        totalRelationships=counts["relationships"],
+    )
+    etag = '"' + hashlib.sha256(stats.model_dump_json().encode()).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return stats
+
+
+@app.post("/api/neo4j/stats/refresh", status_code=202)
+async def refresh_neo4j_stats(services: Services) -> dict[str, str]:
+    """Refresh the cached graph statistics in the background (e.g. after ingestion)."""
+    services.graph_stats.refresh_in_background()
+    return {"status": "refreshing"}
 
-@app.post("/api/graphrag-query", response_model=SearchResponse)
-async def search(request: SearchRequest) -> SearchResponse:
+
+def _search_key(request: SearchRequest) -> tuple[str, int, str, bool]:
+    """Coalescing key: whitespace/case-normalized query, limit and pipeline mode."""
+    planner = settings.graphrag.planner_mode if request.planner is None else request.planner
+    return " ".join(request.query.lower().split()), request.limit, request.mode, planner
+
+
+async def _run_search(services: ServiceContainer, request: SearchRequest) -> tuple[Any, bool]:
+    """Run the pipeline, attaching to an identical in-flight search when there is one.
+
+    Only the run itself takes an admission slot; coalesced requests wait on it for free.
+    """
+
+    async def run() -> Any:
+        async with services.admission.admit():
+            return await services.run_search(request.query, limit=request.limit, planner=request.planner)
+
+    if not settings.graphrag.coalesce_requests:
+        return await run(), False
+    result, coalesced = await services.search_flights.do(_search_key(request), run)
+    if coalesced:
+        REGISTRY.inc("graphrag_coalesced_requests_total")
+        logger.info(f"Coalesced search for query='{request.query}' with an in-flight run")
+    return result, coalesced
+
+
+def _search_response(
+    services: ServiceContainer, request: SearchRequest, graphrag_result: Any, **metadata: Any
+) -> SearchResponse:
+    """Format a pipeline result, opening a result-page cursor when deeper papers exist."""
+    # Build trace from tool executions (including arguments)
+    trace = [_trace_step(t, request.trace) for t in graphrag_result.trace]
+    papers = graphrag_result.qdrant_results[: request.limit]
+
+    return SearchResponse(
+        summary=graphrag_result.summary,
+        results=_format_results(papers, request.limit),
+        trace=trace,
+        metadata={"query": request.query, **graphrag_result.metrics, **metadata},
+        next_cursor=services.pages.open(graphrag_result.retrieval, papers, request.limit),
+    )
+
+
+@app.post("/api/graphrag-query", response_model=SearchResponse, response_model_exclude_none=True)
+async def search(request: SearchRequest, services: Services) -> SearchResponse:
     """
     Run context engineering pipeline.
 
     Combines Qdrant vector search engine with Neo4j graph enrichment and fuses the results.
+    Answers 503 with `Retry-After` when every pipeline slot is busy and the wait queue is
+    full, or no slot frees up within `GRAPHRAG__QUEUE_TIMEOUT_SECONDS`.
     """
     try:
-        _load_services()
-
         # Run the async hybrid search (returns GraphRAGResult with trace)
-        graphrag_result = await _run_tools_sequence(request.query, limit=request.limit)
-
-        # Build trace from tool executions (including arguments)
-        trace = [TraceStep(name=t.name, arguments=t.arguments, result_count=t.result_count, results=t.results) for t in graphrag_result.trace]
-
-        # Format Qdrant results for frontend
-        formatted_results = []
-        for idx, result in enumerate(graphrag_result.qdrant_results[:request.limit]):
-            payload = result.get("payload", {})
-            paper = payload.get("paper", {})
-            formatted_results.append({
-                "id": paper.get("pmid") or result.get("id", f"result-{idx}"),
-                "title": paper.get("title", "Untitled"),
-                "abstract": paper.get("abstract", ""),
-                "authors": [
-                    (a.get("name", "") if isinstance(a, dict) else str(a))
-                    for a in paper.get("authors", [])
-                ],
-                "journal": paper.get("journal", ""),
-                "year": paper.get("publication_date", ""),
-                "pmid": paper.get("pmid", ""),
-                "score": result.get("score", 0),
-            })
-
-        return SearchResponse(
-            summary=graphrag_result.summary,
-            results=formatted_results,
-            trace=trace,
-            metadata={"query": request.query},
-        )
+        graphrag_result, coalesced = await _run_search(services, request)
+
+        return _search_response(services, request, graphrag_result, coalesced=coalesced)
 
+    except AdmissionRejected as e:
+        raise _overloaded(e) from e
     except Exception as e:
         logger.error(f"Search error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Search failed")
 
 
+@app.post("/api/graphrag-query/stream")
+async def search_stream(request: SearchRequest, services: Services) -> StreamingResponse:
+    """
+    Run context engineering pipeline, streaming results as server-sent events.
+
+    Events, in order: `papers` (once retrieval finishes, with `next_cursor` when deeper pages
+    exist), one `tool_result` per graph enrichment tool, `summary` deltas while the model
+    writes, then `done` with the trace.
+    An `error` event ends the stream if the pipeline fails midway.
+    """
+    slot = await _admit(services)
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for item in services.stream_search(
+                request.query, limit=request.limit, planner=request.planner
+            ):
+                if item.event == "papers":
+                    papers = item.data.results[: request.limit]
+                    data: dict[str, Any] = {"results": _format_results(papers, request.limit)}
+                    if cursor := services.pages.open(item.data.query, papers, request.limit):
+                        data["next_cursor"] = cursor
+                    yield _sse_event("papers", data)
+                elif item.event == "tool_result":
+                    step = _trace_step(item.data, request.trace)
+                    yield _sse_event("tool_result", step.model_dump(exclude_none=True))
+                elif item.event == "summary_delta":
+                    yield _sse_event("summary", {"delta": item.data})
+                elif item.event == "done":
+                    # Tool results were streamed as they arrived; don't send them twice
+                    level = request.trace or settings.graphrag.trace_level
+                    done_level: TraceLevel = "names" if level == "names" else "counts"
+                    trace = [_trace_step(t, done_level) for t in item.data.trace]
+                    yield _sse_event(
+                        "done",
+                        {
+                            "summary": item.data.summary,
+                            "trace": [t.model_dump(exclude_none=True) for t in trace],
+                            "metadata": {"query": request.query, **item.data.metrics},
+                        },
+                    )
+        except Exception as e:
+            logger.error(f"Streaming search error: {e}", exc_info=True)
+            yield _sse_event("error", {"detail": "Search failed"})
+        finally:
+            slot.release()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(slot.release),
+    )
+
+
+@app.post("/api/graphrag-query/batch")
+async def search_batch(request: BatchSearchRequest, services: Services) -> StreamingResponse:
+    """
+    Run context engineering pipeline for many queries at once.
+
+    Query embeddings and hybrid retrieval are batched across queries. Each answer is
+    written as one JSON line (`application/x-ndjson`) as soon as it completes, so lines
+    arrive out of order; use `index` to match them to `queries`. The batch takes one
+    admission slot per question it processes at once (at most `GRAPHRAG__BATCH_CONCURRENCY`).
+    """
+    concurrency = min(
+        len(request.queries), settings.graphrag.batch_concurrency, services.admission.max_concurrent
+    )
+    slots = await _admit_many(services, concurrency)
+
+    async def lines() -> AsyncIterator[str]:
+        try:
+            async for item in services.run_batch(
+                request.queries, limit=request.limit, planner=request.planner, concurrency=concurrency
+            ):
+                line: dict[str, Any] = {"index": item.index, "query": item.question}
+                if item.error is not None:
+                    logger.error(f"Batch search error for query #{item.index}: {item.error}")
+                    line["error"] = "Search failed"
+                else:
+                    result = item.result
+                    line.update(
+                        summary=result.summary,
+                        results=_format_results(result.qdrant_results, request.limit),
+                        trace=[
+                            _trace_step(t, request.trace).model_dump(exclude_none=True)
+                            for t in result.trace
+                        ],
+                        metadata={"query": item.question, **result.metrics},
+                    )
+                yield json.dumps(line, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"Batch search error: {e}", exc_info=True)
+            yield json.dumps({"error": "Batch search failed"}) + "\n"
+        finally:
+            _release_all(slots)
+
+    return StreamingResponse(
+        lines(), media_type="application/x-ndjson", background=BackgroundTask(_release_all, slots)
+    )
+
+
+@app.post(
+    "/api/graphrag-query/papers", response_model=PapersPageResponse, response_model_exclude_none=True
+)
+async def search_papers_page(request: PapersPageRequest, services: Services) -> PapersPageResponse:
+    """
+    Fetch the next page of a search's papers.
+
+    Pass the `next_cursor` of a search response (or of the previous page). The search's
+    embedded retrieval query is re-run for the deeper results, without tool selection,
+    embeddings or summarization. Cursors expire after `GRAPHRAG__PAGE_CURSOR_TTL_SECONDS`
+    (410), and paging stops at `GRAPHRAG__PAGE_MAX_DEPTH` results.
+    """
+    try:
+        page = services.pages.resolve(request.cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except ExpiredCursorError as e:
+        raise HTTPException(status_code=410, detail=str(e)) from e
+
+    limit = services.pages.page_size(page, request.limit)
+    try:
+        results = await services.fetch_page(page.query, limit, page.exclude_ids)
+    except Exception as e:
+        logger.error(f"Page fetch error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Page fetch failed") from e
+
+    return PapersPageResponse(
+        results=_format_results(results, limit),
+        next_cursor=services.pages.advance(page, results, limit),
+    )
+
+
+async def _run_search_job(
+    services: ServiceContainer, request: SearchRequest, job: Job
+) -> SearchResponse:
+    """Job body: the streaming pipeline, whose steps stop at the next await on cancellation.
+
+    The pipeline runs under an admission slot like any other search. A job is not
+    rejected when the server is busy; it waits (in the `admission` stage) and retries.
+    """
+    while True:
+        try:
+            slot = await services.admission.acquire()
+            break
+        except AdmissionRejected as e:
+            job.stage = "admission"
+            await asyncio.sleep(e.retry_after)
+    job.stage = "retrieval"
+    result = None
+    try:
+        pipeline = services.stream_search(request.query, limit=request.limit, planner=request.planner)
+        async with aclosing(pipeline) as events:
+            async for item in events:
+                if item.event == "papers":
+                    job.stage = "enrichment"
+                elif item.event == "summary_delta":
+                    job.stage = "summary"
+                elif item.event == "done":
+                    result = item.data
+    finally:
+        slot.release()
+    if result is None:
+        raise RuntimeError("The pipeline finished without a result")
+    return _search_response(services, request, result)
+
+
+def _job_response(job: Job) -> JobResponse:
+    duration_ms = None
+    if job.started_at is not None and job.finished_at is not None:
+        duration_ms = (job.finished_at - job.started_at) * 1000
+    return JobResponse(
+        job_id=job.id,
+        status=job.status,
+        stage=job.stage if not job.done else None,
+        result=job.result,
+        error="Search failed" if job.status == "failed" else None,
+        duration_ms=duration_ms,
+    )
+
+
+def _get_job(services: ServiceContainer, job_id: str) -> Job:
+    job = services.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@app.post(
+    "/api/graphrag-query/jobs",
+    status_code=202,
+    response_model=JobResponse,
+    response_model_exclude_none=True,
+)
+async def submit_search_job(
+    request: SearchRequest, response: Response, services: Services
+) -> JobResponse:
+    """
+    Submit a search to run in the background and return its job id at once.
+
+    Poll `GET /api/graphrag-query/jobs/{job_id}` for the result (kept for
+    `GRAPHRAG__JOB_TTL_SECONDS` after the job ends). `GRAPHRAG__JOB_WORKERS` jobs run at
+    a time; when `GRAPHRAG__JOB_MAX_PENDING` are already waiting, answers 503 with `Retry-After`.
+    """
+    try:
+        job = services.jobs.submit(partial(_run_search_job, services, request), request)
+    except JobQueueFull as e:
+        logger.warning(f"Rejected search job: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many queued jobs, retry later",
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+    response.headers["Location"] = f"/api/graphrag-query/jobs/{job.id}"
+    return _job_response(job)
+
+
+@app.get(
+    "/api/graphrag-query/jobs/{job_id}", response_model=JobResponse, response_model_exclude_none=True
+)
+async def get_search_job(job_id: str, services: Services) -> JobResponse:
+    """Status of a search job: queued, running (with its stage), succeeded, failed or cancelled."""
+    return _job_response(_get_job(services, job_id))
+
+
+@app.delete(
+    "/api/graphrag-query/jobs/{job_id}", response_model=JobResponse, response_model_exclude_none=True
+)
+async def cancel_search_job(job_id: str, services: Services) -> JobResponse:
+    """
+    Cancel a search job.
+
+    A queued job never starts. A running job is cancelled at once: pending LLM, embeddings
+    and Qdrant calls are aborted, and a graph query already running completes without
+    any further step. Finished jobs are left unchanged.
+    """
+    job = services.jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return _job_response(job)
+
+
 def main() -> None:
     """Run the server."""
     import os
@@ -0,0 +1,201 @@
+"""
+Long-lived services of the API server.
+
+The ServiceContainer is created in the FastAPI lifespan. It loads the GraphRAG
+pipeline, opens one Qdrant client and one Neo4j driver shared by every request,
+caches the graph schema and statistics, and closes the connections on shutdown.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from biomedical_graphrag.api.jobs import JobManager
+from biomedical_graphrag.api.pagination import PageCursors
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.utils.admission_util import AdmissionController
+from biomedical_graphrag.utils.cache_util import RefreshingCache
+from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.singleflight_util import SingleFlight
+
+if TYPE_CHECKING:
+    from biomedical_graphrag.application.services.hybrid_service.neo4j_query import Neo4jGraphQuery
+    from biomedical_graphrag.application.services.hybrid_service.tool_calling import PipelineBackends
+    from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import (
+        AsyncQdrantVectorStore,
+    )
+
+logger = setup_logging()
+
+
+def _not_loaded(*args: Any, **kwargs: Any) -> NoReturn:
+    """Placeholder for the pipeline entry points until `ServiceContainer.start` loads them."""
+    raise RuntimeError("GraphRAG services are not loaded")
+
+
+class ServiceContainer:
+    """Clients, caches and pipeline entry points shared by all requests.
+
+    `start` imports the pipeline and opens the shared clients (`loaded`), then checks
+    both databases and fills the caches (`ready`). Endpoints wait until the services are
+    loaded; the readiness probe reports `ready` and retries the warm-up while it is not.
+    """
+
+    def __init__(self) -> None:
+        self.qdrant: AsyncQdrantVectorStore | None = None
+        self.neo4j: Neo4jGraphQuery | None = None
+        self.schema: str | None = None
+        self.graph_stats: RefreshingCache[dict[str, Any]] = RefreshingCache(
+            self._read_graph_stats, ttl_seconds=settings.neo4j.stats_ttl_seconds
+        )
+        # Identical concurrent searches share one pipeline run
+        self.search_flights: SingleFlight[Any] = SingleFlight()
+        # Bounded pipeline concurrency; the overflow queues briefly, then gets a 503
+        self.admission = AdmissionController(
+            max_concurrent=settings.graphrag.max_concurrent_requests,
+            max_queued=settings.graphrag.max_queued_requests,
+            queue_timeout_seconds=settings.graphrag.queue_timeout_seconds,
+        )
+        # Retrieval sessions behind the result-page cursors
+        self.pages = PageCursors(
+            ttl_seconds=settings.graphrag.page_cursor_ttl_seconds,
+            max_entries=settings.graphrag.page_cursor_max_entries,
+            max_depth=settings.graphrag.page_max_depth,
+        )
+        # Background search jobs, for clients that cannot hold a connection open
+        self.jobs = JobManager(
+            workers=settings.graphrag.job_workers,
+            max_pending=settings.graphrag.job_max_pending,
+            ttl_seconds=settings.graphrag.job_ttl_seconds,
+        )
+
+        self.run_search: Callable[..., Awaitable[Any]] = _not_loaded
+        self.stream_search: Callable[..., AsyncGenerator[Any]] = _not_loaded
+        self.run_batch: Callable[..., AsyncIterator[Any]] = _not_loaded
+        self.fetch_page: Callable[..., Awaitable[list[dict]]] = _not_loaded
+
+        self.ready = False
+        self.error: Exception | None = None
+        self._loaded = asyncio.Event()
+        self._warm_lock = asyncio.Lock()
+        self._backends: PipelineBackends | None = None
+        self._previous_backends: tuple[Any, Any, str | None] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the pipeline and the shared clients are available."""
+        return self._loaded.is_set() and self.run_search is not _not_loaded
+
+    async def start(self) -> None:
+        """Load the pipeline and open the shared clients, then warm them up."""
+        try:
+            await asyncio.to_thread(self._load)
+        except Exception as e:
+            logger.error(f"Failed to load GraphRAG services: {e}", exc_info=True)
+            self.error = e
+            return
+        finally:
+            self._loaded.set()
+        await self.ensure_ready()
+
+    async def wait_loaded(self) -> None:
+        """Wait until `start` has loaded the services.
+
+        Raises:
+            RuntimeError: If loading failed.
+        """
+        await self._loaded.wait()
+        if not self.loaded:
+            raise RuntimeError(f"GraphRAG services failed to load: {self.error}")
+
+    async def ensure_ready(self) -> bool:
+        """Warm the services up unless they already are.
+
+        Checks that Neo4j and the Qdrant collection answer, caches the graph schema and
+        loads the graph statistics. Concurrent calls share one attempt.
+
+        Returns:
+            Whether the services are ready.
+        """
+        if self.ready or not self.loaded:
+            return self.ready
+        async with self._warm_lock:
+            if self.ready:
+                return True
+            try:
+                await self._warm()
+            except Exception as e:
+                logger.warning(f"GraphRAG services not ready: {e}")
+                self.error = e
+                return False
+            self.ready = True
+            self.error = None
+            logger.info("GraphRAG services ready")
+        return True
+
+    async def close(self) -> None:
+        """Close the shared connections and hand the pipeline back its per-request clients."""
+        self.ready = False
+        await self.jobs.close()
+        if self._backends is not None and self._previous_backends is not None:
+            self._backends.qdrant, self._backends.neo4j, self._backends.schema = self._previous_backends
+            self._previous_backends = None
+        if self.qdrant is not None:
+            with suppress(Exception):
+                await self.qdrant.close()
+            with suppress(Exception):
+                await self.qdrant.openai_client.close()
+            self.qdrant = None
+        if self.neo4j is not None:
+            with suppress(Exception):
+                await asyncio.to_thread(self.neo4j.close)
+            self.neo4j = None
+        logger.info("GraphRAG services closed")
+
+    def _load(self) -> None:
+        """Import the pipeline and point it at the shared clients (runs in a worker thread)."""
+        logger.info("Loading GraphRAG services...")
+        from biomedical_graphrag.application.services.hybrid_service.batch_pipeline import (
+            run_batch_tools_sequence_and_summarize,
+        )
+        from biomedical_graphrag.application.services.hybrid_service.neo4j_query import Neo4jGraphQuery
+        from biomedical_graphrag.application.services.hybrid_service.qdrant_query import AsyncQdrantQuery
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+            backends,
+            fetch_papers_page,
+            run_tools_sequence_and_summarize,
+            stream_tools_sequence_and_summarize,
+        )
+        from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import (
+            AsyncQdrantVectorStore,
+        )
+
+        self.qdrant = AsyncQdrantVectorStore()
+        self.neo4j = Neo4jGraphQuery()
+        qdrant, driver = self.qdrant, self.neo4j.driver
+
+        # Per-request query objects borrow the shared connections; their close() leaves them open
+        self._backends = backends
+        self._previous_backends = (backends.qdrant, backends.neo4j, backends.schema)
+        backends.qdrant = lambda: AsyncQdrantQuery(qdrant)
+        backends.neo4j = lambda: Neo4jGraphQuery(driver)
+
+        self.run_search = run_tools_sequence_and_summarize
+        self.stream_search = stream_tools_sequence_and_summarize
+        self.run_batch = run_batch_tools_sequence_and_summarize
+        self.fetch_page = fetch_papers_page
+        logger.info("GraphRAG services loaded successfully")
+
+    async def _warm(self) -> None:
+        assert self.qdrant is not None and self.neo4j is not None and self._backends is not None
+        await asyncio.to_thread(self.neo4j.driver.verify_connectivity)
+        await self.qdrant.client.get_collection(self.qdrant.collection_name)
+        self.schema = await asyncio.to_thread(self.neo4j.get_schema)
+        self._backends.schema = self.schema
+        await self.graph_stats.refresh()
+
+    async def _read_graph_stats(self) -> dict[str, Any]:
+        await self.wait_loaded()
+        assert self.neo4j is not None
+        return await asyncio.to_thread(self.neo4j.get_graph_stats)
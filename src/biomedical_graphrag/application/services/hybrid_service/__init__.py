@@ -1,7 +1,14 @@
 """Hybrid service for combining Qdrant and Neo4j queries."""
 
+from .batch_pipeline import run_batch_tools_sequence_and_summarize
 from .neo4j_query import Neo4jGraphQuery
 from .qdrant_query import AsyncQdrantQuery
-from .tool_calling import run_tools_sequence_and_summarize
+from .tool_calling import run_tools_sequence_and_summarize, stream_tools_sequence_and_summarize
 
-__all__ = ["run_tools_sequence_and_summarize", "Neo4jGraphQuery", "AsyncQdrantQuery"]
+__all__ = [
+    "run_tools_sequence_and_summarize",
+    "stream_tools_sequence_and_summarize",
+    "run_batch_tools_sequence_and_summarize",
+    "Neo4jGraphQuery",
+    "AsyncQdrantQuery",
+]
@@ -0,0 +1,117 @@
+"""
+Semantic answer cache for the GraphRAG pipeline.
+
+Past questions are kept as small (MRL-truncated) normalized embeddings; a new
+question whose embedding is close enough to a cached one reuses that answer.
+The index is a plain list scanned per lookup, which is fast at the few hundred
+entries the cache is meant to hold.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+@dataclass
+class _Entry:
+    question: str
+    vector: list[float]
+    key: Hashable
+    value: Any
+    expires_at: float
+
+
+class SemanticAnswerCache:
+    """Answers keyed by question similarity, with TTL and LRU eviction.
+
+    Args:
+        threshold: Minimum cosine similarity for a hit.
+        ttl_seconds: Lifetime of an entry.
+        max_entries: Entries kept before the least recently used one is evicted.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._ids = count()
+        self._version: Hashable | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, vector: Sequence[float], key: Hashable) -> tuple[Any, float] | None:
+        """Return the closest cached answer for the same `key`, if similar enough.
+
+        Args:
+            vector: Embedding of the new question.
+            key: Exact-match part of the lookup (e.g. result limit and pipeline mode).
+
+        Returns:
+            The cached value and its similarity, or None on a miss.
+        """
+        now = self._clock()
+        query = _normalize(vector)
+        best_id, best_score = None, self.threshold
+        for entry_id, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[entry_id]
+                continue
+            if entry.key != key or len(entry.vector) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(query, entry.vector, strict=True))
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+        if best_id is None:
+            return None
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id].value, best_score
+
+    def put(self, question: str, vector: Sequence[float], key: Hashable, value: Any) -> None:
+        """Cache an answer, evicting the least recently used entry when full."""
+        entry = _Entry(
+            question=question,
+            vector=_normalize(vector),
+            key=key,
+            value=value,
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        self._entries[next(self._ids)] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set_version(self, version: Hashable) -> bool:
+        """Record the current data version; clear the cache if it changed.
+
+        Returns:
+            True if cached answers were dropped.
+        """
+        changed = self._version is not None and version != self._version
+        self._version = version
+        if changed:
+            self.clear()
+        return changed
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        self._entries.clear()
@@ -0,0 +1,220 @@
+"""
+Batched GraphRAG pipeline for many questions at once.
+
+Tool selection runs per question with bounded concurrency. All hybrid retrievals
+then share one embeddings call and one Qdrant `query_batch_points` request.
+Enrichment and summaries fan out again, and results are yielded as each question
+completes.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from biomedical_graphrag.application.services.hybrid_service.planner import QueryPlan, ToolCall
+from biomedical_graphrag.application.services.hybrid_service.prompts.context_builder import (
+    build_fusion_context,
+)
+from biomedical_graphrag.application.services.hybrid_service.qdrant_query import AsyncQdrantQuery
+from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+    GraphRAGResult,
+    QdrantSearchResult,
+    ToolExecution,
+    _execute_qdrant_tool,
+    backends,
+    plan_tools,
+    route_qdrant_tool,
+    run_graph_enrichment,
+    run_planned_graph_enrichment,
+    summarize_fused_results_async,
+)
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import RequestMetrics, record_request
+
+logger = setup_logging()
+
+BATCHED_TOOL = "retrieve_papers_hybrid"
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome for one question of a batch; exactly one of `result` and `error` is set."""
+
+    index: int
+    question: str
+    result: GraphRAGResult | None = None
+    error: Exception | None = None
+
+
+@dataclass
+class _Selection:
+    call: ToolCall | None
+    plan: QueryPlan | None
+    trace: list[ToolExecution]
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+async def _select(question: str, planner: bool) -> _Selection:
+    """Phase 1a: choose the retrieval tool (and in planner mode, the graph tools)."""
+    if not planner:
+        return _Selection(call=await route_qdrant_tool(question), plan=None, trace=[])
+    start = time.perf_counter()
+    plan = await plan_tools(question)
+    planned = [{"name": c.name, "arguments": c.arguments} for c in plan.graph]
+    step = ToolExecution(name="plan", arguments={"graph_tools": planned}, duration_ms=_elapsed_ms(start))
+    return _Selection(call=plan.retrieval, plan=plan, trace=[step])
+
+
+async def _retrieve(
+    qdrant: AsyncQdrantQuery,
+    questions: list[str],
+    selections: dict[int, _Selection],
+    limit: int,
+    semaphore: asyncio.Semaphore,
+) -> dict[int, QdrantSearchResult | Exception]:
+    """Phase 1b: batch every hybrid retrieval, run the other retrieval tools one by one."""
+    retrieved: dict[int, QdrantSearchResult | Exception] = {}
+    batched_calls = {
+        i: s.call for i, s in selections.items() if s.call is not None and s.call.name == BATCHED_TOOL
+    }
+    batched = list(batched_calls)
+
+    if batched:
+        queries = [batched_calls[i].arguments.get("query") or questions[i] for i in batched]
+        start = time.perf_counter()
+        batch_results: list[list[dict] | Exception]
+        try:
+            batch_results = list(await qdrant.retrieve_papers_hybrid_batch(queries, top_k=limit))
+        except Exception as e:
+            logger.error(f"Batched hybrid retrieval failed: {e}", exc_info=True)
+            batch_results = [e] * len(batched)
+        duration_ms = _elapsed_ms(start)
+        for i, query, results in zip(batched, queries, batch_results, strict=True):
+            if isinstance(results, Exception):
+                retrieved[i] = results
+                continue
+            tool = ToolExecution(
+                name=BATCHED_TOOL,
+                arguments={"query": query, "top_k": limit},
+                result_count=len(results),
+                results=results,
+                duration_ms=duration_ms,
+            )
+            retrieved[i] = QdrantSearchResult(results=results, tool=tool)
+
+    async def run_single(i: int, call: ToolCall | None) -> None:
+        # Same whitelist and prepare/run path as the single-question pipeline
+        async with semaphore:
+            try:
+                retrieved[i] = await _execute_qdrant_tool(qdrant, call, limit)
+            except Exception as e:
+                retrieved[i] = e
+
+    await asyncio.gather(
+        *(run_single(i, s.call) for i, s in selections.items() if i not in batched_calls)
+    )
+    return retrieved
+
+
+async def run_batch_tools_sequence_and_summarize(
+    questions: list[str],
+    limit: int = 5,
+    planner: bool | None = None,
+    concurrency: int | None = None,
+) -> AsyncIterator[BatchItemResult]:
+    """Answer many questions, sharing embedding and retrieval round trips between them.
+
+    Args:
+        questions: The user questions.
+        limit: Maximum number of papers to retrieve per question.
+        planner: Plan retrieval and graph tools in a single LLM call.
+            Defaults to `settings.graphrag.planner_mode`.
+        concurrency: Questions processed at once in the per-question phases.
+            Defaults to `settings.graphrag.batch_concurrency`.
+
+    Yields:
+        One BatchItemResult per question, in completion order. The batch's shared
+        retrieval phases are reported under `batch_retrieval` in each result's metrics.
+    """
+    if planner is None:
+        planner = settings.graphrag.planner_mode
+    semaphore = asyncio.Semaphore(concurrency or settings.graphrag.batch_concurrency)
+    metrics = [RequestMetrics() for _ in questions]
+
+    qdrant = backends.qdrant()
+    neo4j = backends.neo4j()
+    try:
+        # Phase 1a: tool selection, one LLM call per question
+        async def select(i: int) -> _Selection | Exception:
+            async with semaphore:
+                with record_request(metrics[i]):
+                    try:
+                        return await _select(questions[i], planner)
+                    except Exception as e:
+                        return e
+
+        selected = await asyncio.gather(*(select(i) for i in range(len(questions))))
+        selections: dict[int, _Selection] = {}
+        for i, selection in enumerate(selected):
+            if isinstance(selection, Exception):
+                yield BatchItemResult(index=i, question=questions[i], error=selection)
+            else:
+                selections[i] = selection
+
+        # Phase 1b: retrieval, batched across questions
+        with record_request() as shared_metrics:
+            retrieved = await _retrieve(qdrant, questions, selections, limit, semaphore)
+        # Shared by the whole batch: reported alongside each answer, not added to its own
+        # phases and usage, so summing per-question usage counts these tokens once
+        shared = shared_metrics.summary()
+
+        # Phases 2 and 3 per question, yielded as they finish
+        async def finish(i: int, qdrant_result: QdrantSearchResult) -> BatchItemResult:
+            selection = selections[i]
+            async with semaphore:
+                with record_request(metrics[i]):
+                    try:
+                        papers = qdrant_result.results
+                        if selection.plan is not None:
+                            neo4j_result = await asyncio.to_thread(
+                                run_planned_graph_enrichment, selection.plan, papers, neo4j
+                            )
+                        else:
+                            neo4j_result = await asyncio.to_thread(
+                                run_graph_enrichment, questions[i], papers, neo4j
+                            )
+                        context = build_fusion_context(qdrant_result.results, neo4j_result.results)
+                        start = time.perf_counter()
+                        summary = await summarize_fused_results_async(questions[i], context, limit=limit)
+                        summarize = ToolExecution(name="summarize", duration_ms=_elapsed_ms(start))
+                    except Exception as e:
+                        return BatchItemResult(index=i, question=questions[i], error=e)
+            result = GraphRAGResult(
+                summary=summary,
+                qdrant_results=qdrant_result.results,
+                neo4j_results=neo4j_result.results,
+                trace=[*selection.trace, qdrant_result.tool, *neo4j_result.tools, summarize],
+                metrics={**context.stats(), **metrics[i].summary(), "batch_retrieval": shared},
+            )
+            return BatchItemResult(index=i, question=questions[i], result=result)
+
+        tasks = []
+        for i, item in retrieved.items():
+            if isinstance(item, Exception):
+                yield BatchItemResult(index=i, question=questions[i], error=item)
+            else:
+                tasks.append(asyncio.ensure_future(finish(i, item)))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    finally:
+        await qdrant.close()
+        neo4j.close()
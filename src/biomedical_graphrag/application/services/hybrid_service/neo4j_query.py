@@ -1,6 +1,6 @@
 from typing import Any
 
-from neo4j import GraphDatabase
+from neo4j import Driver, GraphDatabase
 
 from biomedical_graphrag.config import settings
 from biomedical_graphrag.utils.logger_util import setup_logging
@@ -14,15 +14,23 @@ class Neo4jGraphQuery:
     All query templates are static methods in this class.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, driver: Driver | None = None) -> None:
+        """
+        Initialize the Neo4j query client.
+
+        Args:
+            driver: Shared driver (left open by `close`); a new one is created from settings if omitted.
+        """
         self.uri = settings.neo4j.uri
         self.username = settings.neo4j.username
         self.password = settings.neo4j.password.get_secret_value()
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        self._owns_driver = driver is None
+        self.driver = driver or GraphDatabase.driver(self.uri, auth=(self.username, self.password))
 
     def close(self) -> None:
-        """Close the Neo4j driver and release underlying connections."""
-        self.driver.close()
+        """Close the Neo4j driver and release underlying connections, if this query created it."""
+        if self._owns_driver:
+            self.driver.close()
 
     def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
@@ -56,6 +64,96 @@ class Neo4jGraphQuery:
         - (Gene)-[:MENTIONED_IN]->(Paper)
         """
 
+    def get_graph_counts(self) -> dict[str, int]:
+        """
+        Get total node and relationship counts.
+        Both counts are answered from Neo4j's count store, without scanning the graph.
+        """
+        records = self.query(
+            """
+            CALL { MATCH (n) RETURN count(n) AS nodes }
+            CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+            RETURN nodes, relationships
+            """
+        )
+        if not records:
+            return {"nodes": 0, "relationships": 0}
+        return {"nodes": records[0]["nodes"], "relationships": records[0]["relationships"]}
+
+    def get_graph_stats(self) -> dict[str, Any]:
+        """
+        Get node counts per label, relationship counts per type, and totals.
+        Every count is a single-label or single-type pattern answered from Neo4j's count store,
+        so the cost does not grow with the graph.
+        """
+        names = self.query(
+            """
+            CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+            CALL {
+                CALL db.relationshipTypes() YIELD relationshipType
+                RETURN collect(relationshipType) AS types
+            }
+            RETURN labels, types
+            """
+        )
+        labels = names[0]["labels"] if names else []
+        types = names[0]["types"] if names else []
+
+        def quoted(name: str) -> str:
+            return "`" + name.replace("`", "``") + "`"
+
+        # Labels and types cannot be parameters, so each count is its own UNION branch.
+        # The count is aggregated without grouping keys so the planner reads it from the count store.
+        patterns = [
+            ("(n)", "n", "total", "''"),
+            ("()-[r]->()", "r", "total_rel", "''"),
+            *((f"(n:{quoted(label)})", "n", "label", f"$labels[{i}]") for i, label in enumerate(labels)),
+            *((f"()-[r:{quoted(t)}]->()", "r", "type", f"$types[{i}]") for i, t in enumerate(types)),
+        ]
+        branches = [
+            f"MATCH {pattern} WITH count({var}) AS count RETURN '{kind}' AS kind, {name} AS name, count"
+            for pattern, var, kind, name in patterns
+        ]
+        records = self.query("\nUNION ALL\n".join(branches), {"labels": labels, "types": types})
+
+        stats: dict[str, Any] = {"labels": [], "relationship_types": [], "nodes": 0, "relationships": 0}
+        for record in records:
+            if record["kind"] == "total":
+                stats["nodes"] = record["count"]
+            elif record["kind"] == "total_rel":
+                stats["relationships"] = record["count"]
+            elif record["kind"] == "label":
+                stats["labels"].append({"label": record["name"], "count": record["count"]})
+            else:
+                stats["relationship_types"].append({"type": record["name"], "count": record["count"]})
+        stats["labels"].sort(key=lambda r: r["count"], reverse=True)
+        stats["relationship_types"].sort(key=lambda r: r["count"], reverse=True)
+        return stats
+
+    def score_authors(self, authors: list[str], mesh_terms: list[str]) -> list[dict[str, Any]]:
+        """
+        Count each author's papers, restricted to papers on the given MeSH topics if any.
+        Returns [{author, papers}] sorted by count; only the first 30 authors and 5 topics are used.
+        """
+        if mesh_terms:
+            cypher = """
+                UNWIND $names AS name
+                MATCH (a:Author)-[:WROTE]->(p:Paper)-[:HAS_MESH_TERM]->(m:MeshTerm)
+                WHERE a.name = name
+                  AND ANY(topic IN $topics WHERE toLower(m.term) CONTAINS toLower(topic))
+                RETURN a.name AS author, COUNT(DISTINCT p) AS papers
+                ORDER BY papers DESC
+            """
+            return self.query(cypher, {"names": authors[:30], "topics": mesh_terms[:5]})
+        cypher = """
+            UNWIND $names AS name
+            MATCH (a:Author)-[:WROTE]->(p:Paper)
+            WHERE a.name = name
+            RETURN a.name AS author, COUNT(p) AS papers
+            ORDER BY papers DESC
+        """
+        return self.query(cypher, {"names": authors[:30]})
+
     def get_collaborators_with_topics(
         self, author_name: str, topics: list[str], require_all: bool = False,
         exclude_pmids: list[str] | None = None,
@@ -0,0 +1,125 @@
+"""
+Single-call query planning for the GraphRAG pipeline.
+
+The planner asks the model for the retrieval tool and the graph tools in one
+round trip. Graph tool arguments that depend on the (not yet known) retrieved
+papers are expressed with placeholders that are bound once retrieval returns.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from biomedical_graphrag.application.services.hybrid_service.tools.enrichment_tools import (
+    NEO4J_ENRICHMENT_TOOLS,
+)
+from biomedical_graphrag.application.services.hybrid_service.tools.qdrant_tools import (
+    QDRANT_TOOLS,
+)
+
+PLANNER_TOOLS = [*QDRANT_TOOLS, *NEO4J_ENRICHMENT_TOOLS]
+
+QDRANT_TOOL_NAMES = frozenset(tool["name"] for tool in QDRANT_TOOLS)
+NEO4J_TOOL_NAMES = frozenset(tool["name"] for tool in NEO4J_ENRICHMENT_TOOLS)
+
+TOP_AUTHOR = "$top_author"
+TOP_PMID = "$top_pmid"
+TOP_GENE = "$top_gene"
+MESH_TERMS = "$mesh_terms"
+PLACEHOLDERS = frozenset({TOP_AUTHOR, TOP_PMID, TOP_GENE, MESH_TERMS})
+
+
+class UnresolvedPlaceholderError(ValueError):
+    """Raised when a planned argument references a placeholder with no value."""
+
+
+@dataclass
+class ToolCall:
+    """A tool call requested by the model."""
+
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class QueryPlan:
+    """Retrieval tool plus the templated graph tools to run after it."""
+
+    retrieval: ToolCall | None
+    graph: list[ToolCall] = field(default_factory=list)
+
+
+def split_plan(calls: list[ToolCall]) -> QueryPlan:
+    """Split the planner's tool calls into the retrieval call and the graph calls.
+
+    Only the first retrieval call is kept; unknown tool names are dropped.
+    """
+    retrieval: ToolCall | None = None
+    graph: list[ToolCall] = []
+    for call in calls:
+        if call.name in QDRANT_TOOL_NAMES:
+            if retrieval is None:
+                retrieval = call
+        elif call.name in NEO4J_TOOL_NAMES:
+            graph.append(call)
+    return QueryPlan(retrieval=retrieval, graph=graph)
+
+
+def build_bindings(ctx: dict[str, list[str]], scored_authors: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build placeholder values from the retrieved context.
+
+    Args:
+        ctx: Entities extracted from the retrieved papers (pmids, authors, mesh_terms, genes).
+        scored_authors: Authors ranked by topic-relevant paper count.
+
+    Returns:
+        Mapping of placeholder to value; placeholders without a value are omitted.
+    """
+    bindings: dict[str, Any] = {}
+    if scored_authors:
+        bindings[TOP_AUTHOR] = scored_authors[0]["author"]
+    elif ctx["authors"]:
+        bindings[TOP_AUTHOR] = ctx["authors"][0]
+    if ctx["pmids"]:
+        bindings[TOP_PMID] = ctx["pmids"][0]
+    if ctx["genes"]:
+        bindings[TOP_GENE] = ctx["genes"][0]
+    if ctx["mesh_terms"]:
+        bindings[MESH_TERMS] = ctx["mesh_terms"][:5]
+    return bindings
+
+
+def _is_placeholder(value: Any) -> bool:
+    return isinstance(value, str) and value in PLACEHOLDERS
+
+
+def _resolve_value(value: Any, bindings: dict[str, Any]) -> Any:
+    if _is_placeholder(value):
+        if value not in bindings:
+            raise UnresolvedPlaceholderError(value)
+        return bindings[value]
+    if isinstance(value, list):
+        resolved: list[Any] = []
+        for item in value:
+            item_value = _resolve_value(item, bindings)
+            if _is_placeholder(item) and isinstance(item_value, list):
+                resolved.extend(item_value)
+            else:
+                resolved.append(item_value)
+        try:
+            return list(dict.fromkeys(resolved))
+        except TypeError:
+            return resolved  # e.g. a list of objects: nothing to dedupe by
+    return value
+
+
+def resolve_arguments(arguments: dict[str, Any], bindings: dict[str, Any]) -> dict[str, Any]:
+    """Substitute placeholders in planned tool arguments.
+
+    Only the declared placeholders (`$top_author`, `$top_pmid`, `$top_gene`, `$mesh_terms`)
+    are substituted; other strings, `$`-prefixed or not, are literals. A placeholder used
+    as a list element expands into the bound list, and lists of hashable values are deduplicated.
+
+    Raises:
+        UnresolvedPlaceholderError: If a placeholder has no bound value.
+    """
+    return {key: _resolve_value(value, bindings) for key, value in arguments.items()}
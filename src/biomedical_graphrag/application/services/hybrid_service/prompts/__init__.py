@@ -3,8 +3,10 @@
 This package exports the prompt templates/helpers used by the hybrid service.
 """
 
+from .context_builder import FusionContext, build_fusion_context
 from .hybrid_prompts import (
     NEO4J_PROMPT,
+    PLANNER_PROMPT,
     QDRANT_PROMPT,
     fusion_summary_prompt,
 )
@@ -12,5 +14,8 @@ from .hybrid_prompts import (
 __all__ = [
     "QDRANT_PROMPT",
     "NEO4J_PROMPT",
+    "PLANNER_PROMPT",
     "fusion_summary_prompt",
+    "FusionContext",
+    "build_fusion_context",
 ]
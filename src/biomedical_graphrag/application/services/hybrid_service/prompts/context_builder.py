@@ -0,0 +1,168 @@
+"""Token-budgeted context construction for the fusion summary prompt."""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from biomedical_graphrag.config import settings
+
+# Rough chars-per-token ratio for English biomedical text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+MAX_AUTHORS = 5
+MAX_MESH_TERMS = 10
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a tokenizer."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _compact_json(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _indented_json_chars(data: Any, depth: int = 0) -> int:
+    """Length of `json.dumps(data, indent=2)`, computed without building the string.
+
+    Escapes are not counted, so this slightly underestimates text with quotes or newlines.
+    """
+    if isinstance(data, str):
+        return len(data) + 2
+    if data is None or isinstance(data, bool | int | float):
+        return len(json.dumps(data))
+    if isinstance(data, dict):
+        items = [
+            _indented_json_chars(str(k)) + 2 + _indented_json_chars(v, depth + 1)
+            for k, v in data.items()
+        ]
+    elif isinstance(data, list | tuple):
+        items = [_indented_json_chars(v, depth + 1) for v in data]
+    else:
+        return len(str(data)) + 2
+    if not items:
+        return 2
+    item_lines = len(items) * (1 + 2 * (depth + 1))  # newline and indent before each item
+    closing_line = 1 + 2 * depth
+    return 2 + sum(items) + item_lines + (len(items) - 1) + closing_line  # brackets and commas
+
+
+def _compact_paper(point: dict) -> dict[str, Any]:
+    """Keep only the paper fields the summary uses (no affiliations, DOI or MeSH qualifiers)."""
+    payload = point.get("payload") or {}
+    paper = payload.get("paper") or {}
+    authors = [a.get("name", "") if isinstance(a, dict) else str(a) for a in paper.get("authors", [])]
+    mesh_terms = [m for m in paper.get("mesh_terms", []) if isinstance(m, dict)]
+    # Major topics first, they carry most of the paper's subject
+    mesh_terms.sort(key=lambda m: not m.get("major_topic", False))
+    compact: dict[str, Any] = {
+        "pmid": paper.get("pmid", ""),
+        "title": paper.get("title", ""),
+        "journal": paper.get("journal", ""),
+        "date": paper.get("publication_date", ""),
+        "authors": authors[:MAX_AUTHORS] + (["et al."] if len(authors) > MAX_AUTHORS else []),
+        "mesh_terms": [m.get("term", "") for m in mesh_terms[:MAX_MESH_TERMS]],
+    }
+    genes = [g.get("name", "") if isinstance(g, dict) else str(g) for g in payload.get("genes", [])]
+    if genes:
+        compact["genes"] = genes
+    return compact
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens, on a word boundary."""
+    if max_tokens <= 0:
+        return ""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return f"{cut}…"
+
+
+def _allocate_abstract_tokens(needed: list[int], available: int, floor: int) -> list[int]:
+    """Split the abstract token budget across papers in rank order.
+
+    Every paper is first guaranteed `floor` tokens (or its full abstract if shorter),
+    then the remainder goes to the highest-ranked papers first, so lower-ranked
+    abstracts are the first to be truncated.
+    """
+    allocation = [0] * len(needed)
+    for i, need in enumerate(needed):
+        share = min(need, floor, max(available, 0))
+        allocation[i] = share
+        available -= share
+    for i, need in enumerate(needed):
+        extra = min(need - allocation[i], max(available, 0))
+        allocation[i] += extra
+        available -= extra
+    return allocation
+
+
+@dataclass
+class FusionContext:
+    """Serialized evidence for the fusion summary prompt and its token accounting."""
+
+    qdrant_context: str
+    neo4j_context: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated prompt tokens saved versus the indented full-payload serialization."""
+        return max(self.tokens_before - self.tokens_after, 0)
+
+    def stats(self) -> dict[str, int]:
+        """Token accounting reported in per-request metrics."""
+        return {"context_tokens": self.tokens_after, "context_tokens_saved": self.tokens_saved}
+
+
+def build_fusion_context(
+    qdrant_results: list[dict],
+    neo4j_results: dict[str, Any],
+    token_budget: int | None = None,
+    min_abstract_tokens: int | None = None,
+) -> FusionContext:
+    """Build a compact, token-budgeted context for the fusion summary.
+
+    Args:
+        qdrant_results: Qdrant points in rank order.
+        neo4j_results: Neo4j tool results keyed by tool name.
+        token_budget: Token budget for both contexts. Defaults to settings.
+        min_abstract_tokens: Tokens each abstract keeps before higher-ranked papers
+            get more. Defaults to settings.
+
+    Returns:
+        FusionContext with both serialized contexts and the tokens saved.
+    """
+    if token_budget is None:
+        token_budget = settings.graphrag.context_token_budget
+    if min_abstract_tokens is None:
+        min_abstract_tokens = settings.graphrag.context_min_abstract_tokens
+
+    papers = [_compact_paper(point) for point in qdrant_results]
+    abstracts = [
+        ((point.get("payload") or {}).get("paper") or {}).get("abstract", "") for point in qdrant_results
+    ]
+    neo4j_context = _compact_json(neo4j_results)
+
+    fixed_tokens = estimate_tokens(_compact_json(papers)) + estimate_tokens(neo4j_context)
+    abstract_tokens = [estimate_tokens(a) for a in abstracts]
+    allocation = _allocate_abstract_tokens(
+        abstract_tokens, token_budget - fixed_tokens, min_abstract_tokens
+    )
+    for paper, abstract, max_tokens in zip(papers, abstracts, allocation, strict=True):
+        paper["abstract"] = _truncate(abstract, max_tokens)
+
+    qdrant_context = _compact_json(papers)
+    full_papers = [((point.get("payload") or {}).get("paper") or {}) for point in qdrant_results]
+    # Sized rather than serialized: the indented full payloads are only needed for their length
+    tokens_before = (
+        _indented_json_chars(full_papers) + _indented_json_chars(neo4j_results) + CHARS_PER_TOKEN - 1
+    ) // CHARS_PER_TOKEN
+    return FusionContext(
+        qdrant_context=qdrant_context,
+        neo4j_context=neo4j_context,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(qdrant_context) + estimate_tokens(neo4j_context),
+    )
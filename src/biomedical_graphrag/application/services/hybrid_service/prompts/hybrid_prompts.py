@@ -1,7 +1,6 @@
 """Prompt templates for context engineering."""
 
 import json
-from typing import Any
 
 QDRANT_PROMPT = """
 You are a biomedical query router for PubMed papers retrieval.
@@ -58,6 +57,35 @@ Extracted Entities from Retrieved Papers:
 - Genes: {genes}
 """
 
+PLANNER_PROMPT = """
+You are a biomedical query planner for a GraphRAG pipeline over PubMed papers.
+Plan the whole retrieval in ONE step. Do NOT generate any text.
+
+Call exactly one retrieval tool:
+- `retrieve_papers_hybrid` for similarity search (a combination of semantic and lexical).
+- `recommend_papers_based_on_constraints` if the user provides COUNTER-examples
+  ('excluding', 'but not about', 'not like', 'shouldn't be about').
+Build its arguments from the user input only. Preserve meaning. Do not add new topics.
+
+Then call at least one Neo4j enrichment tool. The retrieved papers are NOT known yet, so
+fill arguments that depend on them with these placeholders (exact strings):
+- `$top_author`: the retrieved author with the most papers on the retrieved topics.
+- `$top_pmid`: the PMID of the best retrieved paper.
+- `$top_gene`: the most relevant gene mentioned in the retrieved papers.
+- `$mesh_terms`: the MeSH terms of the retrieved papers (use as a single list element).
+
+Rules:
+- If the user names a gene, author or PMID explicitly, use that literal value instead of a placeholder.
+- For get_collaborators_with_topics: set require_all=false unless the user asks for ALL topics.
+- The exclude_pmids parameter is auto-filled. Do NOT set it.
+
+Neo4j Graph Schema:
+{schema}
+
+User Question:
+{question}
+"""
+
 FUSION_SUMMARY_PROMPT = """
 You are a biomedical research assistant combining two data sources:
 
@@ -110,15 +138,13 @@ def _format_qdrant_points(qdrant_points_metadata: list[dict]) -> str:
         return str(qdrant_points_metadata)
 
 
-def fusion_summary_prompt(
-    question: str, qdrant_results: list[dict], neo4j_results: dict[str, Any], limit: int = 5
-) -> str:
+def fusion_summary_prompt(question: str, qdrant_context: str, neo4j_context: str, limit: int = 5) -> str:
     """Generate the fusion summary prompt.
 
     Args:
         question: The user question.
-        qdrant_results: The Qdrant tool results / points metadata.
-        neo4j_results: The Neo4j results.
+        qdrant_context: Serialized retrieved papers (see `build_fusion_context`).
+        neo4j_context: Serialized Neo4j results.
         limit: Number of papers retrieved (controls Key Findings count).
 
     Returns:
@@ -126,7 +152,7 @@ def fusion_summary_prompt(
     """
     return FUSION_SUMMARY_PROMPT.format(
         question=question,
-        qdrant_context=_format_qdrant_points(qdrant_results),
-        neo4j_results=json.dumps(neo4j_results, indent=2),
+        qdrant_context=qdrant_context,
+        neo4j_results=neo4j_context,
         limit=limit,
     )
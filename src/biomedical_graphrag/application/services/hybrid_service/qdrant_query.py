@@ -1,23 +1,133 @@
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
 from qdrant_client.models import models
 
 from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import AsyncQdrantVectorStore
 from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import phase
 
 logger = setup_logging()
 
+RETRIEVAL_TOOLS = (
+    "retrieve_papers_dense",
+    "retrieve_papers_hybrid",
+    "recommend_papers_based_on_constraints",
+)
+
+
+def _to_results(points: list[models.ScoredPoint]) -> list[dict]:
+    """Convert scored points to the result dictionaries used by the pipeline."""
+    return [{"id": point.id, "score": point.score, "payload": point.payload} for point in points]
+
+
+@dataclass
+class RetrievalQuery:
+    """A retrieval tool call with its query vectors already embedded.
+
+    Kept after a search so deeper result pages re-run the same Qdrant request
+    without another tool-selection or embeddings call.
+    """
+
+    tool: str
+    request: models.QueryRequest
+
+    def page(
+        self, limit: int, exclude_ids: Sequence[models.ExtendedPointId] = ()
+    ) -> models.QueryRequest:
+        """
+        The request for the next `limit` results after the ones already served.
+
+        Served points are filtered out rather than skipped with an offset: the prefetch
+        limits grow with the depth, and reranking a larger candidate pool may reorder it.
+
+        Args:
+            limit: Page size.
+            exclude_ids: Ids of the points already served.
+        Returns:
+            The Qdrant request for the page.
+        """
+        depth = len(exclude_ids) + limit
+        prefetch = self.request.prefetch
+        if isinstance(prefetch, list):
+            prefetch = [p.model_copy(update={"limit": max(p.limit or 0, depth)}) for p in prefetch]
+        query_filter = self.request.filter
+        if exclude_ids:
+            query_filter = models.Filter(
+                must=[query_filter] if query_filter is not None else None,
+                must_not=[models.HasIdCondition(has_id=list(exclude_ids))],
+            )
+        return self.request.model_copy(
+            update={"prefetch": prefetch, "filter": query_filter, "limit": limit}
+        )
+
 
 class AsyncQdrantQuery:
     """Handles querying Qdrant vector search engine for natural language questions (async)."""
 
-    def __init__(self) -> None:
+    def __init__(self, qdrant_client: AsyncQdrantVectorStore | None = None) -> None:
         """
         Initialize the async Qdrant client with connection parameters.
+
+        Args:
+            qdrant_client: Shared vector store to query (left open by `close`); a new one
+                is created from settings if omitted.
         """
-        self.qdrant_client = AsyncQdrantVectorStore()
+        self._owns_client = qdrant_client is None
+        self.qdrant_client = qdrant_client or AsyncQdrantVectorStore()
 
     async def close(self) -> None:
-        """Close the async Qdrant client."""
-        await self.qdrant_client.close()
+        """Close the async Qdrant client if this query created it."""
+        if self._owns_client:
+            await self.qdrant_client.close()
+
+    async def count_papers(self) -> int:
+        """Return the number of points in the collection (from collection info, no scan)."""
+        info = await self.qdrant_client.client.get_collection(self.qdrant_client.collection_name)
+        return info.points_count or 0
+
+    async def prepare(self, tool: str, arguments: dict[str, Any]) -> RetrievalQuery:
+        """
+        Embed a retrieval tool call into its Qdrant request without running it.
+
+        Args:
+            tool (str): One of RETRIEVAL_TOOLS.
+            arguments (dict): The tool's arguments.
+        Returns:
+            RetrievalQuery ready for `run` and `fetch_page`.
+        """
+        builders: dict[str, Callable[..., Awaitable[models.QueryRequest]]] = {
+            "retrieve_papers_dense": self._dense_request,
+            "retrieve_papers_hybrid": self._hybrid_query_request,
+            "recommend_papers_based_on_constraints": self._recommend_request,
+        }
+        if tool not in builders:
+            raise ValueError(f"Unknown retrieval tool: {tool}")
+        return RetrievalQuery(tool=tool, request=await builders[tool](**arguments))
+
+    async def run(self, query: RetrievalQuery, request: models.QueryRequest | None = None) -> list[dict]:
+        """Run a prepared retrieval (or one of its pages) and return the scored papers."""
+        with phase("qdrant_query", tool=query.tool):
+            responses = await self.qdrant_client.client.query_batch_points(
+                collection_name=self.qdrant_client.collection_name, requests=[request or query.request]
+            )
+        return _to_results(responses[0].points)
+
+    async def fetch_page(
+        self, query: RetrievalQuery, limit: int, exclude_ids: Sequence[models.ExtendedPointId]
+    ) -> list[dict]:
+        """
+        Fetch the next page of a prepared retrieval, reusing its query vectors.
+
+        Args:
+            query (RetrievalQuery): The search's prepared retrieval.
+            limit (int): Page size.
+            exclude_ids (Sequence): Ids of the papers already served.
+        Returns:
+            List of dictionaries containing up to `limit` further papers.
+        """
+        return await self.run(query, query.page(limit, exclude_ids))
 
     async def retrieve_papers_dense(self, query: str, top_k: int = 5) -> list[dict]:
         """
@@ -30,6 +140,11 @@ class AsyncQdrantQuery:
         Returns:
             List of dictionaries containing the top_k similar papers.
         """
+        query_request = await self.prepare("retrieve_papers_dense", {"query": query, "top_k": top_k})
+        return await self.run(query_request)
+
+    async def _dense_request(self, query: str, top_k: int = 5) -> models.QueryRequest:
+        """Embed the query into a dense search request."""
         if self.qdrant_client.cloud_inference:
             dense_vector = self.qdrant_client._define_openai_vectors(
                 query, mrl_dimensions=self.qdrant_client.embedding_dimension
@@ -38,12 +153,10 @@ class AsyncQdrantQuery:
             dense_vector = await self.qdrant_client._get_openai_vectors(
                 query, dimensions=self.qdrant_client.embedding_dimension
             )
-
-        search_result = await self.qdrant_client.client.query_points(
-            collection_name=self.qdrant_client.collection_name,
+        return models.QueryRequest(
             query=dense_vector,
             using="Dense",
-            search_params=models.SearchParams(
+            params=models.SearchParams(
                 quantization=models.QuantizationSearchParams(
                     oversampling=3.0,  # retrieve 3 * top_k quantized vectors
                     rescore=True,  # to rescore with original vectors
@@ -51,17 +164,8 @@ class AsyncQdrantQuery:
             ),
             limit=top_k,
             with_payload=True,
-            with_vectors=False,
+            with_vector=False,
         )
-        results = [
-            {
-                "id": point.id,
-                "score": point.score,
-                "payload": point.payload,
-            }
-            for point in search_result.points
-        ]
-        return results
 
     async def retrieve_papers_hybrid(self, query: str, top_k: int = 5) -> list[dict]:
         """
@@ -74,26 +178,82 @@ class AsyncQdrantQuery:
         Returns:
             List of dictionaries containing the top_k similar papers.
         """
-        if self.qdrant_client.cloud_inference:
-            retriever_vector = self.qdrant_client._define_openai_vectors(
-                query, mrl_dimensions=self.qdrant_client.embedding_dimension
-            )
-            reranker_vector = self.qdrant_client._define_openai_vectors(
-                query, mrl_dimensions=self.qdrant_client.reranker_embedding_dimension
+        return (await self.retrieve_papers_hybrid_batch([query], top_k=top_k))[0]
+
+    async def retrieve_papers_hybrid_batch(self, queries: list[str], top_k: int = 5) -> list[list[dict]]:
+        """
+        Run hybrid search for several queries at once (async).
+        All queries are embedded in one embeddings call and searched in one
+        `query_batch_points` request.
+
+        Args:
+            queries (list[str]): Input queries.
+            top_k (int): Number of top similar papers to retrieve per query.
+        Returns:
+            One list of top_k similar papers per query, in input order.
+        """
+        if not queries:
+            return []
+        requests = await self._hybrid_requests(queries, top_k)
+        with phase("qdrant_query", tool="retrieve_papers_hybrid"):
+            responses = await self.qdrant_client.client.query_batch_points(
+                collection_name=self.qdrant_client.collection_name, requests=requests
             )
+        return [_to_results(response.points) for response in responses]
+
+    async def _hybrid_query_request(self, query: str, top_k: int = 5) -> models.QueryRequest:
+        """Embed the query into a hybrid search request."""
+        return (await self._hybrid_requests([query], top_k))[0]
+
+    async def _hybrid_requests(self, queries: list[str], top_k: int) -> list[models.QueryRequest]:
+        """Embed the queries (in one embeddings call) into hybrid search requests."""
+        vectors: list[tuple[list[float] | models.Document, list[float] | models.Document]]
+        if self.qdrant_client.cloud_inference:
+            vectors = [
+                (
+                    self.qdrant_client._define_openai_vectors(
+                        query, mrl_dimensions=self.qdrant_client.embedding_dimension
+                    ),
+                    self.qdrant_client._define_openai_vectors(
+                        query, mrl_dimensions=self.qdrant_client.reranker_embedding_dimension
+                    ),
+                )
+                for query in queries
+            ]
         else:
-            openai_vector = await self.qdrant_client._get_openai_vectors(
-                query, dimensions=self.qdrant_client.reranker_embedding_dimension
+            openai_vectors = await self.qdrant_client._get_openai_vectors_batch(
+                queries, dimensions=self.qdrant_client.reranker_embedding_dimension
             )
-            retriever_vector = openai_vector[
-                : self.qdrant_client.embedding_dimension
-            ]  # Qdrant normalizes vectors used with COSINE automatically on upsert/query
-            reranker_vector = openai_vector  # full precision for reranking
+            vectors = [
+                (
+                    # Qdrant normalizes vectors used with COSINE automatically on upsert/query
+                    openai_vector[: self.qdrant_client.embedding_dimension],
+                    openai_vector,  # full precision for reranking
+                )
+                for openai_vector in openai_vectors
+            ]
 
-        sparse_vector = self.qdrant_client._define_bm25_vectors(query)
+        return [
+            self._hybrid_request(
+                retriever_vector,
+                reranker_vector,
+                self.qdrant_client._define_bm25_vectors(query),
+                top_k,
+            )
+            for query, (retriever_vector, reranker_vector) in zip(queries, vectors, strict=True)
+        ]
 
-        search_result = await self.qdrant_client.client.query_points(
-            collection_name=self.qdrant_client.collection_name,
+    @staticmethod
+    def _hybrid_request(
+        retriever_vector: list[float] | models.Document,
+        reranker_vector: list[float] | models.Document,
+        sparse_vector: models.Document,
+        top_k: int,
+    ) -> models.QueryRequest:
+        """
+        Build a hybrid query: dense and BM25 prefetch, rescored with the reranker vector.
+        """
+        return models.QueryRequest(
             prefetch=[
                 models.Prefetch(
                     query=retriever_vector,
@@ -117,19 +277,9 @@ class AsyncQdrantQuery:
             using="Reranker",
             limit=top_k,
             with_payload=True,
-            with_vectors=False,
+            with_vector=False,
         )
 
-        results = [
-            {
-                "id": point.id,
-                "score": point.score,
-                "payload": point.payload,
-            }
-            for point in search_result.points
-        ]
-        return results
-
     async def recommend_papers_based_on_constraints(
         self,
         positive_examples: list[str] | None,
@@ -147,7 +297,20 @@ class AsyncQdrantQuery:
         Returns:
             List of dictionaries containing the top_k recommended papers.
         """
+        arguments = {
+            "positive_examples": positive_examples,
+            "negative_examples": negative_examples,
+            "top_k": top_k,
+        }
+        return await self.run(await self.prepare("recommend_papers_based_on_constraints", arguments))
 
+    async def _recommend_request(
+        self,
+        positive_examples: list[str] | None,
+        negative_examples: list[str] | None,
+        top_k: int = 5,
+    ) -> models.QueryRequest:
+        """Embed the examples into a recommendation request."""
         if self.qdrant_client.cloud_inference:
             if positive_examples:
                 positive_vectors = [
@@ -187,8 +350,7 @@ class AsyncQdrantQuery:
             else:
                 negative_vectors = None
 
-        recommendation_result = await self.qdrant_client.client.query_points(
-            collection_name=self.qdrant_client.collection_name,
+        return models.QueryRequest(
             query=models.RecommendQuery(
                 recommend=models.RecommendInput(
                     positive=positive_vectors,
@@ -199,15 +361,5 @@ class AsyncQdrantQuery:
             using="Dense",
             limit=top_k,
             with_payload=True,
-            with_vectors=False,
+            with_vector=False,
         )
-
-        results = [
-            {
-                "id": point.id,
-                "score": point.score,
-                "payload": point.payload,
-            }
-            for point in recommendation_result.points
-        ]
-        return results
@@ -1,14 +1,36 @@
 import json
 import asyncio
-from dataclasses import dataclass, field
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
+from biomedical_graphrag.application.services.hybrid_service.answer_cache import SemanticAnswerCache
 from biomedical_graphrag.application.services.hybrid_service.neo4j_query import Neo4jGraphQuery
-from biomedical_graphrag.application.services.hybrid_service.qdrant_query import AsyncQdrantQuery
+from biomedical_graphrag.application.services.hybrid_service.planner import (
+    NEO4J_TOOL_NAMES,
+    PLANNER_TOOLS,
+    QueryPlan,
+    ToolCall,
+    UnresolvedPlaceholderError,
+    build_bindings,
+    resolve_arguments,
+    split_plan,
+)
+from biomedical_graphrag.application.services.hybrid_service.qdrant_query import (
+    RETRIEVAL_TOOLS,
+    AsyncQdrantQuery,
+    RetrievalQuery,
+)
 
+from biomedical_graphrag.application.services.hybrid_service.prompts.context_builder import (
+    FusionContext,
+    build_fusion_context,
+)
 from biomedical_graphrag.application.services.hybrid_service.prompts.hybrid_prompts import (
+    PLANNER_PROMPT,
     QDRANT_PROMPT,
     NEO4J_PROMPT,
     fusion_summary_prompt,
@@ -20,12 +42,39 @@ from biomedical_graphrag.application.services.hybrid_service.tools.qdrant_tools
     QDRANT_TOOLS,
 )
 from biomedical_graphrag.config import settings
+from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import (
+    remember_embedding,
+    share_embeddings,
+)
 from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import REGISTRY, phase, record_request
 
 logger = setup_logging()
 
 
-openai_client = OpenAI(api_key=settings.openai.api_key.get_secret_value())
+openai_client = OpenAI(
+    api_key=settings.openai.api_key.get_secret_value(), base_url=settings.openai.base_url
+)
+async_openai_client = AsyncOpenAI(
+    api_key=settings.openai.api_key.get_secret_value(), base_url=settings.openai.base_url
+)
+
+
+@dataclass
+class PipelineBackends:
+    """Factories for the Qdrant and Neo4j clients the pipeline opens per request.
+
+    Replace the fields (e.g. with clients over shared connections, or with local
+    stand-ins for benchmarks) to run the pipeline against other backends; every
+    client is closed after use. `schema`, when set, is used instead of reading the
+    graph schema on every tool-selection call.
+    """
+    qdrant: Callable[[], AsyncQdrantQuery] = AsyncQdrantQuery
+    neo4j: Callable[[], Neo4jGraphQuery] = Neo4jGraphQuery
+    schema: str | None = None
+
+
+backends = PipelineBackends()
 
 
 def _extract_qdrant_context(qdrant_results: list[dict]) -> dict[str, list[str]]: #Is it a reverse engineering approach of Paper class?
@@ -58,42 +107,38 @@ def _extract_qdrant_context(qdrant_results: list[dict]) -> dict[str, list[str]]:
     }
 
 
-def _score_authors(neo4j: Neo4jGraphQuery, authors: list[str], mesh_terms: list[str]) -> list[str]: #Might be problematic because terms have different importance to a person using the assistant
-    """Score authors by paper count on relevant topics. Returns 'Name (N papers)' sorted by count."""
+# Might be problematic because terms have different importance to a person using the assistant
+def _score_authors(
+    neo4j: Neo4jGraphQuery, authors: list[str], mesh_terms: list[str]
+) -> list[dict[str, Any]]:
+    """Score authors by paper count on relevant topics. Returns [{author, papers}] sorted by count."""
     if not authors:
         return []
-    # If we have MeSH terms, score by topic-relevant papers; otherwise total papers
-    if mesh_terms:
-        results = neo4j.query(
-            """
-            UNWIND $names AS name
-            MATCH (a:Author)-[:WROTE]->(p:Paper)-[:HAS_MESH_TERM]->(m:MeshTerm)
-            WHERE a.name = name
-              AND ANY(topic IN $topics WHERE toLower(m.term) CONTAINS toLower(topic))
-            RETURN a.name AS author, COUNT(DISTINCT p) AS papers
-            ORDER BY papers DESC
-            """,
-            {"names": authors[:30], "topics": mesh_terms[:5]},
-        )
-    else:
-        results = neo4j.query(
-            """
-            UNWIND $names AS name
-            MATCH (a:Author)-[:WROTE]->(p:Paper)
-            WHERE a.name = name
-            RETURN a.name AS author, COUNT(p) AS papers
-            ORDER BY papers DESC
-            """,
-            {"names": authors[:30]},
-        )
-    scored = [f"{r['author']} ({r['papers']} papers)" for r in results if r["papers"] > 0]
-    return scored
+    with phase("author_scoring"):
+        results = neo4j.score_authors(authors, mesh_terms)
+    return [{"author": r["author"], "papers": r["papers"]} for r in results if r["papers"] > 0]
+
+
+def _parse_tool_calls(response: Any) -> list[ToolCall]:
+    """Extract the function calls from an OpenAI Responses API response."""
+    calls: list[ToolCall] = []
+    for item in response.output or []:
+        if item.type == "function_call":
+            args = json.loads(item.arguments) if isinstance(item.arguments, str) else item.arguments
+            calls.append(ToolCall(name=item.name, arguments=args or {}))
+    return calls
 
 
 def get_neo4j_schema() -> str:
-    """Retrieve the Neo4j schema dynamically."""
-    neo4j = Neo4jGraphQuery()
-    schema = neo4j.get_schema()
+    """Retrieve the Neo4j schema dynamically (or the cached `backends.schema`)."""
+    if backends.schema is not None:
+        return backends.schema
+    neo4j = backends.neo4j()
+    try:
+        with phase("neo4j_schema"):
+            schema = neo4j.get_schema()
+    finally:
+        neo4j.close()
     logger.info(f"Retrieved Neo4j schema length: {len(schema)}")
     return schema
 
@@ -104,18 +149,73 @@ class ToolExecution:
     arguments: dict[str, Any] | None = None
     result_count: int | None = None
     results: Any = None
+    duration_ms: float | None = None
 
 
 @dataclass
 class QdrantSearchResult:
-    """Result from Qdrant vector search."""
+    """Result from Qdrant vector search; `query` lets deeper pages reuse the embedded request."""
     results: list[dict]
     tool: ToolExecution
+    query: RetrievalQuery | None = None
 
 
 # --------------------------------------------------------------------
 # Phase 1 — Qdrant tools selection + execution
 # --------------------------------------------------------------------
+async def _execute_qdrant_tool(
+    qdrant: AsyncQdrantQuery, call: ToolCall | None, limit: int
+) -> QdrantSearchResult:
+    """Execute the selected Qdrant tool with the user's result limit."""
+    if call is None:
+        return QdrantSearchResult(
+            results=[], tool=ToolExecution(name="unknown", arguments={}, result_count=0, results=[])
+        )
+
+    args = dict(call.arguments)
+    # Force the limit from user setting
+    args["top_k"] = limit
+    results: list[dict] = []
+    query: RetrievalQuery | None = None
+    start = time.perf_counter()
+    if call.name in RETRIEVAL_TOOLS:
+        logger.info(f"Executing Qdrant tool: {call.name} with args: {args}")
+        query = await qdrant.prepare(call.name, args)
+        results = await qdrant.run(query)
+        logger.info(f"Qdrant results count: {len(results)}")
+    return QdrantSearchResult(
+        results=results,
+        query=query,
+        tool=ToolExecution(
+            name=call.name,
+            arguments=args,
+            result_count=len(results),
+            results=results,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        ),
+    )
+
+
+async def fetch_papers_page(
+    query: RetrievalQuery, limit: int, exclude_ids: Sequence[int | str]
+) -> list[dict]:
+    """Fetch a deeper page of a search's retrieval (no LLM or embeddings call).
+
+    Args:
+        query: The retrieval the search ran (`GraphRAGResult.retrieval`).
+        limit: Page size.
+        exclude_ids: Qdrant ids of the papers already served.
+
+    Returns:
+        Up to `limit` further papers, in ranking order.
+    """
+    qdrant = backends.qdrant()
+    try:
+        return await qdrant.fetch_page(query, limit, exclude_ids)
+    finally:
+        await qdrant.close()
+
+
 async def run_qdrant_vector_search(question: str, limit: int = 5) -> QdrantSearchResult:
     """Run Qdrant vector search.
     Args:
@@ -124,45 +224,29 @@ async def run_qdrant_vector_search(question: str, limit: int = 5) -> QdrantSearc
     Returns:
         QdrantSearchResult with results and tool execution info.
     """
-    prompt = QDRANT_PROMPT.format(question=question)
-    qdrant = AsyncQdrantQuery()
-    tool_name = "unknown"
-    tool_args: dict[str, Any] = {}
-
+    call = await route_qdrant_tool(question)
+    qdrant = backends.qdrant()
     try:
-        response = await asyncio.to_thread(
-            openai_client.responses.create,  # type: ignore[call-overload]
+        return await _execute_qdrant_tool(qdrant, call, limit)
+    finally:
+        await qdrant.close()
+
+
+async def route_qdrant_tool(question: str) -> ToolCall | None:
+    """Let the model pick the Qdrant retrieval tool and its arguments for the question."""
+    prompt = QDRANT_PROMPT.format(question=question)
+    with phase("llm", step="route") as timing:
+        # Async client, so cancelling the request aborts the call
+        response = await async_openai_client.responses.create(  # type: ignore[call-overload]
             model=settings.openai.model,
             tools=QDRANT_TOOLS,
             input=[{"role": "user", "content": prompt}],
             tool_choice="required",
         )
-
-        results = []
-        if response.output:
-            for tool_call in response.output:
-                if tool_call.type == "function_call":
-                    tool_name = tool_call.name
-                    args = (
-                        json.loads(tool_call.arguments)
-                        if isinstance(tool_call.arguments, str)
-                        else tool_call.arguments
-                    )
-                    # Force the limit from user setting
-                    args["top_k"] = limit
-                    tool_args = args.copy()
-                    func = getattr(qdrant, tool_name, None)
-                    if func:
-                        logger.info(f"Executing Qdrant tool: {tool_name} with args: {args}")
-                        results = await func(**args)
-                        logger.info(f"Qdrant results count: {len(results)}")
-    finally:
-        await qdrant.close()
-
-    return QdrantSearchResult(
-        results=results,
-        tool=ToolExecution(name=tool_name, arguments=tool_args, result_count=len(results), results=results),
-    )
+        timing.add_usage(response.usage)
+    calls = _parse_tool_calls(response)
+    # The prompt asks for exactly one tool; keep the last one if the model returned several
+    return calls[-1] if calls else None
 
 @dataclass
 class Neo4jEnrichmentResult:
@@ -174,166 +258,612 @@ class Neo4jEnrichmentResult:
 # --------------------------------------------------------------------
 # Phase 2 — Neo4j enrichment tools selection + execution
 # --------------------------------------------------------------------
-def run_graph_enrichment(question: str, qdrant_results: list[dict]) -> Neo4jEnrichmentResult:
+def _iter_neo4j_tools(
+    neo4j: Neo4jGraphQuery, calls: list[ToolCall], ctx: dict[str, list[str]]
+) -> Iterator[tuple[ToolExecution, Any]]:
+    """Execute the selected Neo4j tools one by one, capping repeated calls to the same tool.
+
+    Yields:
+        The tool execution record and the value to hand to the summary for that tool.
+    """
+    tool_call_counts: dict[str, int] = {}
+    max_calls_per_tool = 3 #TBD
+
+    for call in calls:
+        name = call.name
+
+        tool_call_counts[name] = tool_call_counts.get(name, 0) + 1
+        if tool_call_counts[name] > max_calls_per_tool:
+            logger.info(f"Skipping {name} (exceeded {max_calls_per_tool} calls)")
+            continue
+
+        args = dict(call.arguments)
+
+        # Auto-inject exclude_pmids for tools that support it
+        if name in ("get_collaborators_with_topics", "get_related_papers_by_mesh"):
+            args.setdefault("exclude_pmids", ctx["pmids"])
+
+        func = getattr(neo4j, name, None)
+        if func:
+            with phase("neo4j_tool", tool=name) as timing:
+                try:
+                    logger.info(f"Executing Neo4j tool: {name} with args: {args}")
+                    result = func(**args)
+                    summary_value = result
+                    count = len(result) if isinstance(result, list) else None
+                except Exception as e:
+                    logger.error(f"Neo4j tool {name} failed: {e}", exc_info=True)
+                    summary_value = f"Tool '{name}' encountered an error and returned no results."
+                    result = None
+                    count = 0
+            tool = ToolExecution(
+                name=name,
+                arguments=args,
+                result_count=count,
+                results=result,
+                duration_ms=timing.duration_ms,
+            )
+            yield tool, summary_value
+
+
+def _execute_neo4j_tools(
+    neo4j: Neo4jGraphQuery, calls: list[ToolCall], ctx: dict[str, list[str]]
+) -> Neo4jEnrichmentResult:
+    """Execute the selected Neo4j tools and collect their results."""
+    results: dict[str, Any] = {}
+    tools_executed: list[ToolExecution] = []
+    for tool, summary_value in _iter_neo4j_tools(neo4j, calls, ctx):
+        results[tool.name] = summary_value
+        tools_executed.append(tool)
+
+    logger.info(f"Neo4j tools executed: {[t.name for t in tools_executed]}")
+    return Neo4jEnrichmentResult(results=results, tools=tools_executed)
+
+
+def _neo4j_tools_prompt(neo4j: Neo4jGraphQuery, question: str, ctx: dict[str, list[str]]) -> str:
+    """Build the Neo4j tool-selection prompt; scoring the authors queries the graph."""
+    schema = get_neo4j_schema()
+    scored_authors = _score_authors(neo4j, ctx["authors"], ctx["mesh_terms"])
+    logger.info(
+        f"Qdrant context: {len(ctx['pmids'])} PMIDs, {len(scored_authors)} scored authors, "
+        f"{len(ctx['mesh_terms'])} MeSH, {len(ctx['genes'])} genes"
+    )
+
+    return NEO4J_PROMPT.format(
+        schema=schema,
+        question=question,
+        pmids=", ".join(ctx["pmids"]) or "None",
+        authors="; ".join(f"{a['author']} ({a['papers']} papers)" for a in scored_authors[:15])
+        or "None",
+        mesh_terms=", ".join(ctx["mesh_terms"][:30]) or "None",
+        genes=", ".join(ctx["genes"][:20]) or "None",
+    )
+
+
+def _select_neo4j_tools(
+    neo4j: Neo4jGraphQuery, question: str, ctx: dict[str, list[str]]
+) -> list[ToolCall]:
+    """Let the model pick the Neo4j tools for the retrieved context."""
+    prompt = _neo4j_tools_prompt(neo4j, question, ctx)
+    with phase("llm", step="select_tools") as timing:
+        response = openai_client.responses.create(  # type: ignore[call-overload]
+            model=settings.openai.model,
+            tools=NEO4J_ENRICHMENT_TOOLS,
+            input=[{"role": "user", "content": prompt}],
+            tool_choice="auto",
+        )
+        timing.add_usage(response.usage)
+    return _parse_tool_calls(response)
+
+
+async def _select_neo4j_tools_async(
+    neo4j: Neo4jGraphQuery, question: str, ctx: dict[str, list[str]]
+) -> list[ToolCall]:
+    """Async `_select_neo4j_tools`: the graph queries run in a thread, the LLM call is awaited.
+
+    Awaiting the call rather than running it in a thread lets a cancelled request abort it.
+    """
+    prompt = await asyncio.to_thread(_neo4j_tools_prompt, neo4j, question, ctx)
+    with phase("llm", step="select_tools") as timing:
+        response = await async_openai_client.responses.create(  # type: ignore[call-overload]
+            model=settings.openai.model,
+            tools=NEO4J_ENRICHMENT_TOOLS,
+            input=[{"role": "user", "content": prompt}],
+            tool_choice="auto",
+        )
+        timing.add_usage(response.usage)
+    return _parse_tool_calls(response)
+
+
+def run_graph_enrichment(
+    question: str, qdrant_results: list[dict], neo4j: Neo4jGraphQuery | None = None
+) -> Neo4jEnrichmentResult:
     """Run graph enrichment.
 
     Args:
         question: The user question.
         qdrant_results: Qdrant payloads retrieved by a selected Qdrant tool.
+        neo4j: Shared graph client; a new one is opened (and closed) if omitted.
 
     Returns:
         Neo4jEnrichmentResult with results and tool execution info.
     """
-    schema = get_neo4j_schema()
-    neo4j = Neo4jGraphQuery()
-    tools_executed: list[ToolExecution] = []
+    own_client = neo4j is None
+    neo4j = neo4j or backends.neo4j()
 
-    # Extract structured context from Qdrant results
-    ctx = _extract_qdrant_context(qdrant_results)
-    scored_authors = _score_authors(neo4j, ctx["authors"], ctx["mesh_terms"])
-    logger.info(f"Qdrant context: {len(ctx['pmids'])} PMIDs, {len(scored_authors)} scored authors, {len(ctx['mesh_terms'])} MeSH, {len(ctx['genes'])} genes")
+    try:
+        # Extract structured context from Qdrant results
+        ctx = _extract_qdrant_context(qdrant_results)
+        calls = _select_neo4j_tools(neo4j, question, ctx)
+        return _execute_neo4j_tools(neo4j, calls, ctx)
+    finally:
+        if own_client:
+            neo4j.close()
 
+
+async def run_graph_enrichment_async(
+    question: str, qdrant_results: list[dict], neo4j: Neo4jGraphQuery | None = None
+) -> Neo4jEnrichmentResult:
+    """Async run_graph_enrichment: graph queries run in a thread so the event loop is not blocked."""
+    own_client = neo4j is None
+    neo4j = neo4j or backends.neo4j()
     try:
-        prompt = NEO4J_PROMPT.format(
-            schema=schema,
-            question=question,
-            pmids=", ".join(ctx["pmids"]) or "None",
-            authors="; ".join(scored_authors[:15]) or "None",
-            mesh_terms=", ".join(ctx["mesh_terms"][:30]) or "None",
-            genes=", ".join(ctx["genes"][:20]) or "None",
-        )
+        ctx = _extract_qdrant_context(qdrant_results)
+        calls = await _select_neo4j_tools_async(neo4j, question, ctx)
+        return await asyncio.to_thread(_execute_neo4j_tools, neo4j, calls, ctx)
+    finally:
+        if own_client:
+            neo4j.close()
 
-        response = openai_client.responses.create(  # type: ignore[call-overload]
+
+# --------------------------------------------------------------------
+# Planner mode — one LLM call for retrieval + graph tools
+# --------------------------------------------------------------------
+async def plan_tools(question: str) -> QueryPlan:
+    """Ask the model for the retrieval tool and a templated graph-tool plan in one call.
+
+    Args:
+        question: The user question.
+
+    Returns:
+        QueryPlan with the retrieval call and the graph calls (arguments may hold placeholders).
+    """
+    prompt = PLANNER_PROMPT.format(schema=get_neo4j_schema(), question=question)
+    with phase("llm", step="plan") as timing:
+        response = await async_openai_client.responses.create(  # type: ignore[call-overload]
             model=settings.openai.model,
-            tools=NEO4J_ENRICHMENT_TOOLS,
+            tools=PLANNER_TOOLS,
             input=[{"role": "user", "content": prompt}],
-            tool_choice="auto",
+            tool_choice="required",
         )
-
-        results: dict[str, Any] = {}
-        tool_call_counts: dict[str, int] = {}
-        max_calls_per_tool = 3 #TBD
-
-        if response.output:
-            for tool_call in response.output:
-                if tool_call.type == "function_call":
-                    name = tool_call.name
-
-                    tool_call_counts[name] = tool_call_counts.get(name, 0) + 1
-                    if tool_call_counts[name] > max_calls_per_tool:
-                        logger.info(f"Skipping {name} (exceeded {max_calls_per_tool} calls)")
-                        continue
-
-                    args = (
-                        json.loads(tool_call.arguments)
-                        if isinstance(tool_call.arguments, str)
-                        else tool_call.arguments
-                    )
-
-                    # Auto-inject exclude_pmids for tools that support it
-                    if name in ("get_collaborators_with_topics", "get_related_papers_by_mesh"):
-                        args.setdefault("exclude_pmids", ctx["pmids"])
-
-                    func = getattr(neo4j, name, None)
-                    if func:
-                        try:
-                            logger.info(f"Executing Neo4j tool: {name} with args: {args}")
-                            result = func(**args)
-                            results[name] = result
-                            count = len(result) if isinstance(result, list) else None
-                        except Exception as e:
-                            logger.error(f"Neo4j tool {name} failed: {e}", exc_info=True)
-                            results[name] = f"Tool '{name}' encountered an error and returned no results."
-                            result = None
-                            count = 0
-                        tools_executed.append(ToolExecution(name=name, arguments=args, result_count=count, results=result))
-
-        logger.info(f"Neo4j tools executed: {[t.name for t in tools_executed]}")
-        return Neo4jEnrichmentResult(results=results, tools=tools_executed)
+        timing.add_usage(response.usage)
+    plan = split_plan(_parse_tool_calls(response))
+    if plan.retrieval is None:
+        logger.warning("Planner returned no retrieval tool; falling back to hybrid retrieval")
+        plan.retrieval = ToolCall(name="retrieve_papers_hybrid", arguments={"query": question})
+    logger.info(f"Planned retrieval: {plan.retrieval.name}, graph tools: {[c.name for c in plan.graph]}")
+    return plan
+
+
+async def run_planned_vector_search(plan: QueryPlan, limit: int = 5) -> QdrantSearchResult:
+    """Execute the planned retrieval tool without another tool-selection call."""
+    qdrant = backends.qdrant()
+    try:
+        return await _execute_qdrant_tool(qdrant, plan.retrieval, limit)
     finally:
-        neo4j.close()
+        await qdrant.close()
 
 
-async def run_graph_enrichment_async(question: str, qdrant_results: list[dict]) -> Neo4jEnrichmentResult:
-    """Async wrapper for run_graph_enrichment to avoid blocking the event loop."""
-    return await asyncio.to_thread(run_graph_enrichment, question, qdrant_results)
+def _bind_planned_neo4j_tools(
+    neo4j: Neo4jGraphQuery, plan: QueryPlan, ctx: dict[str, list[str]]
+) -> list[ToolCall]:
+    """Bind the plan's placeholders to the retrieved papers.
+
+    Tools whose placeholders cannot be bound (e.g. `$top_gene` when no genes were
+    retrieved) are skipped.
+    """
+    if not plan.graph:
+        return []
+    bindings = build_bindings(ctx, _score_authors(neo4j, ctx["authors"], ctx["mesh_terms"]))
+
+    calls: list[ToolCall] = []
+    for call in plan.graph:
+        try:
+            arguments = resolve_arguments(call.arguments, bindings)
+            calls.append(ToolCall(name=call.name, arguments=arguments))
+        except UnresolvedPlaceholderError as e:
+            logger.info(f"Skipping planned {call.name}: no value for placeholder {e}")
+    return calls
+
+
+def run_planned_graph_enrichment(
+    plan: QueryPlan, qdrant_results: list[dict], neo4j: Neo4jGraphQuery | None = None
+) -> Neo4jEnrichmentResult:
+    """Bind the plan's placeholders to the retrieved papers and run the graph tools.
+
+    A new graph client is opened (and closed) unless `neo4j` is given.
+    """
+    if not plan.graph:
+        return Neo4jEnrichmentResult(results={}, tools=[])
+
+    own_client = neo4j is None
+    neo4j = neo4j or backends.neo4j()
+    try:
+        ctx = _extract_qdrant_context(qdrant_results)
+        return _execute_neo4j_tools(neo4j, _bind_planned_neo4j_tools(neo4j, plan, ctx), ctx)
+    finally:
+        if own_client:
+            neo4j.close()
 
 
 # --------------------------------------------------------------------
 # Phase 3 — Fusion summarization
 # --------------------------------------------------------------------
-def summarize_fused_results(
-    question: str, qdrant_results: list[dict], neo4j_results: dict[str, Any], limit: int = 5
-) -> str:
+def _log_context(context: FusionContext) -> None:
+    logger.info(
+        f"Fusion context: ~{context.tokens_after} tokens "
+        f"(saved ~{context.tokens_saved} of ~{context.tokens_before})"
+    )
+
+
+def summarize_fused_results(question: str, context: FusionContext, limit: int = 5) -> str:
     """Fuse semantic and graph evidence into one final biomedical summary.
 
     Args:
         question: The user question.
-        qdrant_results: Qdrant tool results.
-        neo4j_results: The Neo4j results.
+        context: Token-budgeted Qdrant and Neo4j evidence.
         limit: Number of papers retrieved (controls Key Findings count).
 
     Returns:
         The summarized results.
     """
-    prompt = fusion_summary_prompt(question, qdrant_results, neo4j_results, limit=limit)
-    resp = openai_client.responses.create(
-        model=settings.openai.model,
-        input=prompt,
-        temperature=settings.openai.temperature,
-        max_output_tokens=settings.openai.max_tokens,
-    )
+    prompt = fusion_summary_prompt(question, context.qdrant_context, context.neo4j_context, limit=limit)
+    with phase("llm", step="summary") as timing:
+        resp = openai_client.responses.create(
+            model=settings.openai.model,
+            input=prompt,
+            temperature=settings.openai.temperature,
+            max_output_tokens=settings.openai.max_tokens,
+        )
+        timing.add_usage(resp.usage)
     return resp.output_text.strip()
 
 
-async def summarize_fused_results_async(
-    question: str, qdrant_results: list[dict], neo4j_results: dict[str, Any], limit: int = 5
-) -> str:
+async def summarize_fused_results_async(question: str, context: FusionContext, limit: int = 5) -> str:
     """Async wrapper for summarize_fused_results to avoid blocking the event loop."""
-    return await asyncio.to_thread(
-        summarize_fused_results, question, qdrant_results, neo4j_results, limit
-    )
+    return await asyncio.to_thread(summarize_fused_results, question, context, limit)
+
+
+async def stream_fused_summary(
+    question: str, context: FusionContext, limit: int = 5
+) -> AsyncGenerator[str]:
+    """Stream the fusion summary as text deltas while the model generates it.
+
+    Args:
+        question: The user question.
+        context: Token-budgeted Qdrant and Neo4j evidence.
+        limit: Number of papers retrieved (controls Key Findings count).
+
+    Yields:
+        Summary text deltas in generation order.
+    """
+    prompt = fusion_summary_prompt(question, context.qdrant_context, context.neo4j_context, limit=limit)
+    with phase("llm", step="summary") as timing:
+        stream = await async_openai_client.responses.create(
+            model=settings.openai.model,
+            input=prompt,
+            temperature=settings.openai.temperature,
+            max_output_tokens=settings.openai.max_tokens,
+            stream=True,
+        )
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                yield event.delta
+            elif event.type == "response.completed":
+                timing.add_usage(event.response.usage)
 
 @dataclass
 class GraphRAGResult:
-    """Result container for GraphRAG search."""
+    """Result container for GraphRAG search (`retrieval` is kept for result pagination)."""
     summary: str
     qdrant_results: list[dict]
     neo4j_results: dict[str, Any]
     trace: list[ToolExecution] = field(default_factory=list)
+    metrics: dict[str, Any] = field(default_factory=dict)
+    retrieval: RetrievalQuery | None = None
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+# --------------------------------------------------------------------
+# Semantic answer cache
+# --------------------------------------------------------------------
+answer_cache = SemanticAnswerCache(
+    threshold=settings.graphrag.answer_cache_threshold,
+    ttl_seconds=settings.graphrag.answer_cache_ttl_seconds,
+    max_entries=settings.graphrag.answer_cache_max_entries,
+)
+_answer_cache_checked_at: float | None = None
+
+
+async def _refresh_answer_cache_version() -> None:
+    """Drop cached answers when the Qdrant or Neo4j data changed (checked periodically)."""
+    global _answer_cache_checked_at
+    now = time.monotonic()
+    interval = settings.graphrag.answer_cache_version_check_seconds
+    if _answer_cache_checked_at is not None and now - _answer_cache_checked_at < interval:
+        return
+    _answer_cache_checked_at = now
+
+    qdrant: AsyncQdrantQuery | None = None
+    neo4j: Neo4jGraphQuery | None = None
+    try:
+        qdrant = backends.qdrant()
+        neo4j = backends.neo4j()
+        papers = await qdrant.count_papers()
+        counts = await asyncio.to_thread(neo4j.get_graph_counts)
+    except Exception as e:
+        logger.warning(f"Could not read data version for the answer cache: {e}")
+        return
+    finally:
+        if qdrant is not None:
+            await qdrant.close()
+        if neo4j is not None:
+            neo4j.close()
+    if answer_cache.set_version((papers, counts["nodes"], counts["relationships"])):
+        logger.info("Collection or graph changed; answer cache cleared")
+
+
+async def _embed_question(question: str) -> list[float]:
+    """Embed the question at the (small) MRL dimension used for cache lookups.
+
+    Without Qdrant cloud inference the question is embedded at the full reranker
+    dimension instead and its MRL prefix is used for the lookup. On a miss, retrieval
+    reuses that vector when hybrid search embeds the question itself, so the lookup costs no
+    extra embeddings call; it still costs one when retrieval searches a rewritten query.
+    """
+    cache_dimensions = settings.graphrag.answer_cache_dimensions
+    dimensions = cache_dimensions
+    if not settings.qdrant.cloud_inference:
+        dimensions = max(settings.qdrant.reranker_embedding_dimension, cache_dimensions)
+    with phase("embedding", purpose="answer_cache") as timing:
+        response = await async_openai_client.embeddings.create(
+            model=settings.qdrant.embedding_model, input=question, dimensions=dimensions
+        )
+        timing.add_usage(response.usage)
+    vector = response.data[0].embedding
+    remember_embedding(question, dimensions, vector)
+    # An MRL prefix; the cache normalizes vectors before comparing them
+    return vector[:cache_dimensions]
+
+
+async def _lookup_answer(
+    question: str, key: tuple[int, bool]
+) -> tuple[list[float] | None, GraphRAGResult | None]:
+    """Look the question up in the answer cache.
+
+    Returns:
+        The question embedding (None if the cache is disabled or unavailable) and the
+        cached result on a hit.
+    """
+    if not settings.graphrag.answer_cache_enabled:
+        return None, None
+    try:
+        await _refresh_answer_cache_version()
+        vector = await _embed_question(question)
+    except Exception as e:
+        logger.warning(f"Answer cache lookup skipped: {e}")
+        return None, None
+
+    with phase("answer_cache_lookup"):
+        hit = answer_cache.get(vector, key)
+    REGISTRY.inc("graphrag_answer_cache_requests_total", result="hit" if hit else "miss")
+    if hit is None:
+        return vector, None
+    cached, similarity = hit
+    logger.info(f"Answer cache hit for query='{question}' (similarity={similarity:.3f})")
+    return vector, replace(cached, metrics={"cache_hit": True, "cache_similarity": round(similarity, 4)})
+
+
+def _store_answer(
+    question: str, vector: list[float] | None, key: tuple[int, bool], result: GraphRAGResult
+) -> None:
+    if vector is not None:
+        answer_cache.put(question, vector, key, result)
+        result.metrics["cache_hit"] = False
 
 
 # --------------------------------------------------------------------
 # Unified helper
 # --------------------------------------------------------------------
-async def run_tools_sequence_and_summarize(question: str, limit: int = 5) -> GraphRAGResult:
+async def run_tools_sequence_and_summarize(
+    question: str, limit: int = 5, planner: bool | None = None
+) -> GraphRAGResult:
     """Run graph enrichment and summarize the results.
 
     Args:
         question: The user question.
+        limit: Maximum number of papers to retrieve.
+        planner: Plan retrieval and graph tools in a single LLM call.
+            Defaults to `settings.graphrag.planner_mode`.
 
     Returns:
-        GraphRAGResult containing summary, results, and trace.
+        GraphRAGResult containing summary, results, trace, and per-phase latency and token usage
+        in `metrics`. Served from the answer cache when it is enabled and a similar question
+        was answered recently.
     """
+    if planner is None:
+        planner = settings.graphrag.planner_mode
+    with record_request() as request_metrics, share_embeddings():
+        vector, result = await _lookup_answer(question, (limit, planner))
+        if result is None:
+            result = await _run_tools_sequence(question, limit, planner)
+            _store_answer(question, vector, (limit, planner), result)
+    result.metrics.update(request_metrics.summary())
+    return result
+
+
+async def _run_tools_sequence(question: str, limit: int, planner: bool) -> GraphRAGResult:
     trace: list[ToolExecution] = []
 
-    # Phase 1: Qdrant vector search
-    qdrant_result = await run_qdrant_vector_search(question, limit=limit)
-    trace.append(qdrant_result.tool)
+    if planner:
+        # Phase 1+2: one planning call, graph tools run as soon as retrieval returns
+        start = time.perf_counter()
+        plan = await plan_tools(question)
+        planned = [{"name": c.name, "arguments": c.arguments} for c in plan.graph]
+        trace.append(
+            ToolExecution(
+                name="plan", arguments={"graph_tools": planned}, duration_ms=_elapsed_ms(start)
+            )
+        )
+        qdrant_result = await run_planned_vector_search(plan, limit=limit)
+        trace.append(qdrant_result.tool)
+        neo4j_result = await asyncio.to_thread(run_planned_graph_enrichment, plan, qdrant_result.results)
+        trace.extend(neo4j_result.tools)
+    else:
+        # Phase 1: Qdrant vector search
+        qdrant_result = await run_qdrant_vector_search(question, limit=limit)
+        trace.append(qdrant_result.tool)
 
-    # Phase 2: Neo4j enrichment
-    neo4j_result = await run_graph_enrichment_async(question, qdrant_result.results)
-    trace.extend(neo4j_result.tools)
+        # Phase 2: Neo4j enrichment
+        neo4j_result = await run_graph_enrichment_async(question, qdrant_result.results)
+        trace.extend(neo4j_result.tools)
 
     # Phase 3: Summarization
-    summary = await summarize_fused_results_async(
-        question, qdrant_result.results, neo4j_result.results, limit=limit
-    )
-    trace.append(ToolExecution(name="summarize"))
+    context = build_fusion_context(qdrant_result.results, neo4j_result.results)
+    _log_context(context)
+    start = time.perf_counter()
+    summary = await summarize_fused_results_async(question, context, limit=limit)
+    trace.append(ToolExecution(name="summarize", duration_ms=_elapsed_ms(start)))
 
     return GraphRAGResult(
         summary=summary,
         qdrant_results=qdrant_result.results,
         neo4j_results=neo4j_result.results,
         trace=trace,
+        metrics=context.stats(),
+        retrieval=qdrant_result.query,
+    )
+
+
+@dataclass
+class PipelineEvent:
+    """Incremental output of the streaming GraphRAG pipeline.
+
+    `event` is one of:
+    - "papers": retrieval finished, `data` is the QdrantSearchResult
+    - "tool_result": one Neo4j tool finished, `data` is its ToolExecution
+    - "summary_delta": `data` is the next chunk of summary text
+    - "done": `data` is the complete GraphRAGResult
+    """
+
+    event: str
+    data: Any
+
+
+async def stream_tools_sequence_and_summarize(
+    question: str, limit: int = 5, planner: bool | None = None
+) -> AsyncGenerator[PipelineEvent]:
+    """Run the GraphRAG pipeline, yielding each phase's output as soon as it is available.
+
+    Args:
+        question: The user question.
+        limit: Maximum number of papers to retrieve.
+        planner: Plan retrieval and graph tools in a single LLM call.
+            Defaults to `settings.graphrag.planner_mode`.
+
+    Yields:
+        PipelineEvent objects: papers, one tool_result per Neo4j tool, summary deltas, done.
+    """
+    if planner is None:
+        planner = settings.graphrag.planner_mode
+    with record_request() as request_metrics, share_embeddings():
+        vector, cached = await _lookup_answer(question, (limit, planner))
+        if cached is not None:
+            events = _replay_cached_answer(cached)
+        else:
+            events = _stream_tools_sequence(question, limit, planner)
+        async for event in events:
+            if event.event == "done":
+                if cached is None:
+                    _store_answer(question, vector, (limit, planner), event.data)
+                event.data.metrics.update(request_metrics.summary())
+            yield event
+
+
+async def _replay_cached_answer(result: GraphRAGResult) -> AsyncGenerator[PipelineEvent]:
+    """Emit a cached answer as the same event sequence a fresh run produces."""
+    retrieval = QdrantSearchResult(
+        results=result.qdrant_results, tool=ToolExecution(name="answer_cache"), query=result.retrieval
+    )
+    yield PipelineEvent(event="papers", data=retrieval)
+    for tool in result.trace:
+        if tool.name in NEO4J_TOOL_NAMES:
+            yield PipelineEvent(event="tool_result", data=tool)
+    yield PipelineEvent(event="summary_delta", data=result.summary)
+    yield PipelineEvent(event="done", data=result)
+
+
+async def _stream_tools_sequence(
+    question: str, limit: int, planner: bool
+) -> AsyncGenerator[PipelineEvent]:
+    trace: list[ToolExecution] = []
+
+    # Phase 1: Qdrant vector search
+    plan: QueryPlan | None = None
+    if planner:
+        start = time.perf_counter()
+        plan = await plan_tools(question)
+        planned = [{"name": c.name, "arguments": c.arguments} for c in plan.graph]
+        trace.append(
+            ToolExecution(
+                name="plan", arguments={"graph_tools": planned}, duration_ms=_elapsed_ms(start)
+            )
+        )
+        qdrant_result = await run_planned_vector_search(plan, limit=limit)
+    else:
+        qdrant_result = await run_qdrant_vector_search(question, limit=limit)
+    trace.append(qdrant_result.tool)
+    yield PipelineEvent(event="papers", data=qdrant_result)
+
+    # Phase 2: Neo4j enrichment, one event per tool
+    neo4j_results: dict[str, Any] = {}
+    ctx = _extract_qdrant_context(qdrant_result.results)
+    neo4j = backends.neo4j()
+    try:
+        if plan is not None:
+            calls = await asyncio.to_thread(_bind_planned_neo4j_tools, neo4j, plan, ctx)
+        else:
+            calls = await _select_neo4j_tools_async(neo4j, question, ctx)
+        tools = _iter_neo4j_tools(neo4j, calls, ctx)
+        while (step := await asyncio.to_thread(next, tools, None)) is not None:
+            tool, summary_value = step
+            neo4j_results[tool.name] = summary_value
+            trace.append(tool)
+            yield PipelineEvent(event="tool_result", data=tool)
+    finally:
+        neo4j.close()
+
+    # Phase 3: Summarization, streamed token by token
+    context = build_fusion_context(qdrant_result.results, neo4j_results)
+    _log_context(context)
+    chunks: list[str] = []
+    start = time.perf_counter()
+    async for delta in stream_fused_summary(question, context, limit=limit):
+        chunks.append(delta)
+        yield PipelineEvent(event="summary_delta", data=delta)
+    trace.append(ToolExecution(name="summarize", duration_ms=_elapsed_ms(start)))
+
+    yield PipelineEvent(
+        event="done",
+        data=GraphRAGResult(
+            summary="".join(chunks).strip(),
+            qdrant_results=qdrant_result.results,
+            neo4j_results=neo4j_results,
+            trace=trace,
+            metrics=context.stats(),
+            retrieval=qdrant_result.query,
+        ),
     )
@@ -0,0 +1 @@
+"""Offline benchmarks for the GraphRAG pipeline, with local stand-ins for OpenAI, Qdrant and Neo4j."""
@@ -0,0 +1,306 @@
+"""
+Local stand-in for the OpenAI Responses and Embeddings APIs.
+
+The server speaks just enough of the wire format for the official `openai`
+client: `POST /v1/responses` (plain and streamed) and `POST /v1/embeddings`.
+Answers are deterministic:
+- tool-calling requests get the tool calls the pipeline expects (route,
+  Neo4j tool selection, or a full plan), filled from the prompt;
+- summary requests get a fixed-length text citing the PMIDs in the prompt;
+- embeddings are hashed bag-of-words vectors, so retrieval stays topical.
+
+Latency is simulated as time to first token plus a per-output-token delay, so
+relative pipeline changes can be compared without network access or API cost.
+"""
+
+import asyncio
+import base64
+import itertools
+import json
+import re
+import socket
+import threading
+import time
+from array import array
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from biomedical_graphrag.benchmarks.text_hashing import hash_embedding, tokenize
+
+_QUESTION_PATTERN = re.compile(r"User Question:\s*\n(.+?)\n", re.DOTALL)
+_ENTITY_PATTERN = r"^- {label}: (.+)$"
+_COUNTER_EXAMPLE_PATTERN = re.compile(r"\s+but not (?:about\s+)?", re.IGNORECASE)
+_PMID_PATTERN = re.compile(r'"pmid":\s*"(\d+)"')
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Simulated model latency.
+
+    Args:
+        ttft_ms: Time to first token of every Responses call.
+        output_token_ms: Additional delay per generated token.
+        embedding_latency_ms: Duration of every Embeddings call.
+        summary_tokens: Length of generated summaries, in tokens (words).
+        stream_chunk_tokens: Tokens per streamed text delta.
+    """
+
+    ttft_ms: float = 400.0
+    output_token_ms: float = 8.0
+    embedding_latency_ms: float = 60.0
+    summary_tokens: int = 250
+    stream_chunk_tokens: int = 5
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _prompt_text(body: dict[str, Any]) -> str:
+    prompt = body.get("input", "")
+    if isinstance(prompt, str):
+        return prompt
+    return "\n".join(str(message.get("content", "")) for message in prompt)
+
+
+def _question(prompt: str) -> str:
+    match = _QUESTION_PATTERN.search(prompt + "\n")
+    return match.group(1).strip() if match else prompt[-200:]
+
+
+def _entities(prompt: str, label: str, separator: str) -> list[str]:
+    match = re.search(_ENTITY_PATTERN.format(label=re.escape(label)), prompt, re.MULTILINE)
+    if not match or match.group(1).strip() == "None":
+        return []
+    return [value.strip() for value in match.group(1).split(separator) if value.strip()]
+
+
+def _retrieval_call(question: str) -> tuple[str, dict[str, Any]]:
+    parts = _COUNTER_EXAMPLE_PATTERN.split(question.rstrip(".?"), maxsplit=1)
+    if len(parts) == 2:
+        return "recommend_papers_based_on_constraints", {
+            "positive_examples": [parts[0]],
+            "negative_examples": [parts[1]],
+        }
+    return "retrieve_papers_hybrid", {"query": question}
+
+
+def _graph_calls(prompt: str) -> list[tuple[str, dict[str, Any]]]:
+    """Pick Neo4j tools from the entities listed in the tool-selection prompt."""
+    pmids = _entities(prompt, "PMIDs", ",")
+    authors = [author.rsplit(" (", 1)[0] for author in _entities(prompt, "Authors", ";")]
+    mesh_terms = _entities(prompt, "MeSH Terms", ", ")
+    genes = _entities(prompt, "Genes", ",")
+    calls: list[tuple[str, dict[str, Any]]] = []
+    if pmids:
+        calls.append(("get_related_papers_by_mesh", {"pmid": pmids[0]}))
+    if authors and mesh_terms:
+        calls.append(
+            ("get_collaborators_with_topics", {"author_name": authors[0], "topics": mesh_terms[:3]})
+        )
+    if genes:
+        calls.append(("get_genes_in_same_papers", {"target_gene": genes[0]}))
+    return calls
+
+
+def _planned_calls(question: str) -> list[tuple[str, dict[str, Any]]]:
+    """Retrieval call plus placeholder-based graph calls, as the planner prompt asks for."""
+    return [
+        _retrieval_call(question),
+        ("get_related_papers_by_mesh", {"pmid": "$top_pmid"}),
+        ("get_collaborators_with_topics", {"author_name": "$top_author", "topics": ["$mesh_terms"]}),
+        ("get_genes_in_same_papers", {"target_gene": "$top_gene"}),
+    ]
+
+
+def _summary_text(prompt: str, tokens: int) -> str:
+    pmids = list(dict.fromkeys(_PMID_PATTERN.findall(prompt)))
+    citations = [f"(PMID: {pmid})" for pmid in pmids] or ["(no papers retrieved)"]
+    words = tokenize(_question(prompt)) or ["evidence"]
+    cycle = itertools.cycle(words)
+    findings = [f"{i}. {next(cycle)} {citation}" for i, citation in enumerate(citations, start=1)]
+    text = "### Key Findings\n" + "\n".join(findings) + "\n\n### Synthesis\n"
+    used = len(text.split())
+    return text + " ".join(next(cycle) for _ in range(max(0, tokens - used)))
+
+
+def create_app(config: FakeOpenAIConfig) -> FastAPI:
+    """Build the fake OpenAI application.
+
+    Args:
+        config: Simulated latency; read on every request, so it can be changed while running.
+
+    Returns:
+        The FastAPI app.
+    """
+    app = FastAPI(title="Fake OpenAI")
+    ids = itertools.count(1)
+
+    def usage(prompt: str, output_tokens: int) -> dict[str, int]:
+        input_tokens = _estimate_tokens(prompt)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def response_object(
+        body: dict[str, Any], output: list[dict[str, Any]], usage: dict[str, int]
+    ) -> dict:
+        return {
+            "id": f"resp_{next(ids)}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": body.get("model", "fake"),
+            "status": "completed",
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": body.get("tool_choice", "auto"),
+            "tools": body.get("tools", []),
+            "usage": usage,
+        }
+
+    def message_item(text: str) -> dict[str, Any]:
+        return {
+            "type": "message",
+            "id": f"msg_{next(ids)}",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }
+
+    @app.post("/v1/responses")
+    async def responses(request: Request) -> Any:
+        body = await request.json()
+        prompt = _prompt_text(body)
+        tool_names = {tool.get("name") for tool in body.get("tools") or []}
+
+        if not tool_names:
+            text = _summary_text(prompt, config.summary_tokens)
+            if body.get("stream"):
+                return StreamingResponse(
+                    _stream_text(body, prompt, text), media_type="text/event-stream"
+                )
+            await asyncio.sleep((config.ttft_ms + config.summary_tokens * config.output_token_ms) / 1000)
+            return response_object(body, [message_item(text)], usage(prompt, config.summary_tokens))
+
+        question = _question(prompt)
+        if "retrieve_papers_hybrid" in tool_names and "get_genes_in_same_papers" in tool_names:
+            calls = _planned_calls(question)
+        elif "retrieve_papers_hybrid" in tool_names:
+            calls = [_retrieval_call(question)]
+        else:
+            calls = _graph_calls(prompt)
+        output = [
+            {
+                "type": "function_call",
+                "id": f"fc_{next(ids)}",
+                "call_id": f"call_{next(ids)}",
+                "name": name,
+                "arguments": json.dumps(arguments),
+                "status": "completed",
+            }
+            for name, arguments in calls
+        ]
+        output_tokens = sum(_estimate_tokens(item["arguments"]) for item in output)
+        await asyncio.sleep((config.ttft_ms + output_tokens * config.output_token_ms) / 1000)
+        return response_object(body, output, usage(prompt, output_tokens))
+
+    async def _stream_text(body: dict[str, Any], prompt: str, text: str) -> AsyncIterator[str]:
+        def event(data: dict[str, Any]) -> str:
+            return f"event: {data['type']}\ndata: {json.dumps(data)}\n\n"
+
+        item = message_item("")
+        item_id = item["id"]
+        yield event(
+            {"type": "response.created", "sequence_number": 0, "response": response_object(body, [], {})}
+        )
+        await asyncio.sleep(config.ttft_ms / 1000)
+        words = text.split(" ")
+        chunk = config.stream_chunk_tokens
+        for sequence, start in enumerate(range(0, len(words), chunk), start=1):
+            delta = " ".join(words[start : start + chunk]) + " "
+            yield event(
+                {
+                    "type": "response.output_text.delta",
+                    "sequence_number": sequence,
+                    "item_id": item_id,
+                    "output_index": 0,
+                    "content_index": 0,
+                    "delta": delta,
+                    "logprobs": [],
+                }
+            )
+            await asyncio.sleep(len(words[start : start + chunk]) * config.output_token_ms / 1000)
+        completed = response_object(body, [message_item(text)], usage(prompt, len(words)))
+        yield event(
+            {"type": "response.completed", "sequence_number": len(words) + 1, "response": completed}
+        )
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request) -> dict[str, Any]:
+        body = await request.json()
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        dimensions = body.get("dimensions") or 3072
+        await asyncio.sleep(config.embedding_latency_ms / 1000)
+        data = []
+        for index, text in enumerate(texts):
+            vector: Any = hash_embedding(text, dimensions)
+            if body.get("encoding_format") == "base64":
+                vector = base64.b64encode(array("f", vector).tobytes()).decode()
+            data.append({"object": "embedding", "index": index, "embedding": vector})
+        tokens = sum(_estimate_tokens(text) for text in texts)
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "fake"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    return app
+
+
+class FakeOpenAIServer:
+    """Run the fake OpenAI app on a free local port in a background thread.
+
+    Usage:
+        with FakeOpenAIServer(FakeOpenAIConfig(ttft_ms=200)) as server:
+            client = OpenAI(api_key="benchmark", base_url=server.base_url)
+    """
+
+    def __init__(self, config: FakeOpenAIConfig | None = None, host: str = "127.0.0.1") -> None:
+        self.config = config or FakeOpenAIConfig()
+        self.host = host
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server = uvicorn.Server(
+            uvicorn.Config(create_app(self.config), log_level="warning", lifespan="off")
+        )
+        self._thread = threading.Thread(target=self._run, name="fake-openai", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to the OpenAI client."""
+        return f"http://{self.host}:{self._socket.getsockname()[1]}/v1"
+
+    def _run(self) -> None:
+        self._server.run(sockets=[self._socket])
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, 0))
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Fake OpenAI server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+        self._socket.close()
@@ -0,0 +1,222 @@
+"""
+In-process stand-ins for Qdrant and Neo4j used by the offline benchmarks.
+
+- `LocalQdrantVectorStore` runs the regular collection layout and queries in
+  Qdrant's local mode (`:memory:`); BM25 vectors are computed from hashed
+  tokens because local mode has no server-side `qdrant/bm25` inference.
+- `InMemoryGraphQuery` answers the Neo4j enrichment tools from Python
+  dictionaries built from the same dataset, with an optional simulated
+  round-trip latency per query.
+"""
+
+import time
+from collections import Counter, defaultdict
+from typing import Any
+
+from openai import AsyncOpenAI
+from pydantic import SecretStr
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import models
+
+from biomedical_graphrag.application.services.hybrid_service.neo4j_query import Neo4jGraphQuery
+from biomedical_graphrag.benchmarks.text_hashing import stable_hash, tokenize
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import AsyncQdrantVectorStore
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class LocalQdrantVectorStore(AsyncQdrantVectorStore):
+    """AsyncQdrantVectorStore backed by an in-memory local-mode Qdrant client."""
+
+    def __init__(self, openai_client: AsyncOpenAI) -> None:
+        self.url = ":memory:"
+        self.api_key = SecretStr("")
+        self.collection_name = settings.qdrant.collection_name
+        self.embedding_dimension = settings.qdrant.embedding_dimension
+        self.reranker_embedding_dimension = settings.qdrant.reranker_embedding_dimension
+        self.estimate_bm25_avg_len_on_x_docs = settings.qdrant.estimate_bm25_avg_len_on_x_docs
+        self.cloud_inference = False
+        self.openai_client = openai_client
+        self.client = AsyncQdrantClient(location=":memory:")
+
+    def _define_bm25_vectors(self, text: str, avg_len: int = 256) -> models.SparseVector:  # type: ignore[override]
+        """
+        BM25 term weights over hashed tokens; IDF is applied by the collection's modifier.
+        """
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        weights: dict[int, float] = {}
+        for token, tf in counts.items():
+            index = stable_hash(token) % (2**31)
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(avg_len, 1))
+            weights[index] = weights.get(index, 0.0) + tf * (BM25_K1 + 1) / (tf + norm)
+        return models.SparseVector(indices=list(weights), values=list(weights.values()))
+
+
+class InMemoryGraph:
+    """Paper, author, MeSH and gene relationships of a dataset, indexed for the enrichment tools.
+
+    Args:
+        pubmed_data: Data in the `pubmed_dataset.json` structure.
+        gene_data: Data in the `gene_dataset.json` structure.
+    """
+
+    def __init__(self, pubmed_data: dict[str, Any], gene_data: dict[str, Any] | None = None) -> None:
+        self.titles: dict[str, str] = {}
+        self.paper_terms: dict[str, set[str]] = {}
+        self.paper_authors: dict[str, list[str]] = {}
+        self.author_papers: dict[str, set[str]] = defaultdict(set)
+        self.term_papers: dict[str, set[str]] = defaultdict(set)
+        self.genes: dict[str, dict[str, Any]] = {}
+        self.paper_genes: dict[str, set[str]] = defaultdict(set)
+        relationships = 0
+        for paper in pubmed_data.get("papers", []):
+            pmid = paper["pmid"]
+            self.titles[pmid] = paper.get("title", "")
+            self.paper_terms[pmid] = {m["term"] for m in paper.get("mesh_terms", [])}
+            self.paper_authors[pmid] = [a["name"] for a in paper.get("authors", [])]
+            for name in self.paper_authors[pmid]:
+                self.author_papers[name].add(pmid)
+            for term in self.paper_terms[pmid]:
+                self.term_papers[term].add(pmid)
+            relationships += len(self.paper_terms[pmid]) + len(self.paper_authors[pmid])
+        for gene in (gene_data or {}).get("genes", []):
+            self.genes[gene["name"]] = gene
+            for pmid in gene.get("linked_pmids", []):
+                if pmid in self.titles:
+                    self.paper_genes[pmid].add(gene["name"])
+                    relationships += 1
+        self.counts = {
+            "nodes": len(self.titles)
+            + len(self.author_papers)
+            + len(self.term_papers)
+            + len(self.genes),
+            "relationships": relationships,
+        }
+
+    def matches_topics(self, pmid: str, topics: list[str], require_all: bool = False) -> bool:
+        """Whether the paper has MeSH terms containing the topics (case-insensitive)."""
+        terms = [term.lower() for term in self.paper_terms.get(pmid, ())]
+        hits = [any(topic.lower() in term for term in terms) for topic in topics]
+        return all(hits) if require_all else any(hits)
+
+
+class InMemoryGraphQuery(Neo4jGraphQuery):
+    """Neo4jGraphQuery answering the enrichment tools from an InMemoryGraph.
+
+    Args:
+        graph: The indexed dataset.
+        latency_ms: Simulated round trip added to every query.
+    """
+
+    def __init__(self, graph: InMemoryGraph, latency_ms: float = 0.0) -> None:
+        self.graph = graph
+        self.latency_ms = latency_ms
+
+    def _round_trip(self) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def query(self, cypher: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Raw Cypher is not supported by the in-memory graph."""
+        raise NotImplementedError("InMemoryGraphQuery only implements the enrichment tools")
+
+    def get_graph_counts(self) -> dict[str, int]:
+        """Get total node and relationship counts."""
+        self._round_trip()
+        return dict(self.graph.counts)
+
+    def score_authors(self, authors: list[str], mesh_terms: list[str]) -> list[dict[str, Any]]:
+        """Count each author's papers, restricted to the MeSH topics if any."""
+        self._round_trip()
+        topics = mesh_terms[:5]
+        results = []
+        for name in dict.fromkeys(authors[:30]):
+            papers = self.graph.author_papers.get(name, set())
+            if topics:
+                papers = {pmid for pmid in papers if self.graph.matches_topics(pmid, topics)}
+            if papers:
+                results.append({"author": name, "papers": len(papers)})
+        return sorted(results, key=lambda r: r["papers"], reverse=True)
+
+    def get_collaborators_with_topics(
+        self,
+        author_name: str,
+        topics: list[str],
+        require_all: bool = False,
+        exclude_pmids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get collaborators for an author filtered by MeSH topics."""
+        self._round_trip()
+        needle = author_name.lower()
+        shared: dict[str, set[str]] = defaultdict(set)
+        for name, pmids in self.graph.author_papers.items():
+            if needle not in name.lower():
+                continue
+            for pmid in pmids:
+                if not self.graph.matches_topics(pmid, topics, require_all):
+                    continue
+                for collaborator in self.graph.paper_authors[pmid]:
+                    if collaborator != name:
+                        shared[collaborator].add(pmid)
+        results = []
+        for collaborator, pmids in shared.items():
+            result: dict[str, Any] = {"collaborator": collaborator, "papers": len(pmids)}
+            if not require_all:
+                terms = {
+                    term
+                    for pmid in pmids
+                    for term in self.graph.paper_terms[pmid]
+                    if any(topic.lower() in term.lower() for topic in topics)
+                }
+                result["sample_topics"] = sorted(terms)[:3]
+            results.append(result)
+        return sorted(results, key=lambda r: (-r["papers"], r["collaborator"]))[:10]
+
+    def get_related_papers_by_mesh(
+        self,
+        pmid: str,
+        exclude_pmids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get papers related by MeSH terms to a given PMID."""
+        self._round_trip()
+        excluded = set(exclude_pmids or [])
+        shared: Counter[str] = Counter()
+        for term in self.graph.paper_terms.get(pmid, ()):
+            for other in self.graph.term_papers[term]:
+                if other != pmid and other not in excluded:
+                    shared[other] += 1
+        return [
+            {"pmid": other, "title": self.graph.titles[other], "shared_terms": count}
+            for other, count in shared.most_common(10)
+        ]
+
+    def get_genes_in_same_papers(
+        self, target_gene: str, mesh_filter: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Find genes co-mentioned in the same papers as the target gene."""
+        self._round_trip()
+        needle = target_gene.lower()
+        targets = {
+            name
+            for name, gene in self.graph.genes.items()
+            if needle in name.lower() or needle in (gene.get("aliases") or "").lower()
+        }
+        shared: dict[str, set[str]] = defaultdict(set)
+        for target in targets:
+            for pmid in self.graph.genes[target].get("linked_pmids", []):
+                if mesh_filter and not self.graph.matches_topics(pmid, [mesh_filter]):
+                    continue
+                for other in self.graph.paper_genes.get(pmid, ()):
+                    if other != target:
+                        shared[other].add(pmid)
+        ranked = sorted(shared.items(), key=lambda item: (-len(item[1]), item[0]))[:10]
+        return [
+            {"gene": gene, "shared_papers": len(pmids), "example_pmids": sorted(pmids)[:5]}
+            for gene, pmids in ranked
+        ]
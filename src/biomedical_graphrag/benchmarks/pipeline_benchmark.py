@@ -0,0 +1,309 @@
+"""
+Offline latency and throughput benchmark for the GraphRAG pipeline.
+
+Replays a synthetic question set through `run_tools_sequence_and_summarize` at a
+given concurrency, with every external service replaced by a local stand-in:
+- OpenAI: `FakeOpenAIServer` (real HTTP, simulated model latency);
+- Qdrant: local mode (`:memory:`) seeded through the regular ingestion code;
+- Neo4j: `InMemoryGraphQuery` over the same dataset.
+
+Reports exact p50/p95/p99 of the request latency and of every recorded phase
+(`result.metrics["phases"]`), plus throughput and token usage.
+
+No API keys are used, but the settings still need a (dummy) OpenAI key.
+
+Usage:
+    OPENAI__API_KEY=benchmark python -m biomedical_graphrag.benchmarks.pipeline_benchmark \
+        --requests 100 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from openai import AsyncOpenAI, OpenAI
+
+from biomedical_graphrag.application.services.hybrid_service import tool_calling
+from biomedical_graphrag.application.services.hybrid_service.qdrant_query import AsyncQdrantQuery
+from biomedical_graphrag.benchmarks.fake_openai import FakeOpenAIConfig, FakeOpenAIServer
+from biomedical_graphrag.benchmarks.local_backends import (
+    InMemoryGraph,
+    InMemoryGraphQuery,
+    LocalQdrantVectorStore,
+)
+from biomedical_graphrag.benchmarks.synthetic_data import generate_dataset, generate_questions
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.utils.logger_util import setup_logging
+
+logger = setup_logging()
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark workload.
+
+    Args:
+        requests: Number of questions replayed.
+        concurrency: Questions in flight at once.
+        papers: Size of the synthetic dataset.
+        limit: Papers retrieved per question.
+        planner: Use planner mode instead of one LLM call per phase.
+        answer_cache: Enable the semantic answer cache.
+        graph_latency_ms: Simulated Neo4j round trip per graph query.
+        seed: Seed for the dataset and the questions.
+    """
+
+    requests: int = 50
+    concurrency: int = 4
+    papers: int = 200
+    limit: int = 5
+    planner: bool = False
+    answer_cache: bool = False
+    graph_latency_ms: float = 5.0
+    seed: int = 7
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Exact percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Observations (need not be sorted).
+        q: Percentile in [0, 100].
+
+    Returns:
+        The percentile, or 0.0 for no observations.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class LatencyStats:
+    """Distribution of latencies, in milliseconds."""
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    max: float
+
+    @classmethod
+    def from_values(cls, values: list[float]) -> "LatencyStats":
+        """Summarize raw observations."""
+        return cls(
+            count=len(values),
+            p50=round(percentile(values, 50), 2),
+            p95=round(percentile(values, 95), 2),
+            p99=round(percentile(values, 99), 2),
+            mean=round(sum(values) / len(values), 2) if values else 0.0,
+            max=round(max(values), 2) if values else 0.0,
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Outcome of one benchmark run."""
+
+    config: BenchmarkConfig
+    openai: FakeOpenAIConfig
+    wall_seconds: float
+    errors: int
+    latency: LatencyStats
+    phases: dict[str, LatencyStats] = field(default_factory=dict)
+    tokens: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput_rps(self) -> float:
+        """Completed requests per second of wall time."""
+        return self.latency.count / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the report, including throughput, for JSON output."""
+        return {**asdict(self), "throughput_rps": round(self.throughput_rps, 3)}
+
+    def format(self) -> str:
+        """Render the report as a plain-text table."""
+        lines = [
+            f"requests={self.config.requests} concurrency={self.config.concurrency} "
+            f"planner={self.config.planner} answer_cache={self.config.answer_cache} "
+            f"errors={self.errors}",
+            f"wall={self.wall_seconds:.2f}s throughput={self.throughput_rps:.2f} req/s "
+            f"tokens in={self.tokens.get('input_tokens', 0)} out={self.tokens.get('output_tokens', 0)}",
+            "",
+            f"{'phase':<58}{'count':>7}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}",
+        ]
+        for name, stats in [("request", self.latency), *sorted(self.phases.items())]:
+            lines.append(
+                f"{name:<58}{stats.count:>7}{stats.p50:>10.1f}{stats.p95:>10.1f}"
+                f"{stats.p99:>10.1f}{stats.max:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+def phase_key(phase: dict[str, Any]) -> str:
+    """Name a recorded phase with its labels, e.g. `llm[step=route]`."""
+    labels = phase.get("labels") or {}
+    if not labels:
+        return phase["name"]
+    return f"{phase['name']}[{','.join(f'{k}={v}' for k, v in sorted(labels.items()))}]"
+
+
+@contextmanager
+def _override(target: object, **values: Any) -> Iterator[None]:
+    """Set attributes for the duration of the context, then restore them."""
+    previous = {name: getattr(target, name) for name in values}
+    for name, value in values.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(target, name, value)
+
+
+async def run_benchmark(
+    config: BenchmarkConfig, openai_config: FakeOpenAIConfig | None = None
+) -> BenchmarkReport:
+    """Seed the local stand-ins and replay the question set through the pipeline.
+
+    Args:
+        config: Workload.
+        openai_config: Simulated model latency.
+
+    Returns:
+        Latency distribution per request and per phase.
+    """
+    openai_config = openai_config or FakeOpenAIConfig()
+    pubmed_data, gene_data = generate_dataset(config.papers, seed=config.seed)
+    questions = generate_questions(config.requests, seed=config.seed)
+
+    with FakeOpenAIServer(openai_config) as server, ExitStack() as stack:
+        stack.enter_context(_override(settings.qdrant, cloud_inference=False))
+        stack.enter_context(_override(settings.graphrag, answer_cache_enabled=config.answer_cache))
+
+        # The pipeline's OpenAI clients were created at import time; point them at the fake server
+        api_key = settings.openai.api_key.get_secret_value() or "benchmark"
+        async_client = AsyncOpenAI(api_key=api_key, base_url=server.base_url)
+        store = LocalQdrantVectorStore(async_client)
+        graph = InMemoryGraph(pubmed_data, gene_data)
+        stack.enter_context(
+            _override(
+                tool_calling,
+                openai_client=OpenAI(api_key=api_key, base_url=server.base_url),
+                async_openai_client=async_client,
+            )
+        )
+        stack.enter_context(
+            _override(
+                tool_calling.backends,
+                qdrant=lambda: AsyncQdrantQuery(store),
+                neo4j=lambda: InMemoryGraphQuery(graph, latency_ms=config.graph_latency_ms),
+            )
+        )
+        tool_calling.answer_cache.clear()
+
+        try:
+            logger.info(f"Seeding local Qdrant with {config.papers} synthetic papers")
+            with _override(openai_config, embedding_latency_ms=0.0):
+                await store.create_collection()
+                await store.upsert_points(pubmed_data, gene_data, batch_size=max(config.papers, 1))
+
+            semaphore = asyncio.Semaphore(config.concurrency)
+
+            async def run_one(question: str) -> dict[str, Any] | None:
+                async with semaphore:
+                    try:
+                        result = await tool_calling.run_tools_sequence_and_summarize(
+                            question, limit=config.limit, planner=config.planner
+                        )
+                    except Exception as e:
+                        logger.error(f"Benchmark request failed for '{question}': {e}")
+                        return None
+                    return result.metrics
+
+            logger.info(f"Replaying {len(questions)} questions at concurrency {config.concurrency}")
+            start = time.perf_counter()
+            outcomes = await asyncio.gather(*(run_one(question) for question in questions))
+            wall_seconds = time.perf_counter() - start
+        finally:
+            await store.close()
+            await async_client.close()
+
+    metrics = [m for m in outcomes if m is not None]
+    phases: dict[str, list[float]] = defaultdict(list)
+    for request in metrics:
+        for recorded in request.get("phases", []):
+            phases[phase_key(recorded)].append(recorded["duration_ms"])
+    return BenchmarkReport(
+        config=config,
+        openai=openai_config,
+        wall_seconds=round(wall_seconds, 3),
+        errors=len(outcomes) - len(metrics),
+        latency=LatencyStats.from_values([m["latency_ms"] for m in metrics]),
+        phases={name: LatencyStats.from_values(values) for name, values in phases.items()},
+        tokens={
+            "input_tokens": sum(m["usage"]["input_tokens"] for m in metrics),
+            "output_tokens": sum(m["usage"]["output_tokens"] for m in metrics),
+        },
+    )
+
+
+def main() -> None:
+    """Run the benchmark from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Offline GraphRAG pipeline benchmark")
+    parser.add_argument("--requests", type=int, default=50, help="Number of questions to replay")
+    parser.add_argument("--concurrency", type=int, default=4, help="Questions in flight at once")
+    parser.add_argument("--papers", type=int, default=200, help="Synthetic dataset size")
+    parser.add_argument("--limit", type=int, default=5, help="Papers retrieved per question")
+    parser.add_argument("--planner", action="store_true", help="Use planner mode")
+    parser.add_argument("--answer-cache", action="store_true", help="Enable the semantic answer cache")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for dataset and questions")
+    parser.add_argument("--ttft-ms", type=float, default=400.0, help="Simulated LLM time to first token")
+    parser.add_argument(
+        "--output-token-ms", type=float, default=8.0, help="Simulated LLM time per token"
+    )
+    parser.add_argument("--embedding-ms", type=float, default=60.0, help="Simulated embeddings latency")
+    parser.add_argument("--graph-ms", type=float, default=5.0, help="Simulated Neo4j round trip")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run_benchmark(
+            BenchmarkConfig(
+                requests=args.requests,
+                concurrency=args.concurrency,
+                papers=args.papers,
+                limit=args.limit,
+                planner=args.planner,
+                answer_cache=args.answer_cache,
+                graph_latency_ms=args.graph_ms,
+                seed=args.seed,
+            ),
+            FakeOpenAIConfig(
+                ttft_ms=args.ttft_ms,
+                output_token_ms=args.output_token_ms,
+                embedding_latency_ms=args.embedding_ms,
+            ),
+        )
+    )
+    print(report.format())
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
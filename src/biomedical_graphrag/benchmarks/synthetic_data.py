@@ -0,0 +1,195 @@
+"""
+Deterministic synthetic PubMed and Gene datasets for offline benchmarks.
+
+The datasets use the same JSON structure as `pubmed_dataset.json` and
+`gene_dataset.json`, so they can be ingested by the regular Qdrant code and
+loaded into the in-memory graph.
+"""
+
+import random
+from typing import Any
+
+TOPICS: dict[str, list[str]] = {
+    "HIV Infections": ["hiv", "antiretroviral", "viral", "load", "cd4", "transmission"],
+    "Neoplasms": ["tumor", "cancer", "metastasis", "oncogenic", "proliferation", "carcinoma"],
+    "Breast Neoplasms": ["breast", "mammary", "estrogen", "her2", "mastectomy", "brca"],
+    "Alzheimer Disease": ["amyloid", "tau", "dementia", "cognitive", "neurodegeneration", "plaques"],
+    "Diabetes Mellitus, Type 2": ["insulin", "glucose", "glycemic", "pancreatic", "beta", "resistance"],
+    "Tuberculosis": ["mycobacterium", "tuberculosis", "granuloma", "latent", "bacillus", "isoniazid"],
+    "Influenza, Human": ["influenza", "hemagglutinin", "vaccine", "respiratory", "strain", "antigenic"],
+    "Apoptosis": ["apoptosis", "caspase", "programmed", "death", "mitochondrial", "cleavage"],
+    "Inflammation": ["inflammatory", "cytokine", "macrophage", "interleukin", "immune", "signaling"],
+    "Obesity": ["adipose", "obesity", "weight", "leptin", "metabolic", "lipid"],
+    "Hypertension": ["blood", "pressure", "vascular", "angiotensin", "renal", "cardiovascular"],
+    "Receptors, CCR5": ["ccr5", "chemokine", "coreceptor", "entry", "delta32", "maraviroc"],
+}
+
+GENES: dict[str, str] = {
+    "CCR5": "C-C motif chemokine receptor 5",
+    "TP53": "tumor protein p53",
+    "BRCA1": "BRCA1 DNA repair associated",
+    "APOE": "apolipoprotein E",
+    "INS": "insulin",
+    "TNF": "tumor necrosis factor",
+    "IL6": "interleukin 6",
+    "EGFR": "epidermal growth factor receptor",
+    "KRAS": "KRAS proto-oncogene, GTPase",
+    "MYC": "MYC proto-oncogene, bHLH transcription factor",
+    "CD4": "CD4 molecule",
+    "ACE2": "angiotensin converting enzyme 2",
+}
+
+FILLER = [
+    "we",
+    "observed",
+    "significant",
+    "association",
+    "between",
+    "patients",
+    "cohort",
+    "study",
+    "analysis",
+    "results",
+    "expression",
+    "levels",
+    "clinical",
+    "samples",
+    "increased",
+    "reduced",
+    "treatment",
+    "response",
+    "risk",
+    "model",
+    "mechanism",
+    "pathway",
+    "role",
+    "novel",
+    "evidence",
+    "suggests",
+    "findings",
+    "data",
+    "compared",
+    "control",
+    "group",
+]
+
+FIRST_NAMES = [
+    "Anna",
+    "Ben",
+    "Chen",
+    "Diego",
+    "Eva",
+    "Farah",
+    "Goran",
+    "Hana",
+    "Ivan",
+    "Julia",
+    "Kenji",
+    "Lea",
+]
+LAST_NAMES = ["Smith", "Garcia", "Wang", "Müller", "Rossi", "Kim", "Novak", "Silva", "Ahmed", "Dubois"]
+JOURNALS = [
+    "J Virol",
+    "Nature Medicine",
+    "Cell Reports",
+    "Lancet Infect Dis",
+    "Diabetologia",
+    "Oncogene",
+]
+
+QUESTION_TEMPLATES = [
+    "Which genes are mentioned in the same papers as {gene}?",
+    "What is the role of {gene} in {topic}?",
+    "Who are the main collaborators working on {topic}?",
+    "Summarize recent findings on {topic} and {other_topic}.",
+    "Find papers about {topic} but not about {other_topic}.",
+]
+
+
+def generate_dataset(papers: int = 200, seed: int = 7) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Generate a PubMed dataset and a Gene dataset linked to its papers.
+
+    Args:
+        papers: Number of papers to generate.
+        seed: Random seed; equal seeds give identical datasets.
+
+    Returns:
+        The PubMed data (`{"papers": [...]}`) and the Gene data (`{"genes": [...]}`).
+    """
+    rng = random.Random(seed)
+    topics = list(TOPICS)
+    authors = [(first, last) for first in FIRST_NAMES for last in LAST_NAMES][: max(10, papers // 2)]
+    gene_pmids: dict[str, list[str]] = {gene: [] for gene in GENES}
+
+    paper_records = []
+    for i in range(papers):
+        pmid = str(30_000_000 + i)
+        paper_topics = rng.sample(topics, k=rng.randint(1, 3))
+        paper_genes = rng.sample(list(GENES), k=rng.randint(0, 3))
+        keywords = [word for topic in paper_topics for word in TOPICS[topic]] + [
+            gene.lower() for gene in paper_genes
+        ]
+        words = [
+            rng.choice(keywords if rng.random() < 0.3 else FILLER) for _ in range(rng.randint(120, 260))
+        ]
+        team = rng.sample(authors, k=rng.randint(2, 6))
+        paper_records.append(
+            {
+                "pmid": pmid,
+                "title": f"{' and '.join(paper_topics)}: {' '.join(rng.sample(keywords, k=3))}",
+                "abstract": " ".join(words).capitalize() + ".",
+                "authors": [
+                    {
+                        "name": f"{first} {last}",
+                        "first_name": first,
+                        "last_name": last,
+                        "affiliations": [f"{last} Institute"],
+                    }
+                    for first, last in team
+                ],
+                "mesh_terms": [
+                    {"term": topic, "ui": f"D{topics.index(topic):06d}", "major_topic": j == 0}
+                    for j, topic in enumerate(paper_topics)
+                ],
+                "publication_date": f"{rng.randint(2015, 2025)}-{rng.randint(1, 12):02d}-01",
+                "journal": rng.choice(JOURNALS),
+                "doi": f"10.1000/synthetic.{pmid}",
+            }
+        )
+        for gene in paper_genes:
+            gene_pmids[gene].append(pmid)
+
+    gene_records = [
+        {
+            "gene_id": str(1000 + i),
+            "name": gene,
+            "description": description,
+            "organism": "Homo sapiens",
+            "aliases": f"{gene}-ALT",
+            "linked_pmids": gene_pmids[gene],
+        }
+        for i, (gene, description) in enumerate(GENES.items())
+    ]
+    return {"papers": paper_records}, {"genes": gene_records}
+
+
+def generate_questions(count: int, seed: int = 7) -> list[str]:
+    """Generate benchmark questions about the synthetic topics and genes.
+
+    Args:
+        count: Number of questions.
+        seed: Random seed; equal seeds give identical questions.
+
+    Returns:
+        The questions; the same question may appear more than once.
+    """
+    rng = random.Random(seed)
+    topics = list(TOPICS)
+    questions = []
+    for _ in range(count):
+        topic, other_topic = rng.sample(topics, k=2)
+        template = rng.choice(QUESTION_TEMPLATES)
+        questions.append(
+            template.format(gene=rng.choice(list(GENES)), topic=topic, other_topic=other_topic)
+        )
+    return questions
@@ -0,0 +1,38 @@
+"""Deterministic text features (hashed embeddings and token ids) for the offline stand-ins."""
+
+import hashlib
+import math
+import re
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of `text`."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def stable_hash(token: str) -> int:
+    """64-bit hash of a token that, unlike `hash()`, is the same in every process."""
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def hash_embedding(text: str, dimensions: int) -> list[float]:
+    """Unit-length bag-of-words embedding: texts sharing tokens get similar vectors.
+
+    Args:
+        text: Input text.
+        dimensions: Vector size.
+
+    Returns:
+        The embedding; all zeros except one dimension for texts without tokens.
+    """
+    vector = [0.0] * dimensions
+    for token in tokenize(text):
+        h = stable_hash(token)
+        vector[h % dimensions] += 1.0 if (h >> 63) else -1.0
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        vector[0] = 1.0
+        return vector
+    return [v / norm for v in vector]
@@ -1,5 +1,5 @@
 import os
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +16,9 @@ class OpenAISettings(BaseModel):
         default=0.0, description="LLM temperature for OpenAI queries (0 for consistency)"
     )
     max_tokens: int = Field(default=1500, description="Maximum number of tokens for OpenAI queries")
+    base_url: str | None = Field(
+        default=None, description="Base URL of an OpenAI-compatible API (defaults to api.openai.com)"
+    )
 
 
 class Neo4jSettings(BaseModel):
@@ -23,6 +26,9 @@ class Neo4jSettings(BaseModel):
     username: str = Field(default="neo4j", description="Username for Neo4j database")
     password: SecretStr = Field(default=SecretStr(""), description="Password for Neo4j database")
     database: str = Field(default="neo4j", description="Database name for Neo4j database")
+    stats_ttl_seconds: int = Field(
+        default=300, description="Seconds before cached graph statistics are refreshed in the background"
+    )
 
 
 class QdrantSettings(BaseModel):
@@ -53,6 +59,39 @@ class QdrantSettings(BaseModel):
 class PubMedSettings(BaseModel):
     email: SecretStr = Field(default=SecretStr(""), description="Email for PubMed API")
     api_key: SecretStr = Field(default=SecretStr(""), description="API key for PubMed API")
+    requests_per_second: float | None = Field(
+        default=None,
+        description="Entrez request rate; unset uses NCBI's limit (10/s with an API key, 3/s without)",
+    )
+    burst: int = Field(
+        default=3, description="Entrez requests that can be sent back to back after idling"
+    )
+    rate_limit_recovery_seconds: float = Field(
+        default=30.0, description="Time to return to the full Entrez rate after a 429 response"
+    )
+    rate_limit_state_path: str = Field(
+        default="",
+        description="File through which collectors share one Entrez rate limit (empty: per process)",
+    )
+    max_tries: int = Field(
+        default=3, description="Attempts per Entrez request on a 429, server or network error"
+    )
+    cache_enabled: bool = Field(
+        default=True, description="Cache raw Entrez responses on disk so reruns skip the network"
+    )
+    cache_dir: str = Field(
+        default="data/entrez_cache", description="Directory of the Entrez response cache"
+    )
+    cache_max_mb: int = Field(
+        default=1024, description="Size of the Entrez response cache before old entries are evicted"
+    )
+    cache_ttl_seconds: dict[str, float] = Field(
+        default={"esearch": 86400, "elink": 604800, "efetch": 2592000, "esummary": 2592000},
+        description="How long cached responses stay fresh, per E-utility",
+    )
+    offline: bool = Field(
+        default=False, description="Serve Entrez requests only from the cache, failing on a miss"
+    )
 
 
 class JsonDataSettings(BaseModel):
@@ -62,6 +101,81 @@ class JsonDataSettings(BaseModel):
     gene_json_path: str = Field(
         default="data/gene_dataset.json", description="Path to the Gene JSON dataset"
     )
+    pubmed_checkpoint_path: str = Field(
+        default="data/pubmed_collection.jsonl",
+        description="Journal an interrupted PubMed collection resumes from",
+    )
+    pubmed_enrichment_journal_path: str = Field(
+        default="data/pubmed_enrichment.jsonl",
+        description="Journal of enrichment batches not yet compacted into the PubMed dataset",
+    )
+
+
+class GraphRAGSettings(BaseModel):
+    planner_mode: bool = Field(
+        default=False,
+        description="Plan retrieval and graph tools in a single LLM call instead of one call per phase",
+    )
+    context_token_budget: int = Field(
+        default=6000, description="Approximate token budget for the fusion summary evidence"
+    )
+    context_min_abstract_tokens: int = Field(
+        default=120,
+        description="Tokens every abstract keeps before higher-ranked papers get the rest of the budget",
+    )
+    coalesce_requests: bool = Field(
+        default=True,
+        description="Let identical concurrent /api/graphrag-query requests share one pipeline run",
+    )
+    answer_cache_enabled: bool = Field(
+        default=False, description="Reuse answers of semantically similar past questions"
+    )
+    answer_cache_threshold: float = Field(
+        default=0.95, description="Minimum cosine similarity between questions for a cache hit"
+    )
+    answer_cache_ttl_seconds: int = Field(default=3600, description="Lifetime of a cached answer")
+    answer_cache_max_entries: int = Field(default=256, description="Cached answers kept (LRU eviction)")
+    answer_cache_dimensions: int = Field(
+        default=256, description="MRL dimensions of the question embeddings used for cache lookups"
+    )
+    answer_cache_version_check_seconds: int = Field(
+        default=60,
+        description="How often to check Qdrant/Neo4j counts and drop the cache when the data changed",
+    )
+    batch_concurrency: int = Field(
+        default=8, description="Questions of a batch request processed concurrently"
+    )
+    batch_max_queries: int = Field(default=100, description="Maximum questions per batch request")
+    max_concurrent_requests: int = Field(
+        default=8, description="GraphRAG pipelines the API server runs at the same time"
+    )
+    max_queued_requests: int = Field(
+        default=32, description="Requests allowed to wait for a pipeline slot before new ones get a 503"
+    )
+    queue_timeout_seconds: float = Field(
+        default=10.0, description="Longest a request waits for a pipeline slot before it gets a 503"
+    )
+    trace_level: Literal["names", "counts", "full"] = Field(
+        default="full",
+        description="Default trace detail in search responses: tool names, counts or full results",
+    )
+    gzip_minimum_bytes: int = Field(
+        default=1000, description="Gzip responses of at least this many bytes when the client accepts it"
+    )
+    page_cursor_ttl_seconds: int = Field(
+        default=900, description="How long a result-page cursor stays valid after its last page"
+    )
+    page_cursor_max_entries: int = Field(
+        default=256, description="Paged searches kept (LRU eviction); each holds its query embeddings"
+    )
+    page_max_depth: int = Field(default=100, description="Deepest result reachable by paging a search")
+    job_workers: int = Field(
+        default=4, description="Background search jobs run at the same time, each in a pipeline slot"
+    )
+    job_max_pending: int = Field(
+        default=64, description="Search jobs allowed to wait for a worker before new ones get a 503"
+    )
+    job_ttl_seconds: int = Field(default=3600, description="How long a finished job's result is kept")
 
 
 class Settings(BaseSettings):
@@ -84,6 +198,7 @@ class Settings(BaseSettings):
     qdrant: QdrantSettings = QdrantSettings()
     pubmed: PubMedSettings = PubMedSettings()
     json_data: JsonDataSettings = JsonDataSettings()
+    graphrag: GraphRAGSettings = GraphRAGSettings()
 
     @model_validator(mode="after")
     def validate_json_path(self) -> "Settings":
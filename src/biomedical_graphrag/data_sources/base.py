@@ -1,17 +1,183 @@
 import asyncio
+import io
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
+from urllib.error import HTTPError, URLError
 
 from Bio import Entrez
 
 from biomedical_graphrag.config import settings
 from biomedical_graphrag.domain.paper import Paper
+from biomedical_graphrag.utils.disk_cache_util import DiskCache
 from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.rate_limit_util import TokenBucket, ncbi_rate
 
 logger = setup_logging()
 
-_GLOBAL_RATE_LOCK = asyncio.Lock()
-_LAST_REQUEST_TIME = 0.0
+_ENTREZ_LIMITER: TokenBucket | None = None
+_ENTREZ_CACHE: DiskCache | None = None
+
+
+class EntrezOfflineError(LookupError):
+    """Offline mode is on and the response is not in the cache."""
+
+
+def entrez_rate_limiter() -> TokenBucket:
+    """The token bucket shared by every Entrez request of this process.
+
+    The rate defaults to NCBI's limit for the configured API key; with
+    `PUBMED__RATE_LIMIT_STATE_PATH` set, processes using the same file share it.
+    Biopython's own retries are turned off so a 429 reaches the limiter at once;
+    `entrez_call` retries instead.
+    """
+    global _ENTREZ_LIMITER
+    if _ENTREZ_LIMITER is None:
+        pubmed = settings.pubmed
+        Entrez.max_tries = 1
+        rate = pubmed.requests_per_second or ncbi_rate(pubmed.api_key.get_secret_value())
+        _ENTREZ_LIMITER = TokenBucket(
+            rate=rate,
+            burst=pubmed.burst,
+            recovery_seconds=pubmed.rate_limit_recovery_seconds,
+            state_path=pubmed.rate_limit_state_path or None,
+        )
+        logger.info(f"Entrez rate limit: {rate:g} req/s, burst {pubmed.burst}")
+    return _ENTREZ_LIMITER
+
+
+async def entrez_call[T](request: Callable[[], T]) -> T:
+    """Run one blocking Entrez request in a thread once the rate limiter allows it.
+
+    A 429 slows the limiter down before the request is retried; server errors are
+    retried straight away and network errors after `Entrez.sleep_between_tries`,
+    up to `PUBMED__MAX_TRIES` attempts in all.
+
+    Args:
+        request: Makes exactly one E-utilities request and parses its response.
+
+    Returns:
+        What `request` returns.
+
+    Raises:
+        Whatever the last attempt of `request` raises; other 4xx errors are not retried.
+    """
+    limiter = entrez_rate_limiter()
+    max_tries = max(settings.pubmed.max_tries, 1)
+    attempt = 0
+    while True:
+        attempt += 1
+        await limiter.acquire()
+        try:
+            return await asyncio.to_thread(_without_biopython_delay, request)
+        except HTTPError as e:
+            if e.code == 429:
+                await limiter.throttled()
+            elif e.code < 500:
+                raise
+            if attempt == max_tries:
+                raise
+            logger.warning(f"Entrez request failed with HTTP {e.code}; retry {attempt}/{max_tries - 1}")
+        except URLError as e:
+            if attempt == max_tries:
+                raise
+            logger.warning(f"Entrez request failed: {e.reason}; retry {attempt}/{max_tries - 1}")
+            await asyncio.sleep(Entrez.sleep_between_tries)
+
+
+def _without_biopython_delay[T](request: Callable[[], T]) -> T:
+    # Bio.Entrez spaces requests by a fixed per-process delay (0.1 s with an API key,
+    # 0.37 s without); the token bucket already paces them and would lose its burst
+    Entrez._open.previous = 0
+    return request()
+
+
+def entrez_cache() -> DiskCache | None:
+    """The on-disk Entrez response cache, or None when it is disabled."""
+    global _ENTREZ_CACHE
+    pubmed = settings.pubmed
+    if not pubmed.cache_enabled:
+        return None
+    if _ENTREZ_CACHE is None:
+        _ENTREZ_CACHE = DiskCache(pubmed.cache_dir, max_bytes=pubmed.cache_max_mb * 1024 * 1024)
+    return _ENTREZ_CACHE
+
+
+async def entrez_fetch(endpoint: str, cacheable: bool = True, **params: Any) -> bytes:
+    """Make one E-utilities request and return its raw response, going through the cache.
+
+    Responses are cached under the endpoint and its parameters (the API key and
+    email are not part of the key) and stay fresh for the endpoint's TTL in
+    `PUBMED__CACHE_TTL_SECONDS`; offline, any cached response is served regardless
+    of age. Only cache misses count against the rate limit, and a response whose
+    body is an NCBI error is never cached.
+
+    Args:
+        endpoint: The Bio.Entrez function, e.g. "efetch".
+        cacheable: False for requests tied to a history-server session (WebEnv).
+        **params: The request parameters.
+
+    Returns:
+        The response body.
+
+    Raises:
+        EntrezOfflineError: Offline mode is on and the response is not cached.
+    """
+    data, _ = await _entrez_request(endpoint, cacheable, params, parse=None)
+    return data
+
+
+async def entrez_read(endpoint: str, cacheable: bool = True, **params: Any) -> Any:
+    """Like `entrez_fetch`, parsing the XML response with `Entrez.read` (in a thread).
+
+    The response is cached only once it parsed, so an error body (which `Entrez.read`
+    raises on) is fetched again next time.
+    """
+    _, record = await _entrez_request(endpoint, cacheable, params, parse=_parse_entrez_xml)
+    return record
+
+
+def _parse_entrez_xml(data: bytes) -> Any:
+    return Entrez.read(io.BytesIO(data))
+
+
+def _is_error_body(data: bytes) -> bool:
+    # NCBI reports some failures as a 200 whose body is (or ends in) an <ERROR> element
+    return b"<ERROR>" in data[:1024] or b"<ERROR>" in data[-1024:]
+
+
+async def _entrez_request(
+    endpoint: str, cacheable: bool, params: dict[str, Any], parse: Callable[[bytes], Any] | None
+) -> tuple[bytes, Any]:
+    """Cached E-utilities request; returns the body and, with `parse`, its parsed form."""
+    cache = entrez_cache() if cacheable else None
+    key = f"{endpoint}?{json.dumps(params, sort_keys=True, default=str)}"
+    offline = settings.pubmed.offline
+    if cache is not None:
+        ttl = None if offline else settings.pubmed.cache_ttl_seconds.get(endpoint)
+        cached = await asyncio.to_thread(cache.get, key, ttl)
+        if cached is not None:
+            return cached, await asyncio.to_thread(parse, cached) if parse else None
+    if offline:
+        raise EntrezOfflineError(f"Offline and not cached: {key}")
+
+    def _request() -> bytes:
+        handle = getattr(Entrez, endpoint)(**params)
+        data = handle.read()
+        handle.close()
+        # Plain-text responses (e.g. rettype=uilist) come back decoded
+        return data.encode() if isinstance(data, str) else data
+
+    data = await entrez_call(_request)
+    # Parse before caching: a body that fails to parse is not kept
+    parsed = await asyncio.to_thread(parse, data) if parse else None
+    if cache is not None:
+        if parse is None and _is_error_body(data):
+            logger.warning(f"Not caching NCBI error response for {key}")
+        else:
+            await asyncio.to_thread(cache.put, key, data)
+    return data, parsed
 
 
 class BaseDataSource(ABC):
@@ -29,16 +195,6 @@ class BaseDataSource(ABC):
         if self.api_key:
             Entrez.api_key = str(self.api_key)  # type: ignore[assignment]
 
-    async def _rate_limit(self) -> None:
-        """Global rate limiter: ensures max 10 requests per second across all sources."""
-        global _LAST_REQUEST_TIME
-        async with _GLOBAL_RATE_LOCK:
-            now = asyncio.get_event_loop().time()
-            time_since_last = now - _LAST_REQUEST_TIME
-            if time_since_last < 1.0 / 8.0:  # 10 requests per second
-                await asyncio.sleep((1.0 / 8.0) - time_since_last)
-            _LAST_REQUEST_TIME = asyncio.get_event_loop().time()
-
     async def search(self, query: str, max_results: int) -> list[str]:
         """Optional: Search the underlying source and return a list of IDs.
 
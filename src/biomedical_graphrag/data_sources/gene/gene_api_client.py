@@ -1,8 +1,7 @@
 import asyncio
 import random
 
-from Bio import Entrez
-
+from biomedical_graphrag.data_sources.base import entrez_read
 from biomedical_graphrag.utils.logger_util import setup_logging
 
 logger = setup_logging()
@@ -18,79 +17,66 @@ class GeneAPIClient:
         # Entrez globals configured by collectors via BaseDataSource
         ...
 
-    async def elink_pubmed_to_gene(self, pmids: list[str]) -> dict[str, list[str]]:
+    async def elink_pubmed_to_gene(
+        self,
+        pmids: list[str],
+        chunk_size: int = 50,
+        concurrency: int = 4,
+        max_retries: int = 3,
+    ) -> dict[str, list[str]]:
         """
         Map PubMed PMIDs to GeneIDs using Entrez elink (dbfrom=pubmed, db=gene) (async).
+
+        Chunks are resolved concurrently; the shared Entrez rate limiter paces the
+        requests. A chunk that fails is split in half until the failing PMIDs are
+        isolated, and a single PMID is retried with backoff before it is skipped.
         Returns a dict {pmid: [gene_id, ...]}.
         """
         if not pmids:
             return {}
 
-        chunk_size = 50
-        max_retries = 3
         base_backoff = 0.8
-
+        semaphore = asyncio.Semaphore(concurrency)
         pmid_to_genes: dict[str, list[str]] = {}
-        for start in range(0, len(pmids), chunk_size):
-            chunk = pmids[start : start + chunk_size]
-            attempt = 0
-            while True:
-                try:
+        done = 0
+        failed = 0
 
-                    def _elink(chunk_ids: list[str] = chunk) -> list:
-                        handle = Entrez.elink(dbfrom="pubmed", db="gene", id=",".join(chunk_ids))
-                        record = Entrez.read(handle)
-                        handle.close()
-                        return record
-
-                    record = await asyncio.to_thread(_elink)
-                    break
-                except Exception:
-                    attempt += 1
-                    if attempt > max_retries:
-                        record = []
-                        # Fallback to per-ID
-                        for pmid in chunk:
-                            per_attempt = 0
-                            while True:
-                                try:
-
-                                    def _single_elink(pmid_id: str = pmid) -> list:
-                                        h = Entrez.elink(dbfrom="pubmed", db="gene", id=pmid_id)
-                                        single = Entrez.read(h)
-                                        h.close()
-                                        return single
-
-                                    single = await asyncio.to_thread(_single_elink)
-                                    record.extend(single)
-                                    break
-                                except Exception:
-                                    per_attempt += 1
-                                    if per_attempt > max_retries:
-                                        break
-                                    await asyncio.sleep(
-                                        base_backoff * (2 ** (per_attempt - 1))
-                                        + random.SystemRandom().uniform(0, 0.4)
-                                    )
-                        break
+        async def request(chunk: list[str]) -> list | None:
+            attempts = 1 + (max_retries if len(chunk) == 1 else 0)
+            for attempt in range(1, attempts + 1):
+                try:
+                    async with semaphore:
+                        return await _elink_genes(chunk)
+                except Exception as e:
+                    if attempt == attempts:
+                        if len(chunk) == 1:
+                            logger.error(f"elink pubmed->gene failed for PMID={chunk[0]}: {e}")
+                        else:
+                            logger.warning(
+                                f"elink pubmed->gene failed for {len(chunk)} PMIDs: {e}; splitting"
+                            )
+                        return None
                     await asyncio.sleep(
                         base_backoff * (2 ** (attempt - 1)) + random.SystemRandom().uniform(0, 0.4)
                     )
-
-            for r in record:
-                id_list = r.get("IdList", [])
-                pmid = id_list[0] if id_list else ""
-                if not pmid:
-                    continue
-                genes: list[str] = []
-                for linkdb in r.get("LinkSetDb", []):
-                    if linkdb.get("DbTo") == "gene":
-                        genes.extend(
-                            [link.get("Id", "") for link in linkdb.get("Link", []) if link.get("Id")]
-                        )
-                pmid_to_genes[str(pmid)] = sorted(set(genes))
-            await asyncio.sleep(0.3)
-
+            return None
+
+        async def resolve(chunk: list[str]) -> None:
+            nonlocal done, failed
+            record = await request(chunk)
+            if record is None and len(chunk) > 1:
+                middle = len(chunk) // 2
+                await asyncio.gather(resolve(chunk[:middle]), resolve(chunk[middle:]))
+                return
+            if record is None:
+                failed += 1
+            else:
+                _merge_gene_links(pmid_to_genes, record)
+            done += len(chunk)
+            logger.info(f"Resolved genes for {done}/{len(pmids)} PMIDs ({failed} failed)")
+
+        chunks = [pmids[start : start + chunk_size] for start in range(0, len(pmids), chunk_size)]
+        await asyncio.gather(*(resolve(chunk) for chunk in chunks))
         return pmid_to_genes
 
     async def fetch_genes(self, gene_ids: list[str]) -> list[dict]:
@@ -109,32 +95,39 @@ class GeneAPIClient:
             chunk = gene_ids[i : i + chunk_size]
             chunk_num = (i // chunk_size) + 1
             
-            def _fetch(ids_chunk: list[str] = chunk) -> list[dict]:
-                ids = ",".join(ids_chunk)
-                handle = Entrez.esummary(db="gene", id=ids, retmode="xml")
-                records = Entrez.read(handle)
-                handle.close()
-
+            try:
+                records = await entrez_read("esummary", db="gene", id=",".join(chunk), retmode="xml")
                 # Normalize possible wrapper structures
                 if isinstance(records, dict) and "DocumentSummarySet" in records:
-                    summaries = records["DocumentSummarySet"]["DocumentSummary"]
+                    chunk_summaries = records["DocumentSummarySet"]["DocumentSummary"]
                 elif isinstance(records, list):
-                    summaries = records
+                    chunk_summaries = records
                 else:
-                    summaries = [records]
-
-                return summaries
-
-            try:
-                chunk_summaries = await asyncio.to_thread(_fetch)
+                    chunk_summaries = [records]
                 all_summaries.extend(chunk_summaries)
                 logger.info(f"Fetched gene summaries batch {chunk_num}/{total_chunks} ({len(chunk_summaries)} genes)")
             except Exception as e:
                 logger.warning(f"Failed to fetch gene batch {chunk_num}/{total_chunks}: {e}")
-            
-            # Rate limit between batches
-            await asyncio.sleep(0.35)
         
         logger.info(f"Fetched {len(all_summaries)} total gene summaries from {total_chunks} batches.")
         return all_summaries
 
+
+
+async def _elink_genes(pmids: list[str]) -> list:
+    # A list (not a comma-joined string) becomes repeated id parameters: one link set per PMID
+    return await entrez_read("elink", dbfrom="pubmed", db="gene", id=list(pmids))
+
+
+def _merge_gene_links(pmid_to_genes: dict[str, list[str]], record: list) -> None:
+    """Add the GeneIDs of an elink response to `pmid_to_genes`, keyed by source PMID."""
+    for r in record:
+        id_list = r.get("IdList", [])
+        pmid = id_list[0] if id_list else ""
+        if not pmid:
+            continue
+        genes: list[str] = []
+        for linkdb in r.get("LinkSetDb", []):
+            if linkdb.get("DbTo") == "gene":
+                genes.extend([link.get("Id", "") for link in linkdb.get("Link", []) if link.get("Id")])
+        pmid_to_genes[str(pmid)] = sorted(set(genes))
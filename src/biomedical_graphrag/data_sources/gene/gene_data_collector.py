@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import json
 from datetime import datetime
@@ -41,13 +42,22 @@ class GeneDataCollector(BaseDataSource):
         Returns:
             list[dict[str, Any]]: List of gene entities.
         """
-        await self._rate_limit()
         return await self.api.fetch_genes(entity_ids)
 
-    async def collect_dataset(self, query: str = "", max_results: int = 0) -> GeneDataset:
+    async def collect_dataset(
+        self, query: str = "", max_results: int = 0, incremental: bool = False
+    ) -> GeneDataset:
         """
         Collect gene metadata by resolving GeneIDs from PubMed PMIDs (async).
 
+        In incremental mode the existing gene dataset is loaded and only PMIDs it has
+        not resolved yet are sent to elink; summaries are fetched only for GeneIDs it
+        does not hold, and new links are merged into the existing records.
+
+        Args:
+            query (str): Unused, kept for interface compatibility.
+            max_results (int): Unused, kept for interface compatibility.
+            incremental (bool): Refresh the existing gene dataset instead of rebuilding it.
         Returns:
             GeneDataset: The collected gene dataset.
         """
@@ -69,43 +79,40 @@ class GeneDataCollector(BaseDataSource):
             logger.warning("No PMIDs found in PubMed dataset.")
             return GeneDataset()
 
-        # Fetch metadata
+        existing = await self._load_existing() if incremental else GeneDataset()
+        records = {record.gene_id: record for record in existing.genes}
+        resolved = set(existing.metadata.resolved_pmids)
+        if not resolved:
+            # Datasets written before resolved PMIDs were tracked: links are all we know
+            resolved = {pmid for record in existing.genes for pmid in record.linked_pmids}
+        pmids = [pmid for pmid in dict.fromkeys(pmids) if pmid not in resolved]
+        if incremental:
+            logger.info(f"{len(resolved)} PMIDs already resolved, {len(records)} genes on file")
+
         # Map PMIDs -> GeneIDs using elink
         logger.info(f"Resolving GeneIDs from {len(pmids)} PMIDs via elink")
         pmid_to_genes = await self.api.elink_pubmed_to_gene(pmids)
-        all_gene_ids = sorted({gid for genes in pmid_to_genes.values() for gid in genes})
-        logger.info(f"Resolved {len(all_gene_ids)} unique GeneIDs; fetching summaries")
-        await self._rate_limit()
-        gene_summaries = await self.api.fetch_genes(all_gene_ids)
+        new_gene_ids = sorted(
+            {gid for genes in pmid_to_genes.values() for gid in genes} - records.keys()
+        )
+        logger.info(f"Resolved {len(new_gene_ids)} new GeneIDs; fetching summaries")
+        gene_summaries = await self.api.fetch_genes(new_gene_ids)
         logger.info(f"Fetched {len(gene_summaries)} gene summaries; computing linked PMIDs per gene")
 
-        # Batch link to PubMed (1 elink call for all GeneIDs)
-        logger.info("Fetching PubMed links for all GeneIDs...")
-        # Invert mapping to gene_id -> linked_pmids
-        linked_map: dict[str, list[str]] = {}
+        for gene in gene_summaries:
+            record = self._gene_record(gene)
+            records[record.gene_id] = record
+
+        # Merge the new links into old and new records alike
         for pmid, genes in pmid_to_genes.items():
             for gid in genes:
-                linked_map.setdefault(gid, []).append(pmid)
-
-        gene_records: list[GeneRecord] = []
-        for gene in gene_summaries:
-            gene_id = gene.get("uid", "")
-            linked_pmids = linked_map.get(gene_id, [])
-
-            gene_records.append(
-                GeneRecord(
-                    gene_id=gene_id,
-                    name=gene.get("Name", ""),
-                    description=gene.get("Description", gene.get("Summary", "")),
-                    chromosome=gene.get("Chromosome", ""),
-                    map_location=gene.get("MapLocation", ""),
-                    organism=gene.get("Organism", {}).get("ScientificName", ""),
-                    aliases=gene.get("OtherAliases", ""),
-                    designations=gene.get("OtherDesignations", ""),
-                    linked_pmids=linked_pmids,
-                )
-            )
+                if gid in records and pmid not in records[gid].linked_pmids:
+                    records[gid].linked_pmids.append(pmid)
+            # A gene without a summary is linked once a later refresh fetches it
+            if all(gid in records for gid in genes):
+                resolved.add(pmid)
 
+        gene_records = list(records.values())
         total_linked = sum(len(r.linked_pmids) for r in gene_records)
         with_links = sum(1 for r in gene_records if r.linked_pmids)
         metadata = GeneMetadata(
@@ -113,6 +120,7 @@ class GeneDataCollector(BaseDataSource):
             total_genes=len(gene_records),
             genes_with_pubmed_links=with_links,
             total_linked_pmids=total_linked,
+            resolved_pmids=sorted(resolved),
         )
         logger.info(
             f"✅ Collected {len(gene_records)} gene entries "
@@ -120,13 +128,48 @@ class GeneDataCollector(BaseDataSource):
         )
         return GeneDataset(metadata=metadata, genes=gene_records)
 
+    async def _load_existing(self) -> GeneDataset:
+        """Load the gene dataset an incremental refresh starts from (empty if there is none)."""
+        gene_path = settings.json_data.gene_json_path
+
+        def _load() -> GeneDataset:
+            with open(gene_path, encoding="utf-8") as f:
+                return GeneDataset.model_validate_json(f.read())
+
+        try:
+            return await asyncio.to_thread(_load)
+        except FileNotFoundError:
+            logger.info(f"No gene dataset at {gene_path}; collecting from scratch")
+            return GeneDataset()
+
+    @staticmethod
+    def _gene_record(gene: dict[str, Any]) -> GeneRecord:
+        """Convert an ESummary gene document into a GeneRecord without links."""
+        return GeneRecord(
+            gene_id=gene.get("uid", ""),
+            name=gene.get("Name", ""),
+            description=gene.get("Description", gene.get("Summary", "")),
+            chromosome=gene.get("Chromosome", ""),
+            map_location=gene.get("MapLocation", ""),
+            organism=gene.get("Organism", {}).get("ScientificName", ""),
+            aliases=gene.get("OtherAliases", ""),
+            designations=gene.get("OtherDesignations", ""),
+        )
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect the gene dataset and write it to JSON.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only resolve PMIDs the existing gene dataset has not seen, and merge the new links.",
+    )
+    args = parser.parse_args()
 
     async def main() -> None:
         """Main function to collect gene dataset and save to file."""
         collector = GeneDataCollector()
-        gene_ds = await collector.collect_dataset()
+        gene_ds = await collector.collect_dataset(incremental=args.incremental)
 
         Path("data").mkdir(exist_ok=True)
 
@@ -1,14 +1,25 @@
 """
 Paper enrichment module - finds related papers and adds them to the dataset.
 
-For each paper in the dataset, searches PubMed using title + abstract,
-and adds one related paper if not already present.
+For each paper in the dataset, finds related papers not already present:
+either NCBI's precomputed similar articles (batched elink neighbor links,
+ranked by link score) or a PubMed search on the first words of the title.
+
+Fetched papers and citations are appended to a JSONL journal as each batch
+completes instead of rewriting the dataset file; the journal is compacted into
+the dataset once at the end (or on demand with `--compact`) and replayed on top
+of it if a run was interrupted.
 """
 
 import asyncio
 import argparse
 import json
+import os
 import re
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Literal
 
 from biomedical_graphrag.config import settings
 from biomedical_graphrag.data_sources.base import BaseDataSource
@@ -17,11 +28,121 @@ from biomedical_graphrag.data_sources.pubmed.pubmed_data_collector import PubMed
 from biomedical_graphrag.domain.citation import CitationNetwork
 from biomedical_graphrag.domain.dataset import PaperDataset
 from biomedical_graphrag.domain.paper import Paper
+from biomedical_graphrag.utils.journal_util import JsonlJournal
 from biomedical_graphrag.utils.logger_util import setup_logging
 
 logger = setup_logging()
 
 
+def add_papers(
+    dataset: PaperDataset,
+    papers: list[Paper],
+    citations: dict[str, CitationNetwork],
+    known_pmids: set[str],
+) -> int:
+    """
+    Add papers and their citations to a dataset, keeping the metadata totals current.
+
+    The totals are updated by the size of what is added rather than recounted over
+    the whole dataset. Papers already in `known_pmids` are skipped.
+
+    Args:
+        dataset (PaperDataset): Dataset to extend in place.
+        papers (list[Paper]): Newly fetched papers.
+        citations (dict[str, CitationNetwork]): Citation links of the new papers.
+        known_pmids (set[str]): PMIDs already in the dataset; updated in place.
+
+    Returns:
+        int: Number of papers added.
+    """
+    added = 0
+    for paper in papers:
+        if paper.pmid in known_pmids:
+            continue
+        known_pmids.add(paper.pmid)
+        dataset.papers.append(paper)
+        dataset.metadata.total_authors += len(paper.authors)
+        dataset.metadata.total_mesh_terms += len(paper.mesh_terms)
+        added += 1
+    dataset.citation_network.update(citations)
+    dataset.metadata.total_papers += added
+    dataset.metadata.papers_with_citations = len(dataset.citation_network)
+    return added
+
+
+def replay_journal(dataset: PaperDataset, journal: JsonlJournal, known_pmids: set[str]) -> int:
+    """
+    Apply the batches an earlier enrichment journaled but never compacted.
+
+    Args:
+        dataset (PaperDataset): Dataset the journal was written against; extended in place.
+        journal (JsonlJournal): Enrichment journal.
+        known_pmids (set[str]): PMIDs already in the dataset; updated in place.
+
+    Returns:
+        int: Number of papers added from the journal.
+    """
+    added = 0
+    for record in journal.records():
+        if record.get("type") != "papers":
+            continue
+        added += add_papers(
+            dataset,
+            [Paper.model_validate(paper) for paper in record["papers"]],
+            {pmid: CitationNetwork.model_validate(links) for pmid, links in record["citations"].items()},
+            known_pmids,
+        )
+    if added:
+        logger.info(f"Replayed {added} papers from {journal.path}")
+    return added
+
+
+def compact(dataset: PaperDataset, output_path: str, journal: JsonlJournal) -> None:
+    """
+    Write the dataset file once and drop the journal it now contains.
+
+    The file is replaced atomically, so a crash leaves either the old dataset plus
+    the journal or the new dataset; replaying the journal again skips known PMIDs.
+
+    Args:
+        dataset (PaperDataset): Dataset with the journaled batches applied.
+        output_path (str): Dataset file to write.
+        journal (JsonlJournal): Journal to clear once the dataset is written.
+    """
+    directory = Path(output_path).parent
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(dataset.model_dump_json(indent=2))
+        os.replace(tmp, output_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    journal.clear()
+    logger.info(f"Saved {len(dataset.papers)} papers to {output_path}")
+
+
+def compact_journal(dataset_path: str | None = None, journal_path: str | None = None) -> PaperDataset:
+    """
+    Fold a pending enrichment journal into the dataset file without fetching anything.
+
+    Args:
+        dataset_path (str | None): Dataset file (defaults to settings path).
+        journal_path (str | None): Enrichment journal (defaults to settings path).
+
+    Returns:
+        PaperDataset: The compacted dataset.
+    """
+    dataset_path = dataset_path or settings.json_data.pubmed_json_path
+    journal = JsonlJournal(journal_path or settings.json_data.pubmed_enrichment_journal_path)
+    with open(dataset_path, encoding="utf-8") as f:
+        dataset = PaperDataset(**json.load(f))
+    replay_journal(dataset, journal, {paper.pmid for paper in dataset.papers})
+    compact(dataset, dataset_path, journal)
+    return dataset
+
+
 class PaperEnrichmentCollector(BaseDataSource):
     """Enriches existing PubMed dataset by finding related papers."""
 
@@ -78,7 +199,6 @@ class PaperEnrichmentCollector(BaseDataSource):
         Returns:
             list[str]: List of PMIDs matching the search query.
         """
-        await self._rate_limit()
         return await self.api.search(query, max_results=max_results)
 
     async def fetch_entities(self, entity_ids: list[str]) -> list[Paper]:
@@ -107,7 +227,7 @@ class PaperEnrichmentCollector(BaseDataSource):
         if not paper_ids:
             return []
 
-        papers = []
+        papers: list[Paper] = []
         total = len(paper_ids)
 
         for i in range(0, total, batch_size):
@@ -120,25 +240,15 @@ class PaperEnrichmentCollector(BaseDataSource):
                 f"({len(batch)} papers, {len(papers)}/{total} done)"
             )
 
-            await self._rate_limit()
             try:
-                raw_papers = await self.api.fetch_papers(batch)
-                for r in raw_papers:
-                    parsed = self._parser._parse_paper(r)
-                    if parsed:
-                        papers.append(parsed)
+                papers.extend(await self._parser.fetch_papers(batch))
             except Exception as e:
                 logger.warning(f"Batch {batch_num} failed: {e}, retrying with smaller batch...")
                 # Retry with smaller batches
                 for j in range(0, len(batch), 50):
                     mini_batch = batch[j:j + 50]
-                    await self._rate_limit()
                     try:
-                        raw_papers = await self.api.fetch_papers(mini_batch)
-                        for r in raw_papers:
-                            parsed = self._parser._parse_paper(r)
-                            if parsed:
-                                papers.append(parsed)
+                        papers.extend(await self._parser.fetch_papers(mini_batch))
                     except Exception as e2:
                         logger.error(f"Mini-batch failed: {e2}, skipping {len(mini_batch)} papers")
 
@@ -155,7 +265,6 @@ class PaperEnrichmentCollector(BaseDataSource):
         Returns:
             dict: Citation data including the PMID and citation relationships.
         """
-        await self._rate_limit()
         citations = await self.api.fetch_citations(paper_id)
         return {"pmid": paper_id, **citations}
 
@@ -194,6 +303,77 @@ class PaperEnrichmentCollector(BaseDataSource):
             logger.warning(f"Search failed for PMID={source_paper.pmid}: {e}")
             return []
 
+    async def _find_related_by_search(
+        self,
+        source_papers: list[Paper],
+        existing_pmids: set[str],
+        max_new: int = 5,
+    ) -> list[str]:
+        """
+        Find related papers for many sources with one title search each.
+
+        Args:
+            source_papers (list[Paper]): Papers to find related papers for.
+            existing_pmids (set[str]): PMIDs already in the dataset; updated in place.
+            max_new (int): Maximum number of new papers per source. Defaults to 5.
+
+        Returns:
+            list[str]: New PMIDs, in source order.
+        """
+        # Find related papers with controlled concurrency
+        semaphore = asyncio.Semaphore(5)  # Higher with API key
+        new_pmids: list[str] = []
+
+        async def process_paper(paper: Paper) -> list[str]:
+            async with semaphore:
+                return await self._find_related_papers(paper, existing_pmids, max_new=max_new)
+
+        tasks = [process_paper(p) for p in source_papers]
+        results = await asyncio.gather(*tasks)
+
+        for related_list in results:
+            for related_pmid in related_list:
+                if related_pmid not in existing_pmids:
+                    new_pmids.append(related_pmid)
+                    existing_pmids.add(related_pmid)
+        return new_pmids
+
+    async def _find_related_by_links(
+        self,
+        source_papers: list[Paper],
+        existing_pmids: set[str],
+        max_new: int = 5,
+    ) -> list[str]:
+        """
+        Find related papers for many sources from their similar-articles links.
+
+        All links are ranked by score and walked once: each candidate not yet in the
+        dataset goes to the best-scoring source that still has room for it.
+
+        Args:
+            source_papers (list[Paper]): Papers to find related papers for.
+            existing_pmids (set[str]): PMIDs already in the dataset; updated in place.
+            max_new (int): Maximum number of new papers per source. Defaults to 5.
+
+        Returns:
+            list[str]: New PMIDs, highest link score first.
+        """
+        similar = await self.api.fetch_similar_batch([p.pmid for p in source_papers])
+        links = sorted(
+            ((score, pmid, source) for source, linked in similar.items() for pmid, score in linked),
+            key=lambda link: link[0],
+            reverse=True,
+        )
+        taken: Counter[str] = Counter()
+        new_pmids: list[str] = []
+        for _, pmid, source in links:
+            if taken[source] >= max_new or pmid in existing_pmids:
+                continue
+            existing_pmids.add(pmid)
+            new_pmids.append(pmid)
+            taken[source] += 1
+        return new_pmids
+
     async def enrich_dataset(
         self,
         input_path: str | None = None,
@@ -202,10 +382,17 @@ class PaperEnrichmentCollector(BaseDataSource):
         max_papers_to_process: int | None = None,
         related_per_paper: int = 5,
         start_index: int = 0,
+        journal_path: str | None = None,
+        batch_size: int = 200,
+        related_mode: Literal["links", "search"] = "links",
     ) -> PaperDataset:
         """
         Enrich existing dataset with related papers.
 
+        Each fetched batch is appended to the journal, and the dataset file is
+        written once, when the journal is compacted at the end. A journal left by
+        an interrupted run is replayed first, so its papers are not fetched again.
+
         Args:
             input_path: Path to input dataset (defaults to settings path)
             output_path: Path to save enriched dataset (defaults to input path)
@@ -213,26 +400,35 @@ class PaperEnrichmentCollector(BaseDataSource):
             max_papers_to_process: Limit number of papers to process (for testing)
             related_per_paper: How many related papers to find per source paper
             start_index: Index to start processing from (skip papers already used as sources)
+            journal_path: JSONL journal for fetched batches (defaults to settings path)
+            batch_size: Papers fetched (and journaled) together
+            related_mode: "links" for batched similar-articles links, "search" for one
+                title search per paper
 
         Returns:
             Enriched PaperDataset
         """
         input_path = input_path or settings.json_data.pubmed_json_path
         output_path = output_path or input_path
+        journal = JsonlJournal(journal_path or settings.json_data.pubmed_enrichment_journal_path)
 
         logger.info(f"Loading dataset from {input_path}")
         with open(input_path, encoding="utf-8") as f:
             data = json.load(f)
 
         dataset = PaperDataset(**data)
-        existing_pmids = {p.pmid for p in dataset.papers}
-        initial_count = len(existing_pmids)
+        initial_count = len(dataset.papers)
+        dataset_pmids = {p.pmid for p in dataset.papers}
 
-        # Skip papers already used as sources
+        # Skip papers already used as sources; sliced before the replay, so papers an
+        # interrupted run fetched are not sources, as in an uninterrupted run
         papers_to_process = dataset.papers[start_index:]
         if max_papers_to_process:
             papers_to_process = papers_to_process[:max_papers_to_process]
 
+        replay_journal(dataset, journal, dataset_pmids)
+        existing_pmids = set(dataset_pmids)
+
         logger.info(f"Skipping first {start_index} papers (already used as sources)")
 
         logger.info(
@@ -240,29 +436,20 @@ class PaperEnrichmentCollector(BaseDataSource):
             f"(up to {related_per_paper} related each)"
         )
 
-        # Find related papers with controlled concurrency
-        semaphore = asyncio.Semaphore(5)  # Higher with API key
-        new_pmids: list[str] = []
-
-        async def process_paper(paper: Paper) -> list[str]:
-            async with semaphore:
-                return await self._find_related_papers(paper, existing_pmids, max_new=related_per_paper)
-
-        tasks = [process_paper(p) for p in papers_to_process]
-        results = await asyncio.gather(*tasks)
-
-        for related_list in results:
-            for related_pmid in related_list:
-                if related_pmid not in existing_pmids:
-                    new_pmids.append(related_pmid)
-                    existing_pmids.add(related_pmid)
+        if related_mode == "links":
+            new_pmids = await self._find_related_by_links(
+                papers_to_process, existing_pmids, max_new=related_per_paper
+            )
+        else:
+            new_pmids = await self._find_related_by_search(
+                papers_to_process, existing_pmids, max_new=related_per_paper
+            )
 
         logger.info(f"Found {len(new_pmids)} new related papers")
 
-        # Fetch details for new papers in batches, saving after each batch
+        # Fetch details for new papers in batches, journaling each batch
         if new_pmids:
             logger.info(f"Fetching details for {len(new_pmids)} new papers")
-            batch_size = 200
             total_batches = (len(new_pmids) + batch_size - 1) // batch_size
 
             for batch_idx in range(0, len(new_pmids), batch_size):
@@ -271,40 +458,29 @@ class PaperEnrichmentCollector(BaseDataSource):
 
                 logger.info(f"Fetching batch {batch_num}/{total_batches} ({len(batch_pmids)} papers)")
                 new_papers = await self.fetch_papers(batch_pmids)
-                dataset.papers.extend(new_papers)
 
                 # Fetch citations if requested
+                citations: dict[str, CitationNetwork] = {}
                 if fetch_citations and new_papers:
-                    async def fetch_with_semaphore(paper: Paper) -> dict:
-                        async with semaphore:
-                            return await self.fetch_citations(paper.pmid)
-
-                    citation_tasks = [fetch_with_semaphore(p) for p in new_papers]
-                    citations_list = await asyncio.gather(*citation_tasks)
-
-                    for paper, citations in zip(new_papers, citations_list, strict=False):
-                        dataset.citation_network[paper.pmid] = CitationNetwork(**citations)
-
-                # Update metadata and save after each batch
-                dataset.metadata.total_papers = len(dataset.papers)
-                dataset.metadata.papers_with_citations = len(dataset.citation_network)
-                dataset.metadata.total_authors = sum(len(p.authors) for p in dataset.papers)
-                dataset.metadata.total_mesh_terms = sum(len(p.mesh_terms) for p in dataset.papers)
-
-                # Save incrementally
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(dataset.model_dump_json(indent=2))
-                logger.info(f"Saved {len(dataset.papers)} papers to {output_path}")
-
-        # Final metadata update
-        dataset.metadata.total_papers = len(dataset.papers)
-        dataset.metadata.papers_with_citations = len(dataset.citation_network)
-        dataset.metadata.total_authors = sum(len(p.authors) for p in dataset.papers)
-        dataset.metadata.total_mesh_terms = sum(len(p.mesh_terms) for p in dataset.papers)
+                    citations = await self._parser.fetch_citation_network([p.pmid for p in new_papers])
+
+                journal.append(
+                    {
+                        "type": "papers",
+                        "papers": [paper.model_dump(mode="json") for paper in new_papers],
+                        "citations": {
+                            pmid: links.model_dump(mode="json") for pmid, links in citations.items()
+                        },
+                    }
+                )
+                add_papers(dataset, new_papers, citations, dataset_pmids)
+                logger.info(f"Journaled batch {batch_num}/{total_batches} to {journal.path}")
+
+        compact(dataset, output_path, journal)
 
         logger.info(
             f"Enrichment complete: {initial_count} -> {len(dataset.papers)} papers "
-            f"(+{len(new_pmids)} new)"
+            f"(+{len(dataset.papers) - initial_count} new)"
         )
 
         return dataset
@@ -330,7 +506,8 @@ async def main() -> None:
     Main function to run paper enrichment.
 
     Loads the dataset, enriches it with related papers, and saves the result.
-    Starts from specific index to skip papers already used as sources.
+    Starts from specific index to skip papers already used as sources. With
+    `--compact`, only folds a pending journal into the dataset.
 
     Returns:
         None
@@ -344,16 +521,25 @@ async def main() -> None:
         default=0,
         help="Index to start processing from (skip papers already used as sources).",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Fold the journal of an interrupted enrichment into the dataset and exit.",
+    )
+    parser.add_argument(
+        "--related-mode",
+        choices=["links", "search"],
+        default="links",
+        help="Find related papers from similar-articles links (batched) or one title search per paper.",
+    )
     args = parser.parse_args()
 
-    enricher = PaperEnrichmentCollector()
-    enriched_dataset = await enricher.enrich_dataset(start_index=args.start_index)
+    if args.compact:
+        compact_journal()
+        return
 
-    output_path = settings.json_data.pubmed_json_path
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(enriched_dataset.model_dump_json(indent=2))
-
-    logger.info(f"Saved enriched dataset to {output_path}")
+    enricher = PaperEnrichmentCollector()
+    await enricher.enrich_dataset(start_index=args.start_index, related_mode=args.related_mode)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,30 @@
 import asyncio
+from dataclasses import dataclass
+from datetime import date, timedelta
 
 from Bio import Entrez
 
+from biomedical_graphrag.data_sources.base import entrez_fetch, entrez_read
 from biomedical_graphrag.utils.logger_util import setup_logging
 
 logger = setup_logging()
 
+# ESearch returns at most the first 10,000 PubMed results of a query
+ESEARCH_MAX_RESULTS = 9999
+# Publication dates searched when a large query is split into date ranges
+EARLIEST_PUBLICATION = date(1700, 1, 1)
+
+
+@dataclass
+class SearchHistory:
+    """A search stored on the Entrez history server (esearch with usehistory=y)."""
+
+    webenv: str
+    query_key: str
+    count: int
+    mindate: date | None = None
+    maxdate: date | None = None
+
 
 class PubMedAPIClient:
     """
@@ -26,7 +45,7 @@ class PubMedAPIClient:
         Returns:
             list[str]: A list of PubMed IDs (PMIDs) matching the search query.
         """
-        # rate limiting handled by collector
+        # rate limiting and caching handled by entrez_read
         # Debug log types of all arguments
         logger.info(
             f"search() argument types: query={type(query)}, \
@@ -40,34 +59,155 @@ class PubMedAPIClient:
         logger.info(f"Entrez.api_key type before esearch: {type(getattr(Entrez, 'api_key', None))}")
         logger.info(f"Entrez.email type before esearch: {type(getattr(Entrez, 'email', None))}")
 
-        def _search() -> list[str]:
-            handle = Entrez.esearch(db="pubmed", term=query, retmax=max_results, sort=sort)
-            record = Entrez.read(handle)
-            pmids = record.get("IdList", [])
-            handle.close()
-            return pmids
+        if max_results > ESEARCH_MAX_RESULTS:
+            return await self.search_large(query, max_results)
+        record = await entrez_read("esearch", db="pubmed", term=query, retmax=max_results, sort=sort)
+        return list(record.get("IdList", []))
+
+    async def search_history(
+        self, query: str, mindate: date | None = None, maxdate: date | None = None
+    ) -> SearchHistory:
+        """
+        Run a search on the Entrez history server, without downloading its PMIDs (async).
+        Args:
+            query (str): The search query.
+            mindate (date | None): Earliest publication date to include.
+            maxdate (date | None): Latest publication date to include.
+        Returns:
+            SearchHistory: The WebEnv and query key of the stored result, and its size.
+        """
+        dates = {}
+        if mindate and maxdate:
+            dates = {
+                "datetype": "pdat",
+                "mindate": mindate.strftime("%Y/%m/%d"),
+                "maxdate": maxdate.strftime("%Y/%m/%d"),
+            }
 
-        return await asyncio.to_thread(_search)
+        # The WebEnv is a server-side session: never served from the cache
+        record = await entrez_read(
+            "esearch", cacheable=False, db="pubmed", term=query, retmax=0, usehistory="y", **dates
+        )
+        return SearchHistory(
+            webenv=record["WebEnv"],
+            query_key=record["QueryKey"],
+            count=int(record["Count"]),
+            mindate=mindate,
+            maxdate=maxdate,
+        )
 
-    async def fetch_papers(self, pmid_list: list[str]) -> list[dict]:
+    async def history_pmids(self, history: SearchHistory, start: int, count: int) -> list[str]:
         """
-        Fetch paper details from PubMed using a list of PMIDs (async).
+        Page PMIDs out of a stored search (async).
+        Args:
+            history (SearchHistory): The stored search.
+            start (int): Index of the first PMID.
+            count (int): PMIDs to return.
+        Returns:
+            list[str]: The PMIDs of the page.
+        """
+
+        data = await entrez_fetch(
+            "efetch",
+            cacheable=False,
+            db="pubmed",
+            rettype="uilist",
+            retmode="text",
+            webenv=history.webenv,
+            query_key=history.query_key,
+            retstart=start,
+            retmax=count,
+        )
+        return [line.strip() for line in data.decode().splitlines() if line.strip()]
+
+    async def search_large(
+        self, query: str, max_results: int, page_size: int = 5000, concurrency: int = 4
+    ) -> list[str]:
+        """
+        Search past ESearch's 10,000 result cap using the history server (async).
+
+        A query matching more than 10,000 papers is split into publication-date ranges
+        that each match fewer, every range is stored with usehistory=y, and its PMIDs
+        are paged out concurrently (the rate limiter still paces the requests).
+        Results come newest range first rather than by relevance.
+
+        Args:
+            query (str): The search query.
+            max_results (int): The maximum number of PMIDs to return.
+            page_size (int): PMIDs per history page.
+            concurrency (int): Pages fetched at once.
+        Returns:
+            list[str]: Up to `max_results` PMIDs matching the query.
+        """
+        total = await self.search_history(query)
+        histories = (
+            [total] if total.count <= ESEARCH_MAX_RESULTS else await self._split_by_date(query, total)
+        )
+        logger.info(
+            f"Search matched {total.count} PMIDs; paging {min(total.count, max_results)} "
+            f"from {len(histories)} stored result set(s)"
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def page(history: SearchHistory, start: int, count: int) -> list[str]:
+            async with semaphore:
+                return await self.history_pmids(history, start, count)
+
+        pmids: list[str] = []
+        for history in histories:
+            wanted = min(history.count, ESEARCH_MAX_RESULTS, max_results - len(pmids))
+            pages = await asyncio.gather(
+                *(
+                    page(history, start, min(page_size, wanted - start))
+                    for start in range(0, wanted, page_size)
+                )
+            )
+            pmids.extend(pmid for chunk in pages for pmid in chunk)
+            if len(pmids) >= max_results:
+                break
+        # Papers with several publication dates can fall into two adjacent ranges
+        return list(dict.fromkeys(pmids))[:max_results]
+
+    async def _split_by_date(self, query: str, total: SearchHistory) -> list[SearchHistory]:
+        """Date ranges of `query` that each fit under the ESearch cap, newest first."""
+        histories: list[SearchHistory] = []
+        ranges = [(EARLIEST_PUBLICATION, date.today() + timedelta(days=366))]
+        while ranges:
+            mindate, maxdate = ranges.pop()
+            history = await self.search_history(query, mindate, maxdate)
+            if history.count <= ESEARCH_MAX_RESULTS or mindate == maxdate:
+                if history.count > ESEARCH_MAX_RESULTS:
+                    logger.warning(
+                        f"{history.count} PMIDs were published on {mindate}; "
+                        f"only the first {ESEARCH_MAX_RESULTS} are collected"
+                    )
+                if history.count:
+                    histories.append(history)
+                continue
+            middle = mindate + (maxdate - mindate) // 2
+            # Pushed so that the newer half is searched first
+            ranges.extend([(mindate, middle), (middle + timedelta(days=1), maxdate)])
+        covered = sum(history.count for history in histories)
+        if covered < total.count:
+            logger.warning(f"{total.count - covered} PMIDs have no publication date in range")
+        return histories
+
+    async def fetch_papers_xml(self, pmid_list: list[str]) -> bytes:
+        """
+        Fetch the PubMed XML records of a list of PMIDs (async).
+
+        The response is returned unparsed; see `pubmed_xml_parser` for turning it
+        into Paper objects without building the whole document tree.
         Args:
             pmid_list (list[str]): A list of PubMed IDs (PMIDs) to fetch.
         Returns:
-            list[dict]: A list of dictionaries containing paper details.
+            bytes: The efetch response (a PubmedArticleSet document).
         """
         if not pmid_list:
-            return []
+            return b""
 
-        def _fetch() -> list[dict]:
-            ids = ",".join(pmid_list)
-            handle = Entrez.efetch(db="pubmed", id=ids, rettype="medline", retmode="xml")
-            records = Entrez.read(handle)
-            handle.close()
-            return records.get("PubmedArticle", [])
-
-        return await asyncio.to_thread(_fetch)
+        ids = ",".join(pmid_list)
+        return await entrez_fetch("efetch", db="pubmed", id=ids, rettype="medline", retmode="xml")
 
     async def fetch_citations(self, pmid: str) -> dict[str, list[str]]:
         """
@@ -77,21 +217,169 @@ class PubMedAPIClient:
         Returns:
             dict[str, list[str]]: A dictionary containing lists of cited by and references PMIDs.
         """
+        citations = _empty_citations([pmid])
+        # Two separate requests, each paced by the rate limiter
+        for linkname in CITATION_LINKNAMES:
+            record = await _elink_citations([pmid], linkname)
+            _merge_citation_links(citations, record)
+        return citations[pmid]
+
+    async def fetch_citations_batch(
+        self, pmids: list[str], batch_size: int = 100, concurrency: int = 4
+    ) -> dict[str, dict[str, list[str]]]:
+        """
+        Fetch citations for many PMIDs with a few elink requests (async).
+
+        Each request carries a batch of PMIDs as repeated `id` parameters, so NCBI
+        returns one link set per PMID instead of merging them. A batch costs one
+        request per link name; a batch that fails is retried one PMID at a time.
+
+        Args:
+            pmids (list[str]): PubMed IDs to fetch citations for.
+            batch_size (int): PMIDs per elink request.
+            concurrency (int): Requests in flight at once (the rate limiter still paces them).
+        Returns:
+            dict[str, dict[str, list[str]]]: For each PMID, its cited by and references PMIDs.
+            PMIDs whose single-PMID retry also failed are left out, so callers can fetch
+            them again rather than record them as having no citations.
+        """
+        citations = _empty_citations(pmids)
+        failed: set[str] = set()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_batch(batch: list[str], linkname: str) -> None:
+            async with semaphore:
+                try:
+                    record = await _elink_citations(batch, linkname)
+                except Exception as e:
+                    if len(batch) == 1:
+                        logger.error(f"elink {linkname} failed for PMID={batch[0]}: {e}")
+                        failed.add(batch[0])
+                        return
+                    logger.warning(
+                        f"elink {linkname} failed for a batch of {len(batch)} PMIDs: {e}; "
+                        "retrying one by one"
+                    )
+                    record = None
+            if record is None:
+                await asyncio.gather(*(fetch_batch([pmid], linkname) for pmid in batch))
+            else:
+                _merge_citation_links(citations, record)
+
+        batches = [pmids[i : i + batch_size] for i in range(0, len(pmids), batch_size)]
+        await asyncio.gather(
+            *(fetch_batch(batch, linkname) for batch in batches for linkname in CITATION_LINKNAMES)
+        )
+        for pmid in failed:
+            del citations[pmid]
+        if failed:
+            logger.warning(f"Citations incomplete for {len(failed)} PMIDs; left out of the result")
+        logger.info(
+            f"Fetched citations for {len(citations)} PMIDs with "
+            f"{len(batches) * len(CITATION_LINKNAMES)} batched elink requests"
+        )
+        return citations
+
+    async def fetch_similar_batch(
+        self, pmids: list[str], batch_size: int = 100, concurrency: int = 4
+    ) -> dict[str, list[tuple[str, int]]]:
+        """
+        Fetch NCBI's precomputed similar articles for many PMIDs (async).
+
+        Uses elink `pubmed_pubmed` links with `cmd=neighbor_score`, one request per
+        batch of PMIDs; a batch that fails is retried one PMID at a time.
+
+        Args:
+            pmids (list[str]): PubMed IDs to find similar articles for.
+            batch_size (int): PMIDs per elink request.
+            concurrency (int): Requests in flight at once (the rate limiter still paces them).
+        Returns:
+            dict[str, list[tuple[str, int]]]: For each PMID, its similar PMIDs and their
+            link scores, highest score first.
+        """
+        similar: dict[str, list[tuple[str, int]]] = {pmid: [] for pmid in pmids}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_batch(batch: list[str]) -> None:
+            async with semaphore:
+                try:
+                    record = await _elink_similar(batch)
+                except Exception as e:
+                    if len(batch) == 1:
+                        logger.error(f"elink {SIMILAR_LINKNAME} failed for PMID={batch[0]}: {e}")
+                        return
+                    logger.warning(
+                        f"elink {SIMILAR_LINKNAME} failed for a batch of {len(batch)} PMIDs: {e}; "
+                        "retrying one by one"
+                    )
+                    record = None
+            if record is None:
+                await asyncio.gather(*(fetch_batch([pmid]) for pmid in batch))
+            else:
+                _merge_similar_links(similar, record)
+
+        batches = [pmids[i : i + batch_size] for i in range(0, len(pmids), batch_size)]
+        await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        for links in similar.values():
+            links.sort(key=lambda link: link[1], reverse=True)
+        logger.info(
+            f"Fetched similar articles for {len(similar)} PMIDs with "
+            f"{len(batches)} batched elink requests"
+        )
+        return similar
+
+
+# Link names requested for citations, and the CitationNetwork field each one fills
+CITATION_LINKNAMES = {"pubmed_pubmed_citedin": "cited_by", "pubmed_pubmed_refs": "references"}
+# NCBI's precomputed similar-articles neighbors
+SIMILAR_LINKNAME = "pubmed_pubmed"
+
+
+def _empty_citations(pmids: list[str]) -> dict[str, dict[str, list[str]]]:
+    return {pmid: {field: [] for field in CITATION_LINKNAMES.values()} for pmid in pmids}
+
+
+async def _elink_citations(pmids: list[str], linkname: str) -> list:
+    # A list (not a comma-joined string) becomes repeated id parameters: one link set per PMID
+    return await entrez_read("elink", dbfrom="pubmed", db="pubmed", id=list(pmids), linkname=linkname)
+
+
+def _merge_citation_links(citations: dict[str, dict[str, list[str]]], record: list) -> None:
+    """Add the links of an elink response to `citations`, keyed by source PMID and link name."""
+    for linkset in record:
+        id_list = linkset.get("IdList", [])
+        pmid = str(id_list[0]) if id_list else ""
+        if pmid not in citations:
+            continue
+        for linkset_db in linkset.get("LinkSetDb", []):
+            field = CITATION_LINKNAMES.get(str(linkset_db.get("LinkName", "")))
+            if field:
+                citations[pmid][field].extend(str(link["Id"]) for link in linkset_db.get("Link", []))
+
+
+async def _elink_similar(pmids: list[str]) -> list:
+    return await entrez_read(
+        "elink",
+        dbfrom="pubmed",
+        db="pubmed",
+        id=list(pmids),
+        linkname=SIMILAR_LINKNAME,
+        cmd="neighbor_score",
+    )
+
 
-        def _fetch_citations() -> dict[str, list[str]]:
-            result: dict[str, list[str]] = {"cited_by": [], "references": []}
-            handle = Entrez.elink(
-                dbfrom="pubmed", db="pubmed", id=pmid, linkname="pubmed_pubmed_citedin"
+def _merge_similar_links(similar: dict[str, list[tuple[str, int]]], record: list) -> None:
+    """Add the scored neighbors of an elink response to `similar`, keyed by source PMID."""
+    for linkset in record:
+        id_list = linkset.get("IdList", [])
+        pmid = str(id_list[0]) if id_list else ""
+        if pmid not in similar:
+            continue
+        for linkset_db in linkset.get("LinkSetDb", []):
+            if str(linkset_db.get("LinkName", "")) != SIMILAR_LINKNAME:
+                continue
+            similar[pmid].extend(
+                (str(link["Id"]), int(link.get("Score", 0)))
+                for link in linkset_db.get("Link", [])
+                if str(link["Id"]) != pmid
             )
-            citing_record = Entrez.read(handle)
-            handle.close()
-            if citing_record[0].get("LinkSetDb"):
-                result["cited_by"] = [link["Id"] for link in citing_record[0]["LinkSetDb"][0]["Link"]]
-            handle = Entrez.elink(dbfrom="pubmed", db="pubmed", id=pmid, linkname="pubmed_pubmed_refs")
-            refs_record = Entrez.read(handle)
-            handle.close()
-            if refs_record[0].get("LinkSetDb"):
-                result["references"] = [link["Id"] for link in refs_record[0]["LinkSetDb"][0]["Link"]]
-            return result
-
-        return await asyncio.to_thread(_fetch_citations)
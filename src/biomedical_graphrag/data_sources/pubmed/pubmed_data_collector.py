@@ -1,20 +1,83 @@
 import asyncio
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from biomedical_graphrag.config import settings
 from biomedical_graphrag.data_sources.base import BaseDataSource
 from biomedical_graphrag.data_sources.pubmed.pubmed_api_client import PubMedAPIClient
-from biomedical_graphrag.domain.author import Author
+from biomedical_graphrag.data_sources.pubmed.pubmed_xml_parser import parse_papers_xml
 from biomedical_graphrag.domain.citation import CitationNetwork
 from biomedical_graphrag.domain.dataset import PaperDataset, PaperMetadata
-from biomedical_graphrag.domain.meshterm import MeSHTerm
 from biomedical_graphrag.domain.paper import Paper
+from biomedical_graphrag.utils.journal_util import JsonlJournal
 from biomedical_graphrag.utils.logger_util import setup_logging
 
 logger = setup_logging()
 
+# Batches at least this large are parsed in a worker process, off the event loop's process
+PROCESS_PARSE_MIN_PAPERS = 50
+
+_PARSE_POOL: ProcessPoolExecutor | None = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    """Worker processes for parsing efetch XML, started on first use (one per core)."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # spawn: forking a process that already runs Entrez threads can deadlock
+        _PARSE_POOL = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _PARSE_POOL
+
+
+@dataclass
+class CollectionCheckpoint:
+    """Progress of a PubMed collection, rebuilt from its journal.
+
+    The journal holds one `search` record (the PMIDs to collect), then a `papers`
+    record per fetched batch and a `citations` record per citation batch.
+    """
+
+    pmids: list[str] | None = None
+    fetched: set[str] = field(default_factory=set)
+    papers: dict[str, Paper] = field(default_factory=dict)
+    citations: dict[str, CitationNetwork] = field(default_factory=dict)
+
+    @classmethod
+    def replay(cls, journal: JsonlJournal, query: str, max_results: int) -> "CollectionCheckpoint":
+        """Rebuild the progress of the collection for `query` from `journal`.
+
+        A journal left by a different query or limit is discarded.
+        """
+        checkpoint = cls()
+        for record in journal.records():
+            match record.get("type"):
+                case "search":
+                    if (record["query"], record["max_results"]) != (query, max_results):
+                        logger.warning(
+                            f"Checkpoint {journal.path} belongs to query='{record['query']}' "
+                            f"(max_results={record['max_results']}); starting over"
+                        )
+                        journal.clear()
+                        return cls()
+                    checkpoint.pmids = record["pmids"]
+                case "papers":
+                    checkpoint.fetched.update(record["pmids"])
+                    for paper in record["papers"]:
+                        checkpoint.papers[paper["pmid"]] = Paper.model_validate(paper)
+                case "citations":
+                    for pmid, links in record["citations"].items():
+                        checkpoint.citations[pmid] = CitationNetwork.model_validate(links)
+        if checkpoint.pmids is not None:
+            logger.info(
+                f"Resuming from {journal.path}: {len(checkpoint.fetched)}/{len(checkpoint.pmids)} "
+                f"PMIDs fetched, {len(checkpoint.citations)} with citations"
+            )
+        return checkpoint
+
 
 class PubMedDataCollector(BaseDataSource):
     """
@@ -45,7 +108,6 @@ class PubMedDataCollector(BaseDataSource):
             list[str]: List of PubMed IDs (PMIDs) matching the query.
         """
         logger.info(f"Starting PubMed search for query='{query}' (max_results={max_results})")
-        await self._rate_limit()
         ids = await self.api.search(query, max_results)
         logger.info(f"Found {len(ids)} PubMed IDs for query")
         return ids
@@ -60,17 +122,14 @@ class PubMedDataCollector(BaseDataSource):
             list[Paper]: List of Paper objects containing details of the fetched papers.
         """
         logger.info(f"Fetching details for {len(paper_ids)} PubMed IDs")
-        await self._rate_limit()
-        raw_papers = await self.api.fetch_papers(paper_ids)
-        logger.info(f"Fetched {len(raw_papers)} raw PubMed records; parsing into Paper models")
-        papers: list[Paper] = []
-        skipped = 0
-        for r in raw_papers:
-            parsed = self._parse_paper(r)
-            if parsed is None:
-                skipped += 1
-                continue
-            papers.append(parsed)
+        if not paper_ids:
+            return []
+        data = await self.api.fetch_papers_xml(paper_ids)
+        if len(paper_ids) >= PROCESS_PARSE_MIN_PAPERS:
+            loop = asyncio.get_running_loop()
+            papers = await loop.run_in_executor(_parse_pool(), parse_papers_xml, data)
+        else:
+            papers = await asyncio.to_thread(parse_papers_xml, data)
         logger.info(f"Parsed {len(papers)} papers")
         return papers
 
@@ -84,10 +143,22 @@ class PubMedDataCollector(BaseDataSource):
             dict: A dictionary containing the citations for the paper.
         """
         logger.debug(f"Fetching citations for PMID={paper_id}")
-        await self._rate_limit()
         citations = await self.api.fetch_citations(paper_id)
         return {"pmid": paper_id, **citations}
 
+    async def fetch_citation_network(self, paper_ids: list[str]) -> dict[str, CitationNetwork]:
+        """
+        Fetch citations for many papers with batched elink requests (async).
+
+        Args:
+            paper_ids (list[str]): The PubMed IDs (PMIDs) to fetch citations for.
+        Returns:
+            dict[str, CitationNetwork]: The citations of each paper, keyed by PMID.
+        """
+        logger.info(f"Fetching citations for {len(paper_ids)} PMIDs")
+        citations = await self.api.fetch_citations_batch(paper_ids)
+        return {pmid: CitationNetwork(pmid=pmid, **links) for pmid, links in citations.items()}
+
     # Common abstract method unification
     async def fetch_entities(self, entity_ids: list[str]) -> list[Any]:
         """
@@ -101,44 +172,106 @@ class PubMedDataCollector(BaseDataSource):
         return await self.fetch_papers(entity_ids)
 
     # Keep explicit collect_dataset for symmetry with GeneDataCollector
-    async def collect_dataset(self, query: str, max_results: int) -> PaperDataset:
+    async def collect_dataset(
+        self,
+        query: str,
+        max_results: int,
+        checkpoint_path: str | None = None,
+        batch_size: int = 200,
+        citation_batch_size: int = 2000,
+        concurrency: int = 4,
+    ) -> PaperDataset:
         """Collect PubMed dataset for given query.
 
+        With a checkpoint, the search result and every fetched batch of papers and
+        citations are journaled as they complete, and a rerun for the same query
+        resumes after the last completed batch. The journal is left in place; delete
+        it once the dataset is saved.
+
         Args:
             query: Search query string.
             max_results: Maximum number of results to collect.
+            checkpoint_path: JSONL journal to resume from and record progress in.
+            batch_size: PMIDs per efetch request.
+            citation_batch_size: PMIDs whose citations are fetched (and journaled) together.
+            concurrency: Efetch batches in flight at once (the rate limiter still paces them).
 
         Returns:
             PaperDataset containing collected papers and metadata.
         """
         logger.info("Collecting PubMed dataset...")
-        paper_ids = await self.search(query, max_results)
-        papers = await self.fetch_papers(paper_ids)
-
-        # Fetch citations with controlled concurrency (max 10 at a time to match API limit)
-        semaphore = asyncio.Semaphore(8)
+        journal = JsonlJournal(checkpoint_path) if checkpoint_path else None
+        checkpoint = CollectionCheckpoint()
+        if journal:
+            checkpoint = CollectionCheckpoint.replay(journal, query, max_results)
+
+        if checkpoint.pmids is None:
+            checkpoint.pmids = await self.search(query, max_results)
+            if journal:
+                journal.append(
+                    {
+                        "type": "search",
+                        "query": query,
+                        "max_results": max_results,
+                        "pmids": checkpoint.pmids,
+                    }
+                )
 
-        async def fetch_with_semaphore(paper: Paper) -> dict:
-            """
-            Fetch citations with semaphore.
+        pmids = checkpoint.pmids
+        semaphore = asyncio.Semaphore(concurrency)
 
-            Args:
-                paper (Paper): The paper to fetch citations for.
-            Returns:
-                dict: A dictionary containing the citations for the paper.
-            """
+        async def fetch_batch(batch: list[str]) -> None:
             async with semaphore:
-                return await self.fetch_citations(paper.pmid)
-
-        citation_tasks = [fetch_with_semaphore(paper) for paper in papers]
-        citations_list = await asyncio.gather(*citation_tasks)
-
-        citation_network = {}
-        for idx, (paper, citations) in enumerate(zip(papers, citations_list, strict=False), start=1):
-            logger.debug(
-                f"[{idx}/{len(papers)}] Processed citations for '{paper.title[:80]}' (PMID={paper.pmid})"
-            )
-            citation_network[paper.pmid] = CitationNetwork(**citations)
+                fetched = await self.fetch_papers(batch)
+            checkpoint.fetched.update(batch)
+            checkpoint.papers.update((paper.pmid, paper) for paper in fetched)
+            if journal:
+                journal.append(
+                    {
+                        "type": "papers",
+                        "pmids": batch,
+                        "papers": [paper.model_dump(mode="json") for paper in fetched],
+                    }
+                )
+            logger.info(f"Fetched {len(checkpoint.fetched)}/{len(pmids)} PMIDs")
+
+        # Batches complete (and are journaled) in any order; a failure cancels the rest
+        pending = [pmid for pmid in pmids if pmid not in checkpoint.fetched]
+        batches = [
+            asyncio.create_task(fetch_batch(pending[start : start + batch_size]))
+            for start in range(0, len(pending), batch_size)
+        ]
+        try:
+            await asyncio.gather(*batches)
+        except BaseException:
+            for task in batches:
+                task.cancel()
+            await asyncio.gather(*batches, return_exceptions=True)
+            raise
+
+        # Search order, without duplicates or PMIDs PubMed returned no record for
+        order = dict.fromkeys(pmids)
+        papers = [checkpoint.papers[pmid] for pmid in order if pmid in checkpoint.papers]
+
+        pending = [paper.pmid for paper in papers if paper.pmid not in checkpoint.citations]
+        for start in range(0, len(pending), citation_batch_size):
+            batch = await self.fetch_citation_network(pending[start : start + citation_batch_size])
+            checkpoint.citations.update(batch)
+            if journal:
+                journal.append(
+                    {
+                        "type": "citations",
+                        "citations": {
+                            pmid: links.model_dump(mode="json") for pmid, links in batch.items()
+                        },
+                    }
+                )
+        # PMIDs whose citations could not be fetched stay out of the checkpoint and are retried on resume
+        citation_network = {
+            paper.pmid: checkpoint.citations[paper.pmid]
+            for paper in papers
+            if paper.pmid in checkpoint.citations
+        }
 
         total_authors = sum(len(paper.authors) for paper in papers)
         total_mesh_terms = sum(len(paper.mesh_terms) for paper in papers)
@@ -157,180 +290,6 @@ class PubMedDataCollector(BaseDataSource):
         logger.info("PubMed dataset collection complete")
         return PaperDataset(metadata=metadata, papers=papers, citation_network=citation_network)
 
-    def _parse_paper(self, record: dict) -> Paper | None:
-        """
-        Parse a raw PubMed record into a Paper object.
-
-        Args:
-            record (dict): Raw PubMed record as returned by the API.
-        Returns:
-            Paper: Parsed Paper object with extracted details.
-        """
-        medline = record.get("MedlineCitation", {})
-        article = medline.get("Article", {})
-        pmid = str(medline.get("PMID", "")).strip()
-        if not pmid:
-            logger.debug("Skipping PubMed record with empty PMID")
-            return None
-        title = article.get("ArticleTitle", "")
-        abstract = self._extract_abstract(article)
-        authors = self._extract_authors(article)
-        mesh_terms = self._extract_mesh_terms(medline)
-        pub_date = self._extract_pub_date(article)
-        journal = article.get("Journal", {}).get("Title", "")
-        doi = None
-        article_ids = record.get("PubmedData", {}).get("ArticleIdList", [])
-        for aid in article_ids:
-            if hasattr(aid, "attributes") and aid.attributes.get("IdType") == "doi":
-                doi = str(aid)
-        return Paper(
-            pmid=pmid,
-            title=title,
-            abstract=abstract,
-            authors=authors,
-            mesh_terms=mesh_terms,
-            publication_date=pub_date,
-            journal=journal,
-            doi=doi or "",
-        )
-
-    def _extract_abstract(self, article: dict) -> str:
-        """
-        Extract the abstract text from a PubMed article record.
-
-        Args:
-            article (dict): The PubMed article record.
-
-        Returns:
-            str: The extracted abstract text.
-        """
-        abstract = ""
-        if "Abstract" in article:
-            abstract_parts = article["Abstract"].get("AbstractText", [])
-            if isinstance(abstract_parts, list):
-                abstract = " ".join([str(part) for part in abstract_parts])
-            else:
-                abstract = str(abstract_parts)
-        return abstract
-
-    def _extract_authors(self, article: dict) -> list:
-        """
-        Extract the authors from a PubMed article record.
-
-        Args:
-            article (dict): The PubMed article record.
-
-        Returns:
-            list: A list of Author objects.
-        """
-
-        authors: list[Author] = []
-        if "AuthorList" in article:
-            for author in article["AuthorList"]:
-                # Extract name fields
-                if "LastName" in author and "ForeName" in author:
-                    name = f"{author['ForeName']} {author['LastName']}"
-                    last_name = author["LastName"]
-                    first_name = author["ForeName"]
-                elif "CollectiveName" in author:
-                    name = author["CollectiveName"]
-                    last_name = ""
-                    first_name = ""
-                else:
-                    continue
-
-                # Robustly handle AffiliationInfo as list, dict, str, or missing
-                if "AffiliationInfo" in author:
-                    aff_info = author["AffiliationInfo"]
-                    if isinstance(aff_info, list):
-                        affiliations = [str(aff.get("Affiliation", "")) for aff in aff_info]
-                    elif isinstance(aff_info, dict):
-                        affiliations = [str(aff_info.get("Affiliation", ""))]
-                    elif isinstance(aff_info, str):
-                        affiliations = [aff_info]
-                    else:
-                        affiliations = []
-                else:
-                    affiliations = []
-
-                authors.append(
-                    Author(
-                        name=name,
-                        first_name=first_name,
-                        last_name=last_name,
-                        affiliations=affiliations,
-                    )
-                )
-        return authors
-
-    def _extract_mesh_terms(self, medline: dict) -> list:
-        """
-        Extract the MeSH terms from a PubMed article record.
-
-        Args:
-            medline (dict): The MedlineCitation part of the PubMed record.
-
-        Returns:
-            list: A list of MeSHTerm objects.
-        """
-
-        mesh_terms = []
-        if "MeshHeadingList" in medline:
-            for mesh in medline["MeshHeadingList"]:
-                descriptor = mesh.get("DescriptorName", {})
-                mesh_info: dict = {
-                    "term": str(descriptor),
-                    "major_topic": descriptor.attributes.get("MajorTopicYN") == "Y"
-                    if hasattr(descriptor, "attributes")
-                    else False,
-                    "ui": descriptor.attributes.get("UI", "")
-                    if hasattr(descriptor, "attributes")
-                    else "",
-                    "qualifiers": [],
-                }
-                if "QualifierName" in mesh:
-                    qualifiers = mesh["QualifierName"]
-                    if not isinstance(qualifiers, list):
-                        qualifiers = [qualifiers]
-                    mesh_info["qualifiers"] = [str(q) for q in qualifiers]
-                mesh_terms.append(MeSHTerm(**mesh_info))
-        return mesh_terms
-
-    def _extract_pub_date(self, article: dict) -> str:
-        """
-        Extract the publication date from a PubMed article record.
-
-        Args:
-            article (dict): The PubMed article record.
-
-        Returns:
-            str: The extracted publication date in YYYY-MM-DD format.
-        """
-        pub_date = ""
-        if "Journal" in article and "JournalIssue" in article["Journal"]:
-            pub_date_dict = article["Journal"]["JournalIssue"].get("PubDate", {})
-            year = pub_date_dict.get("Year", "")
-            month = pub_date_dict.get("Month", "01")
-            day = pub_date_dict.get("Day", "01")
-            month_map = {
-                "Jan": "01",
-                "Feb": "02",
-                "Mar": "03",
-                "Apr": "04",
-                "May": "05",
-                "Jun": "06",
-                "Jul": "07",
-                "Aug": "08",
-                "Sep": "09",
-                "Oct": "10",
-                "Nov": "11",
-                "Dec": "12",
-            }
-            month = month_map.get(month, month)
-            if year:
-                pub_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        return pub_date
-
 
 if __name__ == "__main__":
 
@@ -347,6 +306,11 @@ if __name__ == "__main__":
         default=1000,
         help="Maximum number of PubMed papers (PMIDs) to collect.",
     )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the checkpoint of an interrupted collection instead of resuming it.",
+    )
     args = parser.parse_args()
 
     async def main() -> None:
@@ -360,12 +324,18 @@ if __name__ == "__main__":
         email = settings.pubmed.email
         print("Using email:", email)
         print("Using api_key:", api_key)
+        checkpoint = JsonlJournal(settings.json_data.pubmed_checkpoint_path)
+        if args.fresh:
+            checkpoint.clear()
         collector = PubMedDataCollector()
         dataset = await collector.collect_dataset(
             query=args.query,
             max_results=args.max_results,
+            checkpoint_path=str(checkpoint.path),
         )
         with open(settings.json_data.pubmed_json_path, "w") as f:
             f.write(dataset.model_dump_json(indent=2))
+        # The dataset is saved; the next run starts a new collection
+        checkpoint.clear()
 
     asyncio.run(main())
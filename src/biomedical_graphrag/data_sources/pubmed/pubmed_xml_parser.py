@@ -0,0 +1,151 @@
+"""
+Streaming parser for PubMed efetch XML.
+
+`iter_papers` walks the response with `iterparse`, turns each `PubmedArticle`
+into a Paper as soon as its closing tag is read and then frees the element, so
+memory holds one article at a time instead of the whole document tree.
+`parse_papers_xml` is the picklable entry point used to parse large batches in
+a process pool.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from typing import IO
+
+from biomedical_graphrag.domain.author import Author
+from biomedical_graphrag.domain.meshterm import MeSHTerm
+from biomedical_graphrag.domain.paper import Paper
+
+MONTHS = {
+    "Jan": "01",
+    "Feb": "02",
+    "Mar": "03",
+    "Apr": "04",
+    "May": "05",
+    "Jun": "06",
+    "Jul": "07",
+    "Aug": "08",
+    "Sep": "09",
+    "Oct": "10",
+    "Nov": "11",
+    "Dec": "12",
+}
+
+
+def iter_papers(source: IO[bytes]) -> Iterator[Paper]:
+    """
+    Parse PubMed articles out of an efetch XML response one at a time.
+
+    Args:
+        source (IO[bytes]): The XML response (PubmedArticleSet).
+    Yields:
+        Paper: Each article with a PMID, in document order.
+    """
+    events = ET.iterparse(source, events=("start", "end"))
+    # The first event opens the root element (PubmedArticleSet)
+    _, root = next(events)
+    for event, elem in events:
+        if event == "start" or elem.tag != "PubmedArticle":
+            continue
+        paper = parse_article(elem)
+        # Drop the article (and its already-parsed children) from the tree
+        root.clear()
+        if paper is not None:
+            yield paper
+
+
+def parse_papers_xml(data: bytes) -> list[Paper]:
+    """
+    Parse a whole efetch XML response (runs in a worker process for large batches).
+
+    Args:
+        data (bytes): The XML response.
+    Returns:
+        list[Paper]: The parsed articles.
+    """
+    return list(iter_papers(io.BytesIO(data)))
+
+
+def parse_article(article: ET.Element) -> Paper | None:
+    """
+    Convert a `PubmedArticle` element into a Paper.
+
+    Args:
+        article (ET.Element): The PubmedArticle element.
+    Returns:
+        Paper | None: The paper, or None when the record has no PMID.
+    """
+    medline = article.find("MedlineCitation")
+    if medline is None:
+        return None
+    pmid = _text(medline.find("PMID")).strip()
+    if not pmid:
+        return None
+    details = medline.find("Article")
+    if details is None:
+        details = ET.Element("Article")
+    doi = ""
+    for article_id in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+        if article_id.get("IdType") == "doi":
+            doi = _text(article_id)
+    return Paper(
+        pmid=pmid,
+        title=_text(details.find("ArticleTitle")),
+        abstract=" ".join(_text(part) for part in details.iterfind("Abstract/AbstractText")),
+        authors=_authors(details),
+        mesh_terms=_mesh_terms(medline),
+        publication_date=_publication_date(details),
+        journal=_text(details.find("Journal/Title")),
+        doi=doi,
+    )
+
+
+def _text(elem: ET.Element | None) -> str:
+    # Includes text inside inline markup such as <i> or <sup>
+    return "".join(elem.itertext()) if elem is not None else ""
+
+
+def _authors(details: ET.Element) -> list[Author]:
+    authors: list[Author] = []
+    for author in details.iterfind("AuthorList/Author"):
+        last_name = author.find("LastName")
+        fore_name = author.find("ForeName")
+        collective = author.find("CollectiveName")
+        if last_name is not None and fore_name is not None:
+            first, last = _text(fore_name), _text(last_name)
+            name = f"{first} {last}"
+        elif collective is not None:
+            name, first, last = _text(collective), "", ""
+        else:
+            continue
+        affiliations = [_text(aff) for aff in author.iterfind("AffiliationInfo/Affiliation")]
+        authors.append(Author(name=name, first_name=first, last_name=last, affiliations=affiliations))
+    return authors
+
+
+def _mesh_terms(medline: ET.Element) -> list[MeSHTerm]:
+    terms: list[MeSHTerm] = []
+    for heading in medline.iterfind("MeshHeadingList/MeshHeading"):
+        descriptor = heading.find("DescriptorName")
+        terms.append(
+            MeSHTerm(
+                term=_text(descriptor),
+                major_topic=descriptor is not None and descriptor.get("MajorTopicYN") == "Y",
+                ui=descriptor.get("UI", "") if descriptor is not None else "",
+                qualifiers=[_text(q) for q in heading.iterfind("QualifierName")],
+            )
+        )
+    return terms
+
+
+def _publication_date(details: ET.Element) -> str:
+    pub_date = details.find("Journal/JournalIssue/PubDate")
+    if pub_date is None:
+        return ""
+    year = _text(pub_date.find("Year"))
+    if not year:
+        return ""
+    month = _text(pub_date.find("Month")) or "01"
+    day = _text(pub_date.find("Day")) or "01"
+    return f"{year}-{MONTHS.get(month, month).zfill(2)}-{day.zfill(2)}"
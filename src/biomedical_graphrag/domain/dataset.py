@@ -31,6 +31,9 @@ class GeneMetadata(BaseModel):
     total_linked_pmids: int = Field(
         default=0, description="Total count of linked PMIDs across all genes"
     )
+    resolved_pmids: list[str] = Field(
+        default_factory=list, description="PMIDs whose gene links are included (incremental refreshes)"
+    )
 
 
 class GeneDataset(BaseModel):
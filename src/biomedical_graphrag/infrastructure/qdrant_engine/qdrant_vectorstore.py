@@ -1,4 +1,7 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -10,9 +13,34 @@ from biomedical_graphrag.config import settings
 from biomedical_graphrag.domain.gene import GeneRecord
 from biomedical_graphrag.domain.paper import Paper
 from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.metrics_util import phase
 
 logger = setup_logging()
 
+# Embeddings already made while serving the current request, keyed by (text, dimensions)
+_shared_embeddings: ContextVar[dict[tuple[str, int], list[float]] | None] = ContextVar(
+    "graphrag_shared_embeddings", default=None
+)
+
+
+@contextmanager
+def share_embeddings() -> Iterator[None]:
+    """Reuse, within this context, embeddings of a text already embedded at the same dimensions."""
+    previous = _shared_embeddings.get()
+    _shared_embeddings.set({})
+    try:
+        yield
+    finally:
+        # set() rather than reset(): async generators may finish in another context
+        _shared_embeddings.set(previous)
+
+
+def remember_embedding(text: str, dimensions: int, vector: list[float]) -> None:
+    """Offer an embedding made elsewhere (e.g. for the answer cache) to `share_embeddings`."""
+    shared = _shared_embeddings.get()
+    if shared is not None:
+        shared[(text, dimensions)] = vector
+
 
 class AsyncQdrantVectorStore:
     """
@@ -31,7 +59,9 @@ class AsyncQdrantVectorStore:
         self.estimate_bm25_avg_len_on_x_docs = settings.qdrant.estimate_bm25_avg_len_on_x_docs
         self.cloud_inference = settings.qdrant.cloud_inference
 
-        self.openai_client = AsyncOpenAI(api_key=settings.openai.api_key.get_secret_value())
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.openai.api_key.get_secret_value(), base_url=settings.openai.base_url
+        )
 
         self.client = AsyncQdrantClient(
             url=self.url,
@@ -94,14 +124,34 @@ class AsyncQdrantVectorStore:
         Returns:
                 list[float]: The embedding vector.
         """
-        try:
-            embedding = await self.openai_client.embeddings.create( #TBD: redo to batches
-                model=settings.qdrant.embedding_model, input=text, dimensions=dimensions
-            )
-            return embedding.data[0].embedding
-        except Exception as e:
-            logger.error(f"❌ Failed to create embedding: {e}")
-            raise
+        return (await self._get_openai_vectors_batch([text], dimensions=dimensions))[0]
+
+    async def _get_openai_vectors_batch(self, texts: list[str], dimensions: int) -> list[list[float]]:
+        """
+        Get the embedding vectors for several texts in a single API call (async).
+        Args:
+                texts (list[str]): Input texts to embed.
+                dimensions (int): Number of dimensions for the embeddings.
+        Returns:
+                list[list[float]]: One embedding vector per text, in input order.
+        """
+        shared = _shared_embeddings.get() or {}
+        missing = [text for text in dict.fromkeys(texts) if (text, dimensions) not in shared]
+        vectors = {text: shared[(text, dimensions)] for text in texts if (text, dimensions) in shared}
+        if missing:
+            try:
+                with phase("embedding") as timing:
+                    embedding = await self.openai_client.embeddings.create(
+                        model=settings.qdrant.embedding_model, input=missing, dimensions=dimensions
+                    )
+                    timing.add_usage(embedding.usage)
+            except Exception as e:
+                logger.error(f"❌ Failed to create embedding: {e}")
+                raise
+            for item in embedding.data:
+                vectors[missing[item.index]] = item.embedding
+                remember_embedding(missing[item.index], dimensions, item.embedding)
+        return [vectors[text] for text in texts]
 
     def _define_openai_vectors(self, text: str, mrl_dimensions: int = 1536) -> models.Document:
         """
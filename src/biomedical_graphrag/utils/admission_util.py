@@ -0,0 +1,177 @@
+"""Admission control: bounded concurrency with a bounded, deadline-limited wait queue."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+
+from biomedical_graphrag.utils.metrics_util import REGISTRY
+
+ADMISSION_ACTIVE_METRIC = "graphrag_admission_active"
+ADMISSION_QUEUED_METRIC = "graphrag_admission_queued"
+ADMISSION_WAIT_METRIC = "graphrag_admission_wait_seconds"
+ADMISSION_REJECTED_METRIC = "graphrag_admission_rejected_total"
+
+
+class AdmissionRejected(Exception):
+    """The request was not admitted; retry after `retry_after` seconds.
+
+    Args:
+        reason: "queue_full" or "queue_timeout".
+        retry_after: Suggested delay before retrying, in whole seconds.
+    """
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(f"Request not admitted ({reason}); retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionSlot:
+    """A granted slot; `release` is idempotent so it can be called from several cleanup paths."""
+
+    def __init__(self, controller: "AdmissionController", wait_ms: float) -> None:
+        self._controller = controller
+        self._started = controller._clock()
+        self.wait_ms = wait_ms
+        self.released = False
+
+    def release(self) -> None:
+        """Give the slot back (to the longest-waiting request, if any)."""
+        if not self.released:
+            self.released = True
+            self._controller._release(self._controller._clock() - self._started)
+
+
+class AdmissionController:
+    """Limit concurrent work and queue the overflow first-in, first-out.
+
+    Up to `max_concurrent` callers hold a slot at once; up to `max_queued` more wait
+    for one, each for at most `queue_timeout_seconds`. Anything beyond is rejected
+    immediately, so overload turns into fast 503s instead of ever-growing latency.
+
+    Usage:
+        async with controller.admit():
+            ...
+
+    Args:
+        max_concurrent: Slots.
+        max_queued: Waiting callers allowed; 0 rejects as soon as every slot is busy.
+        queue_timeout_seconds: Longest wait for a slot.
+        name: `queue` label of the admission metrics.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int,
+        queue_timeout_seconds: float,
+        name: str = "graphrag",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.name = name
+        self._clock = clock
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Moving average of how long a slot is held, for Retry-After estimates
+        self._service_seconds = 1.0
+        self._publish()
+
+    @property
+    def active(self) -> int:
+        """Slots in use."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Callers waiting for a slot."""
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Estimated seconds until a new request would be admitted (at least 1)."""
+        backlog = (self.queued + 1) / self.max_concurrent
+        return max(1, math.ceil(self._service_seconds * backlog))
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[AdmissionSlot]:
+        """Hold a slot for the duration of the block (see `acquire`)."""
+        slot = await self.acquire()
+        try:
+            yield slot
+        finally:
+            slot.release()
+
+    async def acquire(self) -> AdmissionSlot:
+        """Wait for a slot.
+
+        Returns:
+            The slot; call `release` when done.
+
+        Raises:
+            AdmissionRejected: The queue is full, or no slot freed up before the deadline.
+        """
+        start = self._clock()
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            return self._admitted(start)
+        if self.queued >= self.max_queued:
+            raise self._reject("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._publish()
+        try:
+            async with asyncio.timeout(self.queue_timeout_seconds):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended
+                if isinstance(e, TimeoutError):
+                    return self._admitted(start)
+                self._release(None)
+                raise
+            self._discard(waiter)
+            if isinstance(e, TimeoutError):
+                raise self._reject("queue_timeout") from None
+            raise
+        return self._admitted(start)
+
+    def _admitted(self, start: float) -> AdmissionSlot:
+        wait_ms = (self._clock() - start) * 1000
+        REGISTRY.histogram(ADMISSION_WAIT_METRIC, queue=self.name).observe(wait_ms / 1000)
+        self._publish()
+        return AdmissionSlot(self, wait_ms)
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        REGISTRY.inc(ADMISSION_REJECTED_METRIC, queue=self.name, reason=reason)
+        return AdmissionRejected(reason, self.retry_after())
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        with suppress(ValueError):
+            self._waiters.remove(waiter)
+        self._publish()
+
+    def _release(self, held_seconds: float | None) -> None:
+        if held_seconds is not None:
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * held_seconds
+        # Hand the slot straight to the longest-waiting caller still waiting
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._publish()
+                return
+        self._active -= 1
+        self._publish()
+
+    def _publish(self) -> None:
+        REGISTRY.set_gauge(ADMISSION_ACTIVE_METRIC, self._active, queue=self.name)
+        REGISTRY.set_gauge(ADMISSION_QUEUED_METRIC, len(self._waiters), queue=self.name)
@@ -0,0 +1,86 @@
+"""Async single-value cache with TTL and background refresh."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from biomedical_graphrag.utils.logger_util import setup_logging
+from biomedical_graphrag.utils.singleflight_util import SingleFlight
+
+logger = setup_logging()
+
+
+class RefreshingCache[T]:
+    """Cache one expensive async value, refreshing it without making callers wait.
+
+    The first call loads the value. Once it is older than `ttl_seconds` the cached
+    value is still returned while one refresh runs in the background
+    (stale-while-revalidate). Concurrent loads are coalesced, and a failed background
+    refresh keeps the previous value.
+
+    Args:
+        loader: Coroutine factory producing the value.
+        ttl_seconds: Age after which the value is refreshed.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[T]],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._flight: SingleFlight[T] = SingleFlight()
+        self._value: T | None = None
+        self._loaded_at: float | None = None
+        self._background: set[asyncio.Task[T]] = set()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a value has been loaded."""
+        return self._loaded_at is not None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the value is missing or older than the TTL."""
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.ttl_seconds
+
+    async def get(self) -> T:
+        """Return the cached value, loading it on first use and refreshing it when stale."""
+        if not self.loaded:
+            return await self.refresh()
+        if self.stale:
+            self.refresh_in_background()
+        return self._value  # type: ignore[return-value]
+
+    async def refresh(self) -> T:
+        """Load a fresh value now (joining a refresh already in flight)."""
+        value, _ = await self._flight.do("refresh", self._load)
+        return value
+
+    def refresh_in_background(self) -> None:
+        """Start a refresh without waiting for it; failures are logged."""
+        if len(self._flight):
+            return
+        task = asyncio.ensure_future(self.refresh())
+        self._background.add(task)
+        task.add_done_callback(self._finish_background)
+
+    def invalidate(self) -> None:
+        """Mark the value stale so the next `get` refreshes it."""
+        if self._loaded_at is not None:
+            self._loaded_at = float("-inf")
+
+    async def _load(self) -> T:
+        value = await self._loader()
+        self._value = value
+        self._loaded_at = self._clock()
+        return value
+
+    def _finish_background(self, task: asyncio.Task[T]) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
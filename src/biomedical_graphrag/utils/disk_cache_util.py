@@ -0,0 +1,118 @@
+"""
+Content-addressed on-disk cache for raw API responses.
+
+Each entry is one file named after the SHA-256 of its key. Its modification time
+is when it was written (compared against the TTL the caller passes to `get`)
+and its access time is bumped on every hit, which gives the size-bounded LRU
+eviction its order without a separate index. Writes go through a temporary file
+and `os.replace`, so processes sharing a cache directory never read a partial
+entry.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from biomedical_graphrag.utils.logger_util import setup_logging
+
+logger = setup_logging()
+
+
+class DiskCache:
+    """Bytes cached on disk under string keys, with per-read TTLs and LRU eviction.
+
+    Args:
+        directory: Where entries live; created on first write.
+        max_bytes: Total size kept before the least recently used entries are evicted.
+        clock: Wall clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._size: int | None = None
+
+    def get(self, key: str, ttl_seconds: float | None = None) -> bytes | None:
+        """The cached value, unless it is missing or older than `ttl_seconds` (None: no limit)."""
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if ttl_seconds is not None and self._clock() - stat.st_mtime > ttl_seconds:
+                return None
+            data = path.read_bytes()
+            os.utime(path, (self._clock(), stat.st_mtime))
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a value, evicting the least recently used entries beyond `max_bytes`."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            now = self._clock()
+            os.utime(tmp, (now, now))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._size = self.size() + len(data) - previous
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def size(self) -> int:
+        """Total size of the entries, in bytes."""
+        if self._size is None:
+            self._size = sum(stat.st_size for _, stat in self._entries())
+        return self._size
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+        self._size = 0
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob("??/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue  # evicted by another process
+        return entries
+
+    def _evict(self) -> None:
+        # Rescan: other processes may share the directory
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_atime)
+        size = sum(stat.st_size for _, stat in entries)
+        target = self.max_bytes * 0.9  # leave headroom so every put does not rescan
+        evicted = 0
+        for path, stat in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            evicted += 1
+        self._size = size
+        logger.debug(f"Evicted {evicted} entries from {self.directory} ({size} bytes left)")
@@ -0,0 +1,67 @@
+"""
+Append-only JSONL journal for checkpointing long-running collections.
+
+Each record is one JSON object on its own line, flushed and fsynced before
+`append` returns, so a crash loses at most the record being written. A torn last
+line (the process died mid-write) is dropped on replay.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from biomedical_graphrag.utils.logger_util import setup_logging
+
+logger = setup_logging()
+
+
+class JsonlJournal:
+    """A JSONL file that records are appended to and replayed from.
+
+    Args:
+        path: Journal file; created (with its directory) on the first append.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        """Whether anything has been journaled yet."""
+        return self.path.is_file() and self.path.stat().st_size > 0
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Durably append one record."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Replay the journaled records in order.
+
+        A torn trailing line is cut off the file, so records appended after a
+        crash start on a line of their own.
+        """
+        if not self.path.is_file():
+            return
+        with open(self.path, "rb") as f:
+            offset = 0
+            for number, line in enumerate(f, start=1):
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Dropping incomplete last record of {self.path} (line {number})")
+                    f.close()
+                    os.truncate(self.path, offset)
+                    return
+                offset += len(line)
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring unreadable record at {self.path}:{number}")
+
+    def clear(self) -> None:
+        """Delete the journal."""
+        self.path.unlink(missing_ok=True)
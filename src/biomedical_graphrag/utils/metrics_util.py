@@ -0,0 +1,311 @@
+"""In-process latency and token accounting for the GraphRAG pipeline.
+
+`phase()` times a block with a monotonic clock, records it on the current request
+(see `record_request()`) and aggregates it into process-wide histograms in `REGISTRY`.
+`render_prometheus()` exposes the registry in the Prometheus text format.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds, the Prometheus base unit) for latency histograms,
+# from cache hits up to slow LLM calls
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Thread-safe histogram with fixed upper-bound buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observed values."""
+        return self._sum
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], float, int]:
+        """Return cumulative bucket counts, sum and count, read consistently."""
+        with self._lock:
+            counts, total, count = list(self._counts), self._sum, self._count
+        return self._cumulate(counts), total, count
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Return (upper bound, observations <= bound) pairs, ending with +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+        return self._cumulate(counts)
+
+    def _cumulate(self, counts: list[int]) -> list[tuple[float, int]]:
+        result: list[tuple[float, int]] = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside the matching bucket."""
+        cumulative = self.cumulative_counts()
+        total = cumulative[-1][1]
+        if total == 0:
+            return 0.0
+        rank = q * total
+        lower_bound, lower_count = 0.0, 0
+        for bound, count in cumulative:
+            if count >= rank:
+                if bound == float("inf"):
+                    return lower_bound
+                in_bucket = count - lower_count
+                fraction = (rank - lower_count) / in_bucket if in_bucket else 0.0
+                return lower_bound + (bound - lower_bound) * fraction
+            lower_bound, lower_count = bound, count
+        return lower_bound
+
+
+class MetricsRegistry:
+    """Named, labelled histograms, counters and gauges shared by the whole process."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[tuple[str, LabelKey], Histogram] = {}
+        self._counters: dict[tuple[str, LabelKey], float] = {}
+        self._gauges: dict[tuple[str, LabelKey], float] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, **labels: Any) -> Histogram:
+        """Get or create the histogram for a name and label set."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            return self._histograms[key]
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Increment a counter."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge to its current value."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._gauges[key] = value
+
+    def histograms(self) -> list[tuple[str, dict[str, str], Histogram]]:
+        """Return (name, labels, histogram) for every registered histogram."""
+        with self._lock:
+            items = list(self._histograms.items())
+        return [(name, dict(labels), hist) for (name, labels), hist in items]
+
+    def counters(self) -> list[tuple[str, dict[str, str], float]]:
+        """Return (name, labels, value) for every counter."""
+        with self._lock:
+            items = list(self._counters.items())
+        return [(name, dict(labels), value) for (name, labels), value in items]
+
+    def gauges(self) -> list[tuple[str, dict[str, str], float]]:
+        """Return (name, labels, value) for every gauge."""
+        with self._lock:
+            items = list(self._gauges.items())
+        return [(name, dict(labels), value) for (name, labels), value in items]
+
+    def reset(self) -> None:
+        """Drop all metrics (used by tests)."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def render_prometheus(registry: MetricsRegistry = REGISTRY) -> str:
+    """Render every metric in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        registry: Registry to render.
+
+    Returns:
+        The exposition text, one sample per line, series sorted by name and labels.
+    """
+    lines: list[str] = []
+    for kind, samples in (("counter", registry.counters()), ("gauge", registry.gauges())):
+        previous = None
+        for name, labels, value in sorted(samples, key=lambda s: (s[0], sorted(s[1].items()))):
+            if name != previous:
+                lines.append(f"# TYPE {name} {kind}")
+                previous = name
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    previous = None
+    for name, labels, hist in sorted(registry.histograms(), key=lambda h: (h[0], sorted(h[1].items()))):
+        if name != previous:
+            lines.append(f"# TYPE {name} histogram")
+            previous = name
+        buckets, total, count = hist.snapshot()
+        for bound, cumulative in buckets:
+            bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+            lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+PHASE_DURATION_METRIC = "graphrag_phase_duration_seconds"
+TOKENS_METRIC = "graphrag_tokens_total"
+
+
+@dataclass
+class PhaseTiming:
+    """Duration and token usage of one pipeline phase."""
+
+    name: str
+    labels: dict[str, Any] = field(default_factory=dict)
+    duration_ms: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def add_usage(self, usage: Any) -> None:
+        """Add token usage from an OpenAI Responses or Embeddings `usage` object."""
+        if usage is None:
+            return
+        # Responses report input_tokens, Embeddings report prompt_tokens
+        input_tokens = getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", 0)
+        self.input_tokens += input_tokens or 0
+        self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for API metadata; token fields are omitted when no usage was recorded."""
+        data: dict[str, Any] = {"name": self.name, "duration_ms": round(self.duration_ms, 2)}
+        if self.labels:
+            data["labels"] = self.labels
+        if self.input_tokens or self.output_tokens:
+            data["input_tokens"] = self.input_tokens
+            data["output_tokens"] = self.output_tokens
+        return data
+
+
+@dataclass
+class RequestMetrics:
+    """Phases recorded while serving one request."""
+
+    phases: list[PhaseTiming] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    def summary(self) -> dict[str, Any]:
+        """Return total latency, per-phase timings and total token usage."""
+        return {
+            "latency_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "phases": [p.to_dict() for p in self.phases],
+            "usage": {
+                "input_tokens": sum(p.input_tokens for p in self.phases),
+                "output_tokens": sum(p.output_tokens for p in self.phases),
+            },
+        }
+
+
+_current_request: ContextVar[RequestMetrics | None] = ContextVar(
+    "graphrag_request_metrics", default=None
+)
+
+
+@contextmanager
+def record_request(metrics: RequestMetrics | None = None) -> Iterator[RequestMetrics]:
+    """Collect the phases run in this context (including `asyncio.to_thread` workers).
+
+    Pass `metrics` to keep adding to a request recorded in several steps.
+    """
+    previous = _current_request.get()
+    metrics = metrics or RequestMetrics()
+    _current_request.set(metrics)
+    try:
+        yield metrics
+    finally:
+        # set() rather than reset(): async generators may finish in another context
+        _current_request.set(previous)
+
+
+@contextmanager
+def phase(name: str, **labels: Any) -> Iterator[PhaseTiming]:
+    """Time a pipeline phase; call `add_usage` on the yielded record to attach token usage.
+
+    Args:
+        name: Phase name, e.g. "embedding", "qdrant_query", "llm".
+        **labels: Extra dimensions, e.g. `step="summary"` or `tool="get_genes_in_same_papers"`.
+    """
+    timing = PhaseTiming(name=name, labels=labels)
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.duration_ms = (time.perf_counter() - start) * 1000
+        REGISTRY.histogram(PHASE_DURATION_METRIC, phase=name, **labels).observe(
+            timing.duration_ms / 1000
+        )
+        if timing.input_tokens:
+            REGISTRY.inc(TOKENS_METRIC, timing.input_tokens, phase=name, kind="input", **labels)
+        if timing.output_tokens:
+            REGISTRY.inc(TOKENS_METRIC, timing.output_tokens, phase=name, kind="output", **labels)
+        metrics = _current_request.get()
+        if metrics is not None:
+            metrics.phases.append(timing)
@@ -0,0 +1,163 @@
+"""
+Token-bucket rate limiting for outbound API calls (NCBI E-utilities).
+
+Tokens refill at `rate` per second up to `burst`, so a caller that was idle can
+send a few requests back to back while the long-run rate stays at `rate`. Callers
+reserve a token and sleep outside any lock, so concurrent callers queue up in
+reservation order instead of serializing behind one another's sleeps.
+
+When the server answers 429, `throttled` halves the rate (down to `min_rate`) and
+drains the burst; the rate then climbs back to `rate` over `recovery_seconds`.
+
+With a `state_path`, the bucket lives in a small JSON file guarded by an exclusive
+`flock`, so every process pointing at the same file shares one budget (POSIX only;
+elsewhere the bucket falls back to per-process state).
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from biomedical_graphrag.utils.logger_util import setup_logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = setup_logging()
+
+# NCBI's documented limits: https://www.ncbi.nlm.nih.gov/books/NBK25497/
+NCBI_RATE_WITH_KEY = 10.0
+NCBI_RATE_WITHOUT_KEY = 3.0
+
+
+def ncbi_rate(api_key: str) -> float:
+    """Requests per second NCBI allows with or without an API key."""
+    return NCBI_RATE_WITH_KEY if api_key else NCBI_RATE_WITHOUT_KEY
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    rate: float
+    updated_at: float
+    throttled_at: float | None = None
+
+
+class TokenBucket:
+    """Async token bucket with burst, 429 back-off and optional cross-process sharing.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Requests that can be sent back to back after an idle period.
+        min_rate: Lowest rate `throttled` backs off to.
+        recovery_seconds: Time to climb from a throttled rate back to `rate`.
+        state_path: JSON file shared by every process using the same budget; None keeps
+            the bucket in this process.
+        clock: Wall clock (shared across processes), injectable for tests.
+        sleep: Async sleep, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 0.5,
+        recovery_seconds: float = 30.0,
+        state_path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery_seconds = recovery_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._state_path = Path(state_path) if state_path and fcntl is not None else None
+        if state_path and self._state_path is None:
+            logger.warning("File locking is unavailable; the Entrez rate limit is per process")
+        self._state = _BucketState(tokens=float(burst), rate=rate, updated_at=clock())
+
+    @property
+    def current_rate(self) -> float:
+        """The rate in effect now, below `rate` while recovering from a 429."""
+        return self._update(lambda state: state.rate)
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        wait = await self._update_async(self._reserve)
+        if wait > 0:
+            await self._sleep(wait)
+
+    async def throttled(self) -> None:
+        """Record a 429 (Too Many Requests): halve the rate and drop the saved-up burst."""
+        await self._update_async(self._back_off)
+
+    def _reserve(self, state: _BucketState) -> float:
+        # Tokens may go negative: each caller owns the slot after the previous reservation
+        state.tokens -= 1
+        return max(0.0, -state.tokens / state.rate)
+
+    def _back_off(self, state: _BucketState) -> None:
+        now = state.updated_at
+        # A burst of in-flight requests all failing counts as one 429
+        if state.throttled_at is not None and now - state.throttled_at < 1.0:
+            return
+        state.rate = max(self.min_rate, state.rate / 2)
+        state.tokens = min(state.tokens, 0.0)
+        state.throttled_at = now
+        logger.warning(f"Rate limited by the server; slowing down to {state.rate:.2f} req/s")
+
+    def _refill(self, state: _BucketState) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - state.updated_at)
+        if state.rate < self.rate:
+            recovery = max(self.recovery_seconds, 1e-9)
+            state.rate = min(self.rate, state.rate + elapsed * self.rate / recovery)
+        state.tokens = min(float(self.burst), state.tokens + elapsed * state.rate)
+        state.updated_at = now
+
+    async def _update_async[T](self, change: Callable[[_BucketState], T]) -> T:
+        if self._state_path is None:
+            return self._update(change)
+        # flock blocks while another process holds the file; keep that off the event loop
+        return await asyncio.to_thread(self._update, change)
+
+    def _update[T](self, change: Callable[[_BucketState], T]) -> T:
+        if self._state_path is None:
+            self._refill(self._state)
+            return change(self._state)
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._state_path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                state = self._load(f.read())
+                self._refill(state)
+                result = change(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(asdict(state)))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self, raw: str) -> _BucketState:
+        try:
+            state = _BucketState(**json.loads(raw))
+        except (ValueError, TypeError):
+            # New or unreadable file: start full
+            return _BucketState(tokens=float(self.burst), rate=self.rate, updated_at=self._clock())
+        # Another process may have been configured differently
+        state.rate = min(state.rate, self.rate)
+        return state
@@ -0,0 +1,44 @@
+"""Coalescing of identical concurrent async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[T]:
+    """Run at most one call per key at a time; concurrent callers share its result.
+
+    The shared call runs in its own task, so a caller that gets cancelled (e.g. a
+    client disconnect) does not cancel the work other callers are waiting on.
+    Exceptions are propagated to every caller of that flight.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run `fn` for `key`, or join the call already in flight for it.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced.
+            fn: Zero-argument coroutine factory, only invoked by the first caller.
+
+        Returns:
+            The result and whether it was shared with an earlier caller.
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved if every caller was cancelled before it finished
+        if not task.cancelled():
+            task.exception()
@@ -1,5 +1,10 @@
 """Test configuration and fixtures."""
 
+import os
+
+# The hybrid service builds its OpenAI client at import time; give it a dummy key.
+os.environ.setdefault("OPENAI__API_KEY", "test-key")
+
 from unittest.mock import AsyncMock, Mock
 
 import pytest
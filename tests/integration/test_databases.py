@@ -25,6 +25,7 @@ class TestQdrantIntegration:
             mock_settings.qdrant.estimate_bm25_avg_len_on_x_docs = 300
             mock_settings.qdrant.cloud_inference = False
             mock_settings.openai.api_key.get_secret_value.return_value = "test-openai-key"
+            mock_settings.openai.base_url = None
 
             with patch(
                 "biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore.AsyncQdrantClient"
@@ -0,0 +1,103 @@
+"""Unit tests for admission control."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.utils.admission_util import (
+    ADMISSION_QUEUED_METRIC,
+    ADMISSION_REJECTED_METRIC,
+    AdmissionController,
+    AdmissionRejected,
+)
+from biomedical_graphrag.utils.metrics_util import REGISTRY
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+def test_admits_up_to_the_limit_then_queues_in_order() -> None:
+    async def run() -> list[str]:
+        controller = AdmissionController(max_concurrent=2, max_queued=5, queue_timeout_seconds=1)
+        order: list[str] = []
+
+        async def work(name: str) -> None:
+            async with controller.admit():
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(work(str(i))) for i in range(5)]
+        await asyncio.sleep(0)
+        assert controller.active == 2
+        assert controller.queued == 3
+        await asyncio.gather(*tasks)
+        assert (controller.active, controller.queued) == (0, 0)
+        return order
+
+    assert asyncio.run(run()) == ["0", "1", "2", "3", "4"]
+
+
+def test_rejects_when_queue_is_full() -> None:
+    async def run() -> None:
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=1)
+        slot = await controller.acquire()
+        waiting = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == "queue_full"
+        assert rejected.value.retry_after >= 1
+
+        slot.release()
+        (await waiting).release()
+        assert controller.active == 0
+
+    asyncio.run(run())
+    assert ("graphrag_admission_rejected_total", {"queue": "graphrag", "reason": "queue_full"}, 1.0) in [
+        (name, labels, value) for name, labels, value in REGISTRY.counters()
+    ]
+
+
+def test_queue_deadline_rejects_and_frees_the_queue_position() -> None:
+    async def run() -> None:
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=0.01)
+        slot = await controller.acquire()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.reason == "queue_timeout"
+        assert controller.queued == 0
+
+        slot.release()
+        assert controller.active == 0
+
+    asyncio.run(run())
+    rejected = {
+        labels["reason"] for name, labels, _ in REGISTRY.counters() if name == ADMISSION_REJECTED_METRIC
+    }
+    assert rejected == {"queue_timeout"}
+
+
+def test_cancelled_waiter_leaves_the_queue() -> None:
+    async def run() -> None:
+        controller = AdmissionController(max_concurrent=1, max_queued=2, queue_timeout_seconds=1)
+        slot = await controller.acquire()
+        waiting = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert controller.queued == 0
+
+        slot.release()
+        slot.release()  # idempotent
+        assert controller.active == 0
+
+    asyncio.run(run())
+    gauges = {name: value for name, _, value in REGISTRY.gauges()}
+    assert gauges[ADMISSION_QUEUED_METRIC] == 0
@@ -0,0 +1,96 @@
+"""Unit tests for the semantic answer cache."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from biomedical_graphrag.application.services.hybrid_service.answer_cache import SemanticAnswerCache
+from biomedical_graphrag.infrastructure.qdrant_engine.qdrant_vectorstore import (
+    AsyncQdrantVectorStore,
+    remember_embedding,
+    share_embeddings,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(clock: FakeClock | None = None, max_entries: int = 10) -> SemanticAnswerCache:
+    return SemanticAnswerCache(
+        threshold=0.9, ttl_seconds=60, max_entries=max_entries, clock=clock or FakeClock()
+    )
+
+
+def test_similar_question_hits() -> None:
+    cache = make_cache()
+    cache.put("CCR5 co-mentioned genes", [1.0, 0.0, 0.0], (5, False), "answer")
+    hit = cache.get([0.99, 0.05, 0.0], (5, False))
+    assert hit is not None
+    value, similarity = hit
+    assert value == "answer"
+    assert similarity > 0.99
+
+
+def test_dissimilar_question_and_other_key_miss() -> None:
+    cache = make_cache()
+    cache.put("CCR5 co-mentioned genes", [1.0, 0.0], (5, False), "answer")
+    assert cache.get([0.0, 1.0], (5, False)) is None
+    assert cache.get([1.0, 0.0], (3, False)) is None
+    assert cache.get([1.0, 0.0], (5, True)) is None
+
+
+def test_best_match_wins() -> None:
+    cache = make_cache()
+    cache.put("a", [1.0, 0.2], (5, False), "close")
+    cache.put("b", [1.0, 0.0], (5, False), "exact")
+    assert cache.get([2.0, 0.0], (5, False))[0] == "exact"
+
+
+def test_entries_expire() -> None:
+    clock = FakeClock()
+    cache = make_cache(clock)
+    cache.put("q", [1.0, 0.0], (5, False), "answer")
+    clock.now = 61
+    assert cache.get([1.0, 0.0], (5, False)) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = make_cache(max_entries=2)
+    cache.put("a", [1.0, 0.0, 0.0], (5, False), "a")
+    cache.put("b", [0.0, 1.0, 0.0], (5, False), "b")
+    assert cache.get([1.0, 0.0, 0.0], (5, False)) is not None  # touch "a"
+    cache.put("c", [0.0, 0.0, 1.0], (5, False), "c")
+    assert cache.get([0.0, 1.0, 0.0], (5, False)) is None
+    assert cache.get([1.0, 0.0, 0.0], (5, False)) is not None
+
+
+def test_version_change_clears_cache() -> None:
+    cache = make_cache()
+    assert cache.set_version((100, 50, 70)) is False
+    cache.put("q", [1.0, 0.0], (5, False), "answer")
+    assert cache.set_version((100, 50, 70)) is False
+    assert len(cache) == 1
+    assert cache.set_version((101, 50, 70)) is True
+    assert len(cache) == 0
+
+
+def test_lookup_embedding_is_reused_by_retrieval() -> None:
+    store = AsyncQdrantVectorStore.__new__(AsyncQdrantVectorStore)
+    store.openai_client = Mock()
+    store.openai_client.embeddings.create = AsyncMock(
+        return_value=SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[0.0, 1.0])], usage=None)
+    )
+
+    async def run() -> list[list[float]]:
+        with share_embeddings():
+            remember_embedding("CCR5 genes", 2, [1.0, 0.0])
+            return await store._get_openai_vectors_batch(["CCR5 genes", "TP53"], dimensions=2)
+
+    assert asyncio.run(run()) == [[1.0, 0.0], [0.0, 1.0]]
+    assert store.openai_client.embeddings.create.await_args.kwargs["input"] == ["TP53"]
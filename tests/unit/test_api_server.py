@@ -1,5 +1,8 @@
 """Unit tests for FastAPI server endpoints."""
 
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -9,13 +12,24 @@ from biomedical_graphrag.api.server import (
     SearchResponse,
     TraceStep,
     app,
+    get_services,
 )
+from biomedical_graphrag.api.services import ServiceContainer
+
+
+@pytest.fixture
+def services() -> ServiceContainer:
+    """A service container with no clients; tests plug in the pipeline functions they need."""
+    return ServiceContainer()
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+def client(services: ServiceContainer):
+    """Create a test client for the FastAPI app, injecting the test service container."""
+    app.dependency_overrides[get_services] = lambda: services
+    app.state.services = services
+    yield TestClient(app)
+    app.dependency_overrides.clear()
 
 
 class TestHealthEndpoint:
@@ -77,3 +91,419 @@ class TestSearchEndpoint:
     def test_search_invalid_limit(self, client: TestClient) -> None:
         response = client.post("/api/graphrag-query", json={"query": "test", "limit": -1})
         assert response.status_code == 422
+
+    def test_identical_concurrent_searches_are_coalesced(self, services: ServiceContainer) -> None:
+        from biomedical_graphrag.api import server
+
+        calls: list[str] = []
+
+        async def fake_run(question: str, limit: int = 5, planner: bool | None = None) -> str:
+            calls.append(question)
+            await asyncio.sleep(0.01)
+            return f"answer to {question}"
+
+        services.run_search = fake_run
+
+        async def run() -> list[tuple[str, bool]]:
+            return await asyncio.gather(
+                server._run_search(services, SearchRequest(query="CCR5 genes")),
+                server._run_search(services, SearchRequest(query="  ccr5   GENES ")),
+                server._run_search(services, SearchRequest(query="CCR5 genes", limit=3)),
+            )
+
+        results = asyncio.run(run())
+        assert len(calls) == 2
+        assert results[0] == ("answer to CCR5 genes", False)
+        assert results[1] == ("answer to CCR5 genes", True)
+        assert results[2][1] is False
+
+
+class TestSearchTrace:
+    @pytest.fixture
+    def fake_search(self, services: ServiceContainer) -> None:
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+            GraphRAGResult,
+            ToolExecution,
+        )
+
+        paper = {"pmid": "123", "title": "CCR5 and HIV", "abstract": "A long abstract. " * 200}
+        hits = [{"id": 7, "score": 0.9, "payload": {"paper": paper}}]
+        genes = [{"gene": "CD4", "shared_papers": 2}]
+
+        async def fake_run(question: str, limit: int = 5, planner: bool | None = None):
+            return GraphRAGResult(
+                summary="CCR5 matters.",
+                qdrant_results=hits,
+                neo4j_results={},
+                trace=[
+                    ToolExecution(
+                        name="retrieve_papers_hybrid",
+                        arguments={"query": question},
+                        result_count=1,
+                        results=hits,
+                    ),
+                    ToolExecution(name="get_genes_in_same_papers", result_count=1, results=genes),
+                ],
+            )
+
+        services.run_search = fake_run
+
+    def test_counts_trace_has_no_payloads(self, client: TestClient, fake_search: None) -> None:
+        response = client.post("/api/graphrag-query", json={"query": "CCR5", "trace": "counts"})
+        trace = response.json()["trace"]
+        assert trace[0] == {
+            "name": "retrieve_papers_hybrid",
+            "arguments": {"query": "CCR5"},
+            "result_count": 1,
+        }
+        assert "results" not in trace[1]
+
+    def test_names_trace(self, client: TestClient, fake_search: None) -> None:
+        trace = client.post("/api/graphrag-query", json={"query": "CCR5", "trace": "names"}).json()[
+            "trace"
+        ]
+        assert trace == [{"name": "retrieve_papers_hybrid"}, {"name": "get_genes_in_same_papers"}]
+
+    def test_full_trace_references_papers_by_id(self, client: TestClient, fake_search: None) -> None:
+        body = client.post("/api/graphrag-query", json={"query": "CCR5"}).json()
+        assert body["trace"][0]["result_ids"] == ["123"]
+        assert "results" not in body["trace"][0]
+        assert body["results"][0]["id"] == "123"
+        assert body["trace"][1]["results"] == [{"gene": "CD4", "shared_papers": 2}]
+
+    def test_large_responses_are_gzipped(self, client: TestClient, fake_search: None) -> None:
+        response = client.post(
+            "/api/graphrag-query", json={"query": "CCR5"}, headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["summary"] == "CCR5 matters."
+
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+
+class TestPapersPagination:
+    @pytest.fixture
+    def ranking(self, services: ServiceContainer) -> list[dict]:
+        from qdrant_client.models import models
+
+        from biomedical_graphrag.application.services.hybrid_service.qdrant_query import RetrievalQuery
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import GraphRAGResult
+
+        ranking = [
+            {"id": i, "score": 1 / i, "payload": {"paper": {"pmid": str(i), "title": f"Paper {i}"}}}
+            for i in range(1, 13)
+        ]
+        query = RetrievalQuery(tool="retrieve_papers_dense", request=models.QueryRequest(query=[0.1]))
+
+        async def fake_run(question: str, limit: int = 5, planner: bool | None = None):
+            return GraphRAGResult(
+                summary="s", qdrant_results=ranking[:limit], neo4j_results={}, retrieval=query
+            )
+
+        async def fake_fetch_page(retrieval: RetrievalQuery, limit: int, exclude_ids: list) -> list:
+            assert retrieval is query
+            return [r for r in ranking if r["id"] not in exclude_ids][:limit]
+
+        services.run_search = fake_run
+        services.fetch_page = fake_fetch_page
+        return ranking
+
+    def test_cursor_pages_past_the_first_results(self, client: TestClient, ranking: list[dict]) -> None:
+        search = client.post("/api/graphrag-query", json={"query": "CCR5", "limit": 5}).json()
+        assert [r["pmid"] for r in search["results"]] == ["1", "2", "3", "4", "5"]
+
+        page = client.post("/api/graphrag-query/papers", json={"cursor": search["next_cursor"]}).json()
+        assert [r["pmid"] for r in page["results"]] == ["6", "7", "8", "9", "10"]
+        last = client.post(
+            "/api/graphrag-query/papers", json={"cursor": page["next_cursor"], "limit": 5}
+        ).json()
+        assert [r["pmid"] for r in last["results"]] == ["11", "12"]
+        assert "next_cursor" not in last
+
+    def test_unknown_and_malformed_cursors(self, client: TestClient, ranking: list[dict]) -> None:
+        response = client.post("/api/graphrag-query/papers", json={"cursor": "gone.5"})
+        assert response.status_code == 410
+        response = client.post("/api/graphrag-query/papers", json={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+
+class TestSearchJobs:
+    """Jobs outlive the request that submitted them, so these run in one event loop."""
+
+    @pytest.fixture
+    def fake_stream(self, services: ServiceContainer) -> asyncio.Event:
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+            GraphRAGResult,
+            PipelineEvent,
+            QdrantSearchResult,
+            ToolExecution,
+        )
+
+        summary_started = asyncio.Event()
+
+        async def fake_pipeline(question: str, limit: int = 5, planner: bool | None = None):
+            hits = [{"id": 1, "score": 0.9, "payload": {"paper": {"pmid": "1"}}}]
+            yield PipelineEvent("papers", QdrantSearchResult(results=hits, tool=ToolExecution("hybrid")))
+            summary_started.set()
+            if question == "slow":
+                await asyncio.sleep(60)
+            yield PipelineEvent("summary_delta", "Done.")
+            yield PipelineEvent(
+                "done", GraphRAGResult(summary="Done.", qdrant_results=hits, neo4j_results={})
+            )
+
+        services.stream_search = fake_pipeline
+        return summary_started
+
+    def test_submit_poll_and_cancel(
+        self, client: TestClient, services: ServiceContainer, fake_stream: asyncio.Event
+    ) -> None:
+        import httpx
+
+        async def run() -> None:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                submitted = await http.post("/api/graphrag-query/jobs", json={"query": "CCR5"})
+                assert submitted.status_code == 202
+                job_id = submitted.json()["job_id"]
+                assert submitted.headers["location"] == f"/api/graphrag-query/jobs/{job_id}"
+
+                while (poll := (await http.get(f"/api/graphrag-query/jobs/{job_id}")).json())[
+                    "status"
+                ] != "succeeded":
+                    await asyncio.sleep(0.01)
+                assert poll["result"]["summary"] == "Done."
+                assert poll["result"]["results"][0]["pmid"] == "1"
+
+                fake_stream.clear()
+                slow = (await http.post("/api/graphrag-query/jobs", json={"query": "slow"})).json()
+                await asyncio.wait_for(fake_stream.wait(), timeout=1)
+                # A running job holds an admission slot like any other search
+                assert services.admission.active == 1
+                cancelled = await http.delete(f"/api/graphrag-query/jobs/{slow['job_id']}")
+                assert cancelled.json()["status"] == "cancelled"
+                while services.admission.active:
+                    await asyncio.sleep(0.01)
+
+                missing = await http.get("/api/graphrag-query/jobs/unknown")
+                assert missing.status_code == 404
+            await services.jobs.close()
+
+        asyncio.run(run())
+
+
+class TestAdmissionControl:
+    @pytest.fixture
+    def busy(self, services: ServiceContainer) -> None:
+        from biomedical_graphrag.utils.admission_util import AdmissionController
+
+        async def fake_run(question: str, limit: int = 5, planner: bool | None = None) -> str:
+            raise AssertionError("a rejected request must not run the pipeline")
+
+        services.run_search = fake_run
+        services.admission = AdmissionController(max_concurrent=1, max_queued=0, queue_timeout_seconds=1)
+        asyncio.run(services.admission.acquire())
+
+    def test_search_is_rejected_with_retry_after(self, client: TestClient, busy: None) -> None:
+        response = client.post("/api/graphrag-query", json={"query": "CCR5"})
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) >= 1
+
+    def test_stream_is_rejected_before_streaming(self, client: TestClient, busy: None) -> None:
+        response = client.post("/api/graphrag-query/stream", json={"query": "CCR5"})
+        assert response.status_code == 503
+        assert "retry-after" in response.headers
+
+
+class TestSearchStreamEndpoint:
+    @pytest.fixture
+    def fake_stream(self, services: ServiceContainer) -> None:
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+            GraphRAGResult,
+            PipelineEvent,
+            QdrantSearchResult,
+            ToolExecution,
+        )
+
+        paper = {"pmid": "123", "title": "CCR5 and HIV", "authors": [{"name": "Jane Roe"}]}
+        hits = [{"id": 123, "score": 0.9, "payload": {"paper": paper}}]
+        tool = ToolExecution(name="get_genes_in_same_papers", arguments={"target_gene": "CCR5"})
+
+        async def fake_pipeline(question: str, limit: int = 5, planner: bool | None = None):
+            retrieval = QdrantSearchResult(results=hits, tool=ToolExecution(name="hybrid"))
+            yield PipelineEvent("papers", retrieval)
+            yield PipelineEvent("tool_result", tool)
+            yield PipelineEvent("summary_delta", "CCR5 ")
+            yield PipelineEvent("summary_delta", "matters.")
+            result = GraphRAGResult(
+                summary="CCR5 matters.", qdrant_results=hits, neo4j_results={}, trace=[tool]
+            )
+            yield PipelineEvent("done", result)
+
+        services.stream_search = fake_pipeline
+
+    def test_stream_emits_events_in_order(
+        self, client: TestClient, services: ServiceContainer, fake_stream: None
+    ) -> None:
+        response = client.post("/api/graphrag-query/stream", json={"query": "CCR5"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = [block for block in response.text.split("\n\n") if block]
+        names = [block.split("\n")[0].removeprefix("event: ") for block in events]
+        assert names == ["papers", "tool_result", "summary", "summary", "done"]
+        assert services.admission.active == 0
+
+        first = json.loads(events[0].split("\n")[1].removeprefix("data: "))
+        assert first["results"][0]["pmid"] == "123"
+        assert first["results"][0]["authors"] == ["Jane Roe"]
+        done = json.loads(events[-1].split("\n")[1].removeprefix("data: "))
+        assert done["summary"] == "CCR5 matters."
+
+    def test_stream_missing_query(self, client: TestClient) -> None:
+        response = client.post("/api/graphrag-query/stream", json={})
+        assert response.status_code == 422
+
+
+class TestBatchSearchEndpoint:
+    def test_batch_streams_one_line_per_query(
+        self, client: TestClient, services: ServiceContainer
+    ) -> None:
+        from biomedical_graphrag.application.services.hybrid_service.batch_pipeline import (
+            BatchItemResult,
+        )
+        from biomedical_graphrag.application.services.hybrid_service.tool_calling import (
+            GraphRAGResult,
+            ToolExecution,
+        )
+
+        hits = [{"id": 1, "score": 0.9, "payload": {"paper": {"pmid": "1", "title": "CCR5"}}}]
+
+        admitted: list[int] = []
+
+        async def fake_batch(
+            questions: list[str], limit: int = 5, planner: bool | None = None, concurrency: int = 1
+        ):
+            admitted.append(services.admission.active)
+            yield BatchItemResult(index=1, question=questions[1], error=RuntimeError("boom"))
+            result = GraphRAGResult(
+                summary="CCR5 matters.",
+                qdrant_results=hits,
+                neo4j_results={},
+                trace=[ToolExecution(name="summarize", duration_ms=1.0)],
+            )
+            yield BatchItemResult(index=0, question=questions[0], result=result)
+
+        services.run_batch = fake_batch
+
+        response = client.post("/api/graphrag-query/batch", json={"queries": ["CCR5", "TP53"]})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"index": 1, "query": "TP53", "error": "Search failed"}
+        assert lines[1]["index"] == 0
+        assert lines[1]["summary"] == "CCR5 matters."
+        assert lines[1]["results"][0]["pmid"] == "1"
+        assert lines[1]["trace"][0]["duration_ms"] == 1.0
+        # One admission slot per question processed at once
+        assert admitted == [2]
+        assert services.admission.active == 0
+
+    def test_batch_rejects_empty_queries(self, client: TestClient) -> None:
+        response = client.post("/api/graphrag-query/batch", json={"queries": []})
+        assert response.status_code == 422
+
+
+class TestNeo4jStatsEndpoint:
+    @pytest.fixture
+    def stats_loads(self, services: ServiceContainer) -> list[int]:
+        from biomedical_graphrag.utils.cache_util import RefreshingCache
+
+        loads: list[int] = []
+
+        async def read_stats() -> dict:
+            loads.append(1)
+            return {
+                "labels": [{"label": "Paper", "count": 3}],
+                "relationship_types": [{"type": "HAS_MESH_TERM", "count": 5}],
+                "nodes": 3,
+                "relationships": 5,
+            }
+
+        services.graph_stats = RefreshingCache(read_stats, ttl_seconds=60)
+        return loads
+
+    def test_stats_are_cached_with_etag(self, client: TestClient, stats_loads: list[int]) -> None:
+        first = client.get("/api/neo4j/stats")
+        second = client.get("/api/neo4j/stats")
+
+        assert first.status_code == 200
+        assert first.json()["totalNodes"] == 3
+        assert first.json()["nodeLabels"] == [{"label": "Paper", "count": 3}]
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+        assert len(stats_loads) == 1
+
+    def test_matching_etag_returns_not_modified(
+        self, client: TestClient, stats_loads: list[int]
+    ) -> None:
+        etag = client.get("/api/neo4j/stats").headers["etag"]
+
+        response = client.get("/api/neo4j/stats", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/api/neo4j/stats", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+    def test_refresh_starts_background_reload(
+        self, client: TestClient, services: ServiceContainer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        refreshes: list[int] = []
+        monkeypatch.setattr(services.graph_stats, "refresh_in_background", lambda: refreshes.append(1))
+
+        response = client.post("/api/neo4j/stats/refresh")
+        assert response.status_code == 202
+        assert refreshes == [1]
+
+
+class TestMetricsEndpoint:
+    def test_exposes_pipeline_and_http_metrics(self, client: TestClient) -> None:
+        from biomedical_graphrag.utils.metrics_util import REGISTRY, phase
+
+        REGISTRY.reset()
+        with phase("qdrant_query", tool="retrieve_papers_hybrid"):
+            pass
+        REGISTRY.inc("graphrag_answer_cache_requests_total", 3, result="hit")
+        REGISTRY.inc("graphrag_answer_cache_requests_total", 1, result="miss")
+        client.get("/health")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert (
+            'graphrag_phase_duration_seconds_count{phase="qdrant_query",tool="retrieve_papers_hybrid"} 1'
+            in text
+        )
+        assert 'graphrag_cache_hit_ratio{cache="answer"} 0.75' in text
+        assert (
+            'graphrag_http_request_duration_seconds_count{method="GET",route="/health",status="200"} 1'
+            in text
+        )
+        # The scrape itself is still in flight
+        assert "graphrag_http_requests_in_flight 1" in text
+        REGISTRY.reset()
+
+
+class TestReadinessEndpoint:
+    def test_not_ready_until_warmed(self, client: TestClient, services: ServiceContainer) -> None:
+        response = client.get("/ready")
+        assert response.status_code == 503
+
+        services.ready = True
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
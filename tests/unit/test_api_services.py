@@ -0,0 +1,85 @@
+"""Unit tests for the API server's service container."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.api.services import ServiceContainer
+from biomedical_graphrag.application.services.hybrid_service import tool_calling
+
+
+def test_start_shares_clients_and_close_restores_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def warm(self: ServiceContainer) -> None:
+        self._backends.schema = self.schema = "schema"
+
+    monkeypatch.setattr(ServiceContainer, "_warm", warm)
+    previous = (tool_calling.backends.qdrant, tool_calling.backends.neo4j, tool_calling.backends.schema)
+
+    async def run() -> None:
+        services = ServiceContainer()
+        await services.start()
+        assert services.loaded and services.ready
+
+        qdrant = tool_calling.backends.qdrant()
+        neo4j = tool_calling.backends.neo4j()
+        assert qdrant.qdrant_client is services.qdrant
+        assert neo4j.driver is services.neo4j.driver
+        assert tool_calling.get_neo4j_schema() == "schema"
+
+        # Closing a per-request client leaves the shared connections open
+        await qdrant.close()
+        neo4j.close()
+        assert not services.neo4j.driver._closed
+
+        driver = services.neo4j.driver
+        await services.close()
+        assert driver._closed
+        assert not services.ready
+
+    asyncio.run(run())
+    restored = (tool_calling.backends.qdrant, tool_calling.backends.neo4j, tool_calling.backends.schema)
+    assert restored == previous
+
+
+def test_failed_warm_up_keeps_serving_but_reports_not_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: list[int] = []
+
+    async def warm(self: ServiceContainer) -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("neo4j down")
+
+    monkeypatch.setattr(ServiceContainer, "_warm", warm)
+
+    async def run() -> None:
+        services = ServiceContainer()
+        try:
+            await services.start()
+            await services.wait_loaded()
+            assert not services.ready
+            assert isinstance(services.error, ConnectionError)
+
+            # The readiness probe retries the warm-up
+            assert await services.ensure_ready()
+            assert services.error is None
+        finally:
+            await services.close()
+
+    asyncio.run(run())
+    assert len(attempts) == 2
+
+
+def test_wait_loaded_raises_when_loading_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    def load(self: ServiceContainer) -> None:
+        raise ImportError("missing dependency")
+
+    monkeypatch.setattr(ServiceContainer, "_load", load)
+
+    async def run() -> None:
+        services = ServiceContainer()
+        await services.start()
+        with pytest.raises(RuntimeError, match="missing dependency"):
+            await services.wait_loaded()
+        assert not await services.ensure_ready()
+
+    asyncio.run(run())
@@ -0,0 +1,97 @@
+"""Unit tests for batched retrieval in the GraphRAG batch pipeline."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from qdrant_client.models import models
+
+from biomedical_graphrag.application.services.hybrid_service.batch_pipeline import (
+    _retrieve,
+    _Selection,
+)
+from biomedical_graphrag.application.services.hybrid_service.planner import ToolCall
+from biomedical_graphrag.application.services.hybrid_service.qdrant_query import (
+    AsyncQdrantQuery,
+    RetrievalQuery,
+)
+
+
+def _query(store: Mock) -> AsyncQdrantQuery:
+    query = AsyncQdrantQuery.__new__(AsyncQdrantQuery)
+    query.qdrant_client = store
+    return query
+
+
+def test_hybrid_batch_uses_one_embedding_and_one_query_call(mock_qdrant_vectorstore: Mock) -> None:
+    store = mock_qdrant_vectorstore
+    store.cloud_inference = False
+    store.collection_name = "papers"
+    store.embedding_dimension = 2
+    store.reranker_embedding_dimension = 4
+    store._get_openai_vectors_batch = AsyncMock(return_value=[[1, 2, 3, 4], [5, 6, 7, 8]])
+    store._define_bm25_vectors = Mock(
+        side_effect=lambda text: models.Document(text=text, model="qdrant/bm25")
+    )
+    point = SimpleNamespace(id=1, score=0.5, payload={"paper": {"pmid": "1"}})
+    store.client.query_batch_points = AsyncMock(
+        return_value=[SimpleNamespace(points=[point]), SimpleNamespace(points=[])]
+    )
+
+    results = asyncio.run(_query(store).retrieve_papers_hybrid_batch(["CCR5", "TP53"], top_k=3))
+
+    assert results == [[{"id": 1, "score": 0.5, "payload": {"paper": {"pmid": "1"}}}], []]
+    store._get_openai_vectors_batch.assert_awaited_once_with(["CCR5", "TP53"], dimensions=4)
+    requests = store.client.query_batch_points.await_args.kwargs["requests"]
+    assert len(requests) == 2
+    assert requests[0].query == [1, 2, 3, 4]
+    assert requests[0].prefetch[0].query == [1, 2]
+    assert requests[0].limit == 3
+
+
+def test_retrieve_batches_hybrid_calls_only() -> None:
+    qdrant = Mock(spec=AsyncQdrantQuery)
+    qdrant.retrieve_papers_hybrid_batch = AsyncMock(return_value=[[{"id": 1}], [{"id": 2}]])
+    qdrant.prepare = AsyncMock(
+        side_effect=lambda tool, args: RetrievalQuery(tool=tool, request=models.QueryRequest())
+    )
+    qdrant.run = AsyncMock(return_value=[{"id": 3}])
+    selections = {
+        0: _Selection(call=ToolCall("retrieve_papers_hybrid", {"query": "CCR5"}), plan=None, trace=[]),
+        1: _Selection(
+            call=ToolCall("recommend_papers_based_on_constraints", {"positive_examples": ["HIV"]}),
+            plan=None,
+            trace=[],
+        ),
+        2: _Selection(call=ToolCall("retrieve_papers_hybrid", {}), plan=None, trace=[]),
+        # Not a retrieval tool: never dispatched to the query object
+        3: _Selection(call=ToolCall("close", {}), plan=None, trace=[]),
+    }
+
+    retrieved = asyncio.run(
+        _retrieve(qdrant, ["q0", "q1", "q2", "q3"], selections, limit=5, semaphore=asyncio.Semaphore(2))
+    )
+
+    qdrant.retrieve_papers_hybrid_batch.assert_awaited_once_with(["CCR5", "q2"], top_k=5)
+    assert retrieved[0].results == [{"id": 1}]
+    assert retrieved[2].results == [{"id": 2}]
+    assert retrieved[1].results == [{"id": 3}]
+    assert retrieved[1].tool.arguments == {"positive_examples": ["HIV"], "top_k": 5}
+    qdrant.prepare.assert_awaited_once_with(
+        "recommend_papers_based_on_constraints", {"positive_examples": ["HIV"], "top_k": 5}
+    )
+    assert retrieved[3].results == []
+    qdrant.close.assert_not_called()
+
+
+def test_retrieve_reports_batch_failure_per_question() -> None:
+    qdrant = Mock(spec=AsyncQdrantQuery)
+    qdrant.retrieve_papers_hybrid_batch = AsyncMock(side_effect=RuntimeError("qdrant down"))
+    call = ToolCall("retrieve_papers_hybrid", {"query": "CCR5"})
+    selections = {0: _Selection(call=call, plan=None, trace=[])}
+
+    retrieved = asyncio.run(
+        _retrieve(qdrant, ["q0"], selections, limit=5, semaphore=asyncio.Semaphore(1))
+    )
+
+    assert isinstance(retrieved[0], RuntimeError)
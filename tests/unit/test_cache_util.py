@@ -0,0 +1,99 @@
+"""Unit tests for the refreshing single-value cache."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.utils.cache_util import RefreshingCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(values: list[object], clock: FakeClock) -> tuple[RefreshingCache, list[int]]:
+    calls = [0]
+
+    async def loader() -> object:
+        calls[0] += 1
+        await asyncio.sleep(0)
+        value = values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return RefreshingCache(loader, ttl_seconds=10, clock=clock), calls
+
+
+def test_first_get_loads_and_then_serves_cached_value() -> None:
+    clock = FakeClock()
+    cache, calls = make_cache(["a", "b"], clock)
+
+    async def run() -> list[object]:
+        return [await cache.get(), await cache.get()]
+
+    assert asyncio.run(run()) == ["a", "a"]
+    assert calls[0] == 1
+    assert cache.loaded and not cache.stale
+
+
+def test_stale_value_is_served_while_refreshing_in_background() -> None:
+    clock = FakeClock()
+    cache, calls = make_cache(["a", "b"], clock)
+
+    async def run() -> list[object]:
+        first = await cache.get()
+        clock.now = 11
+        stale = await cache.get()
+        await asyncio.sleep(0.01)
+        return [first, stale, await cache.get()]
+
+    assert asyncio.run(run()) == ["a", "a", "b"]
+    assert calls[0] == 2
+
+
+def test_concurrent_loads_are_coalesced() -> None:
+    clock = FakeClock()
+    cache, calls = make_cache(["a", "b"], clock)
+
+    async def run() -> list[object]:
+        return await asyncio.gather(*(cache.get() for _ in range(5)))
+
+    assert asyncio.run(run()) == ["a"] * 5
+    assert calls[0] == 1
+
+
+def test_failed_background_refresh_keeps_previous_value() -> None:
+    clock = FakeClock()
+    cache, _ = make_cache(["a", RuntimeError("neo4j down")], clock)
+
+    async def run() -> object:
+        await cache.get()
+        clock.now = 11
+        cache.refresh_in_background()
+        await asyncio.sleep(0.01)
+        return await cache.get()
+
+    assert asyncio.run(run()) == "a"
+
+
+def test_failed_first_load_raises() -> None:
+    cache, _ = make_cache([RuntimeError("neo4j down")], FakeClock())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get())
+    assert not cache.loaded
+
+
+def test_invalidate_marks_value_stale() -> None:
+    clock = FakeClock()
+    cache, _ = make_cache(["a"], clock)
+    asyncio.run(cache.get())
+
+    cache.invalidate()
+
+    assert cache.stale
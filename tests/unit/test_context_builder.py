@@ -0,0 +1,90 @@
+"""Unit tests for the token-budgeted fusion context builder."""
+
+import json
+
+from biomedical_graphrag.application.services.hybrid_service.prompts.context_builder import (
+    _allocate_abstract_tokens,
+    build_fusion_context,
+    estimate_tokens,
+)
+
+
+def _point(pmid: str, abstract: str) -> dict:
+    return {
+        "payload": {
+            "paper": {
+                "pmid": pmid,
+                "title": f"Paper {pmid}",
+                "abstract": abstract,
+                "journal": "Nature",
+                "publication_date": "2020-01-01",
+                "doi": "10.1000/xyz",
+                "authors": [
+                    {"name": f"Author {i}", "affiliations": ["Some Long Institute Name, City, Country"]}
+                    for i in range(8)
+                ],
+                "mesh_terms": [
+                    {"term": "Humans", "major_topic": False, "ui": "D006801", "qualifiers": []},
+                    {
+                        "term": "Receptors, CCR5",
+                        "major_topic": True,
+                        "ui": "D019718",
+                        "qualifiers": ["genetics"],
+                    },
+                ],
+            },
+            "genes": [{"gene_id": "1234", "name": "CCR5", "description": "chemokine receptor"}],
+        }
+    }
+
+
+class TestAllocateAbstractTokens:
+    def test_everything_fits(self) -> None:
+        assert _allocate_abstract_tokens([50, 80], available=1000, floor=20) == [50, 80]
+
+    def test_floor_then_rank_order(self) -> None:
+        # Both get the 20-token floor, the remaining 60 go to the top-ranked paper first
+        assert _allocate_abstract_tokens([200, 200], available=100, floor=20) == [80, 20]
+
+    def test_budget_below_floors(self) -> None:
+        assert _allocate_abstract_tokens([200, 200, 200], available=30, floor=20) == [20, 10, 0]
+
+    def test_negative_budget(self) -> None:
+        assert _allocate_abstract_tokens([200], available=-5, floor=20) == [0]
+
+
+class TestBuildFusionContext:
+    def test_compact_fields(self) -> None:
+        context = build_fusion_context([_point("1", "short abstract")], {"tool": [{"a": 1}]}, 10_000, 50)
+        papers = json.loads(context.qdrant_context)
+        assert papers[0]["pmid"] == "1"
+        assert papers[0]["abstract"] == "short abstract"
+        assert papers[0]["authors"][-1] == "et al."
+        assert len(papers[0]["authors"]) == 6
+        assert papers[0]["mesh_terms"] == ["Receptors, CCR5", "Humans"]
+        assert papers[0]["genes"] == ["CCR5"]
+        assert "affiliations" not in context.qdrant_context
+        assert "doi" not in papers[0]
+        assert context.neo4j_context == '{"tool":[{"a":1}]}'
+
+    def test_abstracts_truncated_by_rank(self) -> None:
+        abstract = "word " * 400
+        points = [_point("1", abstract), _point("2", abstract)]
+        context = build_fusion_context(points, {}, token_budget=700, min_abstract_tokens=50)
+        first, second = json.loads(context.qdrant_context)
+        assert len(first["abstract"]) > len(second["abstract"])
+        assert second["abstract"].endswith("…")
+        assert context.tokens_after <= 700 + 10
+
+    def test_reports_tokens_saved(self) -> None:
+        point = _point("1", "text")
+        context = build_fusion_context([point], {"tool": [{"a": 1}]}, 10_000, 50)
+        # Measured against the indented full-payload serialization, without building it
+        papers = json.dumps([point["payload"]["paper"]], indent=2, ensure_ascii=False)
+        graph = json.dumps({"tool": [{"a": 1}]}, indent=2)
+        assert context.tokens_before == estimate_tokens(papers + graph)
+        assert context.tokens_before > context.tokens_after
+        assert context.tokens_saved == context.tokens_before - context.tokens_after
+        assert context.tokens_after == estimate_tokens(context.qdrant_context) + estimate_tokens(
+            context.neo4j_context
+        )
@@ -0,0 +1,125 @@
+"""Unit tests for the on-disk response cache and its use for Entrez requests."""
+
+import asyncio
+import io
+
+import pytest
+from Bio import Entrez
+
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.data_sources import base
+from biomedical_graphrag.data_sources.pubmed.pubmed_data_collector import PubMedDataCollector
+from biomedical_graphrag.utils.disk_cache_util import DiskCache
+from biomedical_graphrag.utils.rate_limit_util import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_by_the_ttl_of_the_read(tmp_path) -> None:
+    clock = FakeClock()
+    cache = DiskCache(tmp_path, max_bytes=1000, clock=clock)
+    cache.put("efetch?a", b"payload")
+
+    clock.now += 60
+    assert cache.get("efetch?a", ttl_seconds=120) == b"payload"
+    assert cache.get("efetch?a", ttl_seconds=30) is None
+    assert cache.get("efetch?a") == b"payload"
+    assert cache.get("efetch?b") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    clock = FakeClock()
+    cache = DiskCache(tmp_path, max_bytes=25, clock=clock)
+    for key in "abc":
+        clock.now += 1
+        cache.put(key, b"x" * 10)  # the third put exceeds the limit
+        if key == "b":
+            clock.now += 1
+            cache.get("a")  # a is now more recent than b
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.size() == 20
+    # A fresh instance sees the same entries on disk
+    assert DiskCache(tmp_path, max_bytes=25).size() == 20
+
+
+ARTICLE_SET = (
+    b"<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>42</PMID>"
+    b"<Article><ArticleTitle>Cached</ArticleTitle></Article></MedlineCitation>"
+    b"</PubmedArticle></PubmedArticleSet>"
+)
+
+
+@pytest.fixture
+def entrez_cache(tmp_path, monkeypatch) -> list[dict]:
+    """Route Entrez requests to a fake efetch, caching under tmp_path."""
+
+    async def no_wait(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(settings.pubmed, "cache_enabled", True)
+    monkeypatch.setattr(settings.pubmed, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings.pubmed, "offline", False)
+    monkeypatch.setattr(base, "_ENTREZ_CACHE", None)
+    monkeypatch.setattr(base, "_ENTREZ_LIMITER", TokenBucket(rate=1000, sleep=no_wait))
+    sent: list[dict] = []
+
+    def efetch(**params) -> io.BytesIO:
+        sent.append(params)
+        return io.BytesIO(ARTICLE_SET)
+
+    monkeypatch.setattr(Entrez, "efetch", efetch)
+    return sent
+
+
+def test_repeated_requests_are_served_from_the_cache(entrez_cache) -> None:
+    async def run() -> None:
+        first = await base.entrez_fetch("efetch", db="pubmed", id="42")
+        second = await base.entrez_fetch("efetch", id="42", db="pubmed")
+        assert first == second == ARTICLE_SET
+        await base.entrez_fetch("efetch", db="pubmed", id="43")
+        # History-server requests always go out
+        await base.entrez_fetch("efetch", cacheable=False, db="pubmed", id="42")
+
+    asyncio.run(run())
+    assert [params["id"] for params in entrez_cache] == ["42", "43", "42"]
+
+
+def test_offline_collection_uses_only_the_cache(entrez_cache, monkeypatch) -> None:
+    collector = PubMedDataCollector()
+    asyncio.run(collector.fetch_papers(["42"]))
+
+    monkeypatch.setattr(settings.pubmed, "offline", True)
+    monkeypatch.setattr(Entrez, "efetch", None)  # any network call would fail
+    [paper] = asyncio.run(collector.fetch_papers(["42"]))
+    assert (paper.pmid, paper.title) == ("42", "Cached")
+
+    with pytest.raises(base.EntrezOfflineError):
+        asyncio.run(collector.fetch_papers(["7"]))
+
+
+def test_offline_mode_serves_expired_entries(entrez_cache, monkeypatch) -> None:
+    asyncio.run(base.entrez_fetch("efetch", db="pubmed", id="42"))
+    monkeypatch.setattr(settings.pubmed, "cache_ttl_seconds", {"efetch": 0})
+    monkeypatch.setattr(settings.pubmed, "offline", True)
+
+    assert asyncio.run(base.entrez_fetch("efetch", db="pubmed", id="42")) == ARTICLE_SET
+
+
+def test_error_responses_are_not_cached(entrez_cache, monkeypatch) -> None:
+    bodies = iter([b"<eFetchResult><ERROR>Backend down</ERROR></eFetchResult>", b"not xml"])
+    monkeypatch.setattr(Entrez, "efetch", lambda **params: io.BytesIO(next(bodies)))
+    monkeypatch.setattr(Entrez, "esearch", lambda **params: io.BytesIO(next(bodies)))
+
+    asyncio.run(base.entrez_fetch("efetch", db="pubmed", id="42"))
+    with pytest.raises(ValueError):  # Entrez.read rejects the body
+        asyncio.run(base.entrez_read("esearch", db="pubmed", term="crispr"))
+
+    assert base.entrez_cache().size() == 0
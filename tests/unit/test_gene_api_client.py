@@ -0,0 +1,55 @@
+"""Unit tests for the NCBI Gene E-utilities client."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.data_sources.gene import gene_api_client
+from biomedical_graphrag.data_sources.gene.gene_api_client import GeneAPIClient
+
+
+class FakeElink:
+    """Serves one gene per PMID; requests holding PMID 7 fail."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, pmids: list[str]) -> list:
+        self.requests.append(list(pmids))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if "7" in pmids:
+            raise RuntimeError("backend error")
+        return [
+            {"IdList": [pmid], "LinkSetDb": [{"DbTo": "gene", "Link": [{"Id": f"g{pmid}"}]}]}
+            for pmid in pmids
+        ]
+
+
+@pytest.fixture
+def elink(monkeypatch) -> FakeElink:
+    fake = FakeElink()
+    monkeypatch.setattr(gene_api_client, "_elink_genes", fake)
+    return fake
+
+
+def test_chunks_run_concurrently_with_links_per_pmid(elink) -> None:
+    pmids = ["1", "2", "3", "4", "5", "6"]
+    genes = asyncio.run(GeneAPIClient().elink_pubmed_to_gene(pmids, chunk_size=2))
+
+    assert genes == {pmid: [f"g{pmid}"] for pmid in pmids}
+    assert len(elink.requests) == 3
+    assert elink.peak == 3
+
+
+def test_failed_chunks_are_bisected(elink) -> None:
+    pmids = [str(i) for i in range(1, 9)]
+    genes = asyncio.run(GeneAPIClient().elink_pubmed_to_gene(pmids, chunk_size=8, max_retries=0))
+
+    assert set(genes) == set(pmids) - {"7"}
+    # 8 -> 4 + 4 -> 2 + 2 -> 1 + 1, instead of eight single-PMID requests
+    assert sorted(len(chunk) for chunk in elink.requests) == [1, 1, 2, 2, 4, 4, 8]
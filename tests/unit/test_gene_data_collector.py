@@ -0,0 +1,88 @@
+"""Unit tests for incremental gene dataset refreshes."""
+
+import asyncio
+import json
+
+import pytest
+
+from biomedical_graphrag.config import settings
+from biomedical_graphrag.data_sources.gene.gene_data_collector import GeneDataCollector
+
+LINKS = {"1": ["100"], "2": ["100", "200"], "3": [], "4": ["200", "300"]}
+
+
+class FakeGeneAPI:
+    def __init__(self, missing: frozenset[str] = frozenset()) -> None:
+        self.missing = missing
+        self.resolved: list[list[str]] = []
+        self.summarized: list[list[str]] = []
+
+    async def elink_pubmed_to_gene(self, pmids: list[str]) -> dict[str, list[str]]:
+        self.resolved.append(pmids)
+        return {pmid: LINKS[pmid] for pmid in pmids}
+
+    async def fetch_genes(self, gene_ids: list[str]) -> list[dict]:
+        self.summarized.append(gene_ids)
+        return [{"uid": gid, "Name": f"GENE{gid}"} for gid in gene_ids if gid not in self.missing]
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    pubmed_path = tmp_path / "pubmed_dataset.json"
+    gene_path = tmp_path / "gene_dataset.json"
+    monkeypatch.setattr(settings.json_data, "pubmed_json_path", str(pubmed_path))
+    monkeypatch.setattr(settings.json_data, "gene_json_path", str(gene_path))
+    return pubmed_path, gene_path
+
+
+def collect(
+    pmids: list[str], pubmed_path, gene_path, incremental: bool, missing: frozenset[str] = frozenset()
+) -> FakeGeneAPI:
+    pubmed_path.write_text(json.dumps({"papers": [{"pmid": pmid} for pmid in pmids]}))
+    collector = GeneDataCollector()
+    collector.api = FakeGeneAPI(missing)
+    dataset = asyncio.run(collector.collect_dataset(incremental=incremental))
+    gene_path.write_text(dataset.model_dump_json())
+    return collector.api
+
+
+def test_refresh_resolves_only_new_pmids_and_fetches_only_new_genes(paths) -> None:
+    pubmed_path, gene_path = paths
+    collect(["1", "2", "3"], pubmed_path, gene_path, incremental=True)
+
+    api = collect(["1", "2", "3", "4"], pubmed_path, gene_path, incremental=True)
+
+    # PMID 3 links to no gene but is not resolved again either
+    assert api.resolved == [["4"]]
+    assert api.summarized == [["300"]]
+    dataset = json.loads(gene_path.read_text())
+    linked = {gene["gene_id"]: gene["linked_pmids"] for gene in dataset["genes"]}
+    assert linked == {"100": ["1", "2"], "200": ["2", "4"], "300": ["4"]}
+    assert dataset["metadata"]["total_linked_pmids"] == 5
+    assert dataset["metadata"]["resolved_pmids"] == ["1", "2", "3", "4"]
+
+
+def test_full_collection_ignores_the_existing_dataset(paths) -> None:
+    pubmed_path, gene_path = paths
+    collect(["1", "2"], pubmed_path, gene_path, incremental=False)
+
+    api = collect(["1", "2"], pubmed_path, gene_path, incremental=False)
+    assert api.resolved == [["1", "2"]]
+
+
+def test_genes_without_a_summary_keep_the_links_of_the_others(paths) -> None:
+    pubmed_path, gene_path = paths
+    collect(["1", "2"], pubmed_path, gene_path, incremental=False, missing=frozenset({"200"}))
+
+    dataset = json.loads(gene_path.read_text())
+    linked = {gene["gene_id"]: gene["linked_pmids"] for gene in dataset["genes"]}
+    assert linked == {"100": ["1", "2"]}
+    # PMID 2 still links to a gene with no record, so a refresh resolves it again
+    assert dataset["metadata"]["resolved_pmids"] == ["1"]
+
+    api = collect(["1", "2"], pubmed_path, gene_path, incremental=True)
+    assert api.resolved == [["2"]]
+    dataset = json.loads(gene_path.read_text())
+    linked = {gene["gene_id"]: gene["linked_pmids"] for gene in dataset["genes"]}
+    assert linked == {"100": ["1", "2"], "200": ["2"]}
+    assert dataset["metadata"]["resolved_pmids"] == ["1", "2"]
@@ -0,0 +1,38 @@
+"""Unit tests for the async graph enrichment phase."""
+
+import asyncio
+from unittest.mock import Mock
+
+from biomedical_graphrag.application.services.hybrid_service import tool_calling
+
+
+def test_cancelling_enrichment_aborts_the_tool_selection_call(monkeypatch) -> None:
+    started = asyncio.Event()
+    cancelled = []
+
+    async def create(**kwargs):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async_client, sync_client, neo4j = Mock(), Mock(), Mock()
+    async_client.responses.create = create
+    monkeypatch.setattr(tool_calling, "async_openai_client", async_client)
+    monkeypatch.setattr(tool_calling, "openai_client", sync_client)
+    monkeypatch.setattr(tool_calling.backends, "schema", "schema")
+
+    async def run() -> None:
+        task = asyncio.create_task(tool_calling.run_graph_enrichment_async("CCR5?", [], neo4j))
+        await asyncio.wait_for(started.wait(), timeout=5)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+    assert cancelled == [True]
+    sync_client.responses.create.assert_not_called()
+    # The caller owns the graph client
+    neo4j.close.assert_not_called()
@@ -0,0 +1,138 @@
+"""Unit tests for the background job manager."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.api.jobs import Job, JobManager, JobQueueFull
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def wait_done(job: Job) -> None:
+    while not job.done:
+        await asyncio.sleep(0)
+
+
+def test_jobs_run_in_the_background_and_keep_their_result() -> None:
+    async def run() -> None:
+        manager = JobManager(workers=2, max_pending=10, ttl_seconds=60)
+
+        async def work(job: Job) -> str:
+            job.stage = "working"
+            await asyncio.sleep(0)
+            return f"done {job.request}"
+
+        async def broken(job: Job) -> str:
+            raise RuntimeError("qdrant down")
+
+        ok = manager.submit(work, "a")
+        failed = manager.submit(broken)
+        assert ok.status == "queued" and manager.queued == 2
+
+        await wait_done(ok)
+        await wait_done(failed)
+        assert (ok.status, ok.result, ok.stage) == ("succeeded", "done a", "working")
+        assert (failed.status, failed.error) == ("failed", "qdrant down")
+        assert manager.get(ok.id) is ok
+        assert (manager.queued, manager.running) == (0, 0)
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_workers_bound_concurrency() -> None:
+    async def run() -> None:
+        manager = JobManager(workers=2, max_pending=10, ttl_seconds=60)
+        release = asyncio.Event()
+        peak = 0
+
+        async def work(job: Job) -> None:
+            nonlocal peak
+            peak = max(peak, manager.running)
+            await release.wait()
+
+        jobs = [manager.submit(work) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert (manager.running, manager.queued) == (2, 3)
+        release.set()
+        for job in jobs:
+            await wait_done(job)
+        assert peak == 2
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_cancel_aborts_running_work_and_skips_queued_jobs() -> None:
+    async def run() -> None:
+        manager = JobManager(workers=1, max_pending=10, ttl_seconds=60)
+        started, aborted = asyncio.Event(), asyncio.Event()
+
+        async def slow_call(job: Job) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        running = manager.submit(slow_call)
+        queued = manager.submit(slow_call)
+        await started.wait()
+
+        assert manager.cancel(queued.id).status == "cancelled"
+        assert manager.cancel(running.id).status == "cancelled"
+        await asyncio.wait_for(aborted.wait(), timeout=1)
+        await asyncio.sleep(0.01)
+        assert (manager.running, manager.queued) == (0, 0)
+        assert manager.cancel("unknown") is None
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_full_queue_and_expiry() -> None:
+    async def run() -> None:
+        clock = FakeClock()
+        manager = JobManager(workers=1, max_pending=1, ttl_seconds=60, clock=clock)
+        release = asyncio.Event()
+
+        async def work(job: Job) -> None:
+            await release.wait()
+
+        first = manager.submit(work)
+        await asyncio.sleep(0)
+        manager.submit(work)
+        with pytest.raises(JobQueueFull) as rejected:
+            manager.submit(work)
+        assert rejected.value.retry_after >= 1
+
+        release.set()
+        await wait_done(first)
+        clock.now = 61
+        assert manager.get(first.id) is None
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_close_cancels_running_and_queued_jobs() -> None:
+    async def run() -> None:
+        manager = JobManager(workers=1, max_pending=10, ttl_seconds=60)
+
+        async def work(job: Job) -> None:
+            await asyncio.sleep(60)
+
+        running, queued = manager.submit(work), manager.submit(work)
+        await asyncio.sleep(0)
+        await manager.close()
+        assert (running.status, queued.status) == ("cancelled", "cancelled")
+
+    asyncio.run(run())
@@ -0,0 +1,105 @@
+"""Unit tests for pipeline latency and token accounting."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from biomedical_graphrag.utils.metrics_util import (
+    PHASE_DURATION_METRIC,
+    REGISTRY,
+    TOKENS_METRIC,
+    Histogram,
+    MetricsRegistry,
+    phase,
+    record_request,
+    render_prometheus,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry() -> None:
+    REGISTRY.reset()
+
+
+class TestHistogram:
+    def test_cumulative_counts(self) -> None:
+        hist = Histogram(buckets=(10, 100))
+        for value in (5, 10, 50, 500):
+            hist.observe(value)
+        assert hist.cumulative_counts() == [(10, 2), (100, 3), (float("inf"), 4)]
+        assert hist.count == 4
+        assert hist.sum == 565
+
+    def test_quantile_interpolates(self) -> None:
+        hist = Histogram(buckets=(100, 200))
+        for _ in range(10):
+            hist.observe(150)
+        assert hist.quantile(0.5) == pytest.approx(150)
+        assert Histogram().quantile(0.99) == 0.0
+
+
+class TestPhase:
+    def test_records_duration_and_usage(self) -> None:
+        with record_request() as metrics:
+            with phase("llm", step="summary") as timing:
+                timing.add_usage(SimpleNamespace(input_tokens=120, output_tokens=30))
+            with phase("embedding") as timing:
+                timing.add_usage(SimpleNamespace(prompt_tokens=8, total_tokens=8))
+
+        summary = metrics.summary()
+        assert [p["name"] for p in summary["phases"]] == ["llm", "embedding"]
+        assert summary["phases"][0]["labels"] == {"step": "summary"}
+        assert summary["usage"] == {"input_tokens": 128, "output_tokens": 30}
+        assert summary["latency_ms"] >= 0
+
+        assert REGISTRY.histogram(PHASE_DURATION_METRIC, phase="llm", step="summary").count == 1
+        counters = {(name, tuple(sorted(labels.items()))): v for name, labels, v in REGISTRY.counters()}
+        key = (TOKENS_METRIC, (("kind", "output"), ("phase", "llm"), ("step", "summary")))
+        assert counters[key] == 30
+
+    def test_phase_outside_request_only_aggregates(self) -> None:
+        with phase("author_scoring"):
+            pass
+        assert REGISTRY.histogram(PHASE_DURATION_METRIC, phase="author_scoring").count == 1
+
+    def test_worker_threads_record_on_the_request(self) -> None:
+        def work() -> None:
+            with phase("neo4j_tool", tool="get_genes_in_same_papers"):
+                pass
+
+        async def run() -> list[str]:
+            with record_request() as metrics:
+                await asyncio.to_thread(work)
+            return [p.name for p in metrics.phases]
+
+        assert asyncio.run(run()) == ["neo4j_tool"]
+
+
+class TestPrometheusExposition:
+    def test_renders_counters_gauges_and_histograms(self) -> None:
+        registry = MetricsRegistry()
+        registry.inc("graphrag_tokens_total", 30, phase="llm", kind="output")
+        registry.set_gauge("graphrag_admission_queued", 2, queue="graphrag")
+        hist = registry.histogram("graphrag_phase_duration_seconds", phase="embedding")
+        hist.observe(0.007)
+        hist.observe(120)
+
+        text = render_prometheus(registry)
+
+        assert (
+            '# TYPE graphrag_tokens_total counter\ngraphrag_tokens_total{kind="output",phase="llm"} 30\n'
+            in text
+        )
+        assert 'graphrag_admission_queued{queue="graphrag"} 2\n' in text
+        assert "# TYPE graphrag_phase_duration_seconds histogram\n" in text
+        assert 'graphrag_phase_duration_seconds_bucket{phase="embedding",le="0.005"} 0\n' in text
+        assert 'graphrag_phase_duration_seconds_bucket{phase="embedding",le="0.01"} 1\n' in text
+        assert 'graphrag_phase_duration_seconds_bucket{phase="embedding",le="+Inf"} 2\n' in text
+        assert 'graphrag_phase_duration_seconds_sum{phase="embedding"} 120.007\n' in text
+        assert 'graphrag_phase_duration_seconds_count{phase="embedding"} 2\n' in text
+
+    def test_escapes_label_values(self) -> None:
+        registry = MetricsRegistry()
+        registry.inc("errors_total", reason='bad "quote"\\n')
+        assert 'errors_total{reason="bad \\"quote\\"\\\\n"} 1' in render_prometheus(registry)
@@ -0,0 +1,139 @@
+"""Unit tests for result-page cursors and paged retrieval."""
+
+import asyncio
+import random
+
+import pytest
+from qdrant_client.models import models
+
+from biomedical_graphrag.api.pagination import ExpiredCursorError, InvalidCursorError, PageCursors
+from biomedical_graphrag.application.services.hybrid_service.qdrant_query import (
+    AsyncQdrantQuery,
+    RetrievalQuery,
+)
+from biomedical_graphrag.benchmarks.local_backends import LocalQdrantVectorStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def hits(*ids: int) -> list[dict]:
+    return [{"id": i, "score": 1.0, "payload": {}} for i in ids]
+
+
+QUERY = RetrievalQuery(tool="retrieve_papers_dense", request=models.QueryRequest(query=[0.1], limit=2))
+
+
+class TestPageCursors:
+    def test_cursor_walks_the_ranking(self) -> None:
+        cursors = PageCursors(ttl_seconds=60, max_entries=10, max_depth=100)
+        cursor = cursors.open(QUERY, hits(1, 2), limit=2)
+        assert cursor is not None
+
+        page = cursors.resolve(cursor)
+        assert (page.offset, page.exclude_ids, page.query) == (2, [1, 2], QUERY)
+        next_cursor = cursors.advance(page, hits(3, 4), limit=2)
+
+        assert cursors.resolve(next_cursor).exclude_ids == [1, 2, 3, 4]
+        # Replaying an earlier cursor serves the same page again
+        assert cursors.resolve(cursor).exclude_ids == [1, 2]
+
+    def test_no_cursor_when_the_ranking_is_exhausted(self) -> None:
+        cursors = PageCursors(ttl_seconds=60, max_entries=10, max_depth=100)
+        assert cursors.open(QUERY, hits(1), limit=2) is None
+        assert cursors.open(None, hits(1, 2), limit=2) is None
+        page = cursors.resolve(cursors.open(QUERY, hits(1, 2), limit=2))
+        assert cursors.advance(page, hits(3), limit=2) is None
+        assert len(cursors) == 1
+
+    def test_paging_stops_at_max_depth(self) -> None:
+        cursors = PageCursors(ttl_seconds=60, max_entries=10, max_depth=5)
+        page = cursors.resolve(cursors.open(QUERY, hits(1, 2), limit=2))
+        assert cursors.page_size(page, 10) == 3
+        assert cursors.advance(page, hits(3, 4, 5), limit=3) is None
+
+    def test_expired_and_evicted_sessions(self) -> None:
+        clock = FakeClock()
+        cursors = PageCursors(ttl_seconds=60, max_entries=1, max_depth=100, clock=clock)
+        first = cursors.open(QUERY, hits(1, 2), limit=2)
+        second = cursors.open(QUERY, hits(1, 2), limit=2)
+        with pytest.raises(ExpiredCursorError):
+            cursors.resolve(first)
+
+        clock.now = 61
+        with pytest.raises(ExpiredCursorError):
+            cursors.resolve(second)
+
+    def test_malformed_cursors(self) -> None:
+        cursors = PageCursors(ttl_seconds=60, max_entries=10, max_depth=100)
+        cursor = cursors.open(QUERY, hits(1, 2), limit=2)
+        session_id = cursor.rpartition(".")[0]
+        for bad in ("", "abc", f"{session_id}.x", f"{session_id}.9"):
+            with pytest.raises(InvalidCursorError):
+                cursors.resolve(bad)
+
+
+def test_retrieval_page_widens_prefetch_and_excludes_served_points() -> None:
+    request = AsyncQdrantQuery._hybrid_request(
+        [0.1, 0.2], [0.1, 0.2, 0.3], models.SparseVector(indices=[1], values=[1.0]), top_k=5
+    )
+    page = RetrievalQuery(tool="retrieve_papers_hybrid", request=request).page(5, [1, 2, 3, 4, 5])
+
+    assert page.limit == 5
+    assert [p.limit for p in page.prefetch] == [10, 10]
+    assert page.filter.must_not == [models.HasIdCondition(has_id=[1, 2, 3, 4, 5])]
+    # The stored first-page request is left untouched
+    assert request.filter is None and [p.limit for p in request.prefetch] == [5, 5]
+
+
+def test_hybrid_pages_do_not_repeat_papers_in_local_qdrant() -> None:
+    rng = random.Random(7)
+
+    def vector(size: int) -> list[float]:
+        return [rng.uniform(-1, 1) for _ in range(size)]
+
+    async def run() -> tuple[list[list[int]], list[int]]:
+        store = LocalQdrantVectorStore(openai_client=None)  # type: ignore[arg-type]
+        await store.create_collection()
+        await store.client.upsert(
+            store.collection_name,
+            points=[
+                models.PointStruct(
+                    id=i,
+                    vector={
+                        "Dense": vector(store.embedding_dimension),
+                        "Reranker": vector(store.reranker_embedding_dimension),
+                        "Lexical": models.SparseVector(indices=[1], values=[1.0]),
+                    },
+                    payload={"paper": {"pmid": str(i)}},
+                )
+                for i in range(1, 31)
+            ],
+        )
+        request = AsyncQdrantQuery._hybrid_request(
+            vector(store.embedding_dimension),
+            vector(store.reranker_embedding_dimension),
+            models.SparseVector(indices=[1], values=[1.0]),
+            top_k=4,
+        )
+        qdrant = AsyncQdrantQuery(store)
+        query = RetrievalQuery(tool="retrieve_papers_hybrid", request=request)
+        pages, served = [], []
+        for _ in range(3):
+            page = await qdrant.fetch_page(query, 4, served)
+            pages.append([r["id"] for r in page])
+            served.extend(pages[-1])
+        first = await qdrant.run(query)
+        await store.close()
+        return pages, [r["id"] for r in first]
+
+    pages, first = asyncio.run(run())
+    assert pages[0] == first
+    assert all(len(page) == 4 for page in pages)
+    # Later pages never repeat a paper, even though their candidate pools overlap
+    assert len({i for page in pages for i in page}) == 12
@@ -0,0 +1,101 @@
+"""Unit tests for the journal behind paper enrichment."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from biomedical_graphrag.data_sources.pubmed.paper_enrichment import (
+    PaperEnrichmentCollector,
+    compact_journal,
+)
+from biomedical_graphrag.domain.author import Author
+from biomedical_graphrag.domain.citation import CitationNetwork
+from biomedical_graphrag.domain.dataset import PaperDataset, PaperMetadata
+from biomedical_graphrag.domain.paper import Paper
+from biomedical_graphrag.utils.journal_util import JsonlJournal
+
+
+class FakeParser:
+    async def fetch_citation_network(self, paper_ids: list[str]) -> dict[str, CitationNetwork]:
+        return {pmid: CitationNetwork(pmid=pmid, cited_by=["1"]) for pmid in paper_ids}
+
+
+class FlakyEnricher(PaperEnrichmentCollector):
+    """Finds PMIDs 10-13 as related papers; the paper fetch fails once after `fail_after` batches."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        super().__init__()
+        self._parser = FakeParser()
+        self.fail_after = fail_after
+        self.fetched: list[list[str]] = []
+        self.sources: list[str] = []
+
+    async def _find_related_papers(
+        self, source_paper: Paper, existing_pmids: set[str], max_new: int = 5
+    ) -> list[str]:
+        self.sources.append(source_paper.pmid)
+        return [pmid for pmid in ["10", "11", "12", "13"] if pmid not in existing_pmids]
+
+    async def fetch_papers(self, paper_ids: list[str], batch_size: int = 200) -> list[Paper]:
+        if self.fail_after is not None and len(self.fetched) == self.fail_after:
+            raise ConnectionError("NCBI unavailable")
+        self.fetched.append(paper_ids)
+        return [Paper(pmid=pmid, authors=[Author(name=f"Author {pmid}")]) for pmid in paper_ids]
+
+
+@pytest.fixture
+def dataset_path(tmp_path) -> str:
+    path = tmp_path / "pubmed_dataset.json"
+    dataset = PaperDataset(
+        metadata=PaperMetadata(total_papers=1, total_authors=2),
+        papers=[Paper(pmid="1", authors=[Author(name="A"), Author(name="B")])],
+    )
+    path.write_text(dataset.model_dump_json(indent=2), encoding="utf-8")
+    return str(path)
+
+
+def enrich(enricher: PaperEnrichmentCollector, dataset_path: str, journal_path: str) -> PaperDataset:
+    return asyncio.run(
+        enricher.enrich_dataset(
+            input_path=dataset_path, journal_path=journal_path, batch_size=2, related_mode="search"
+        )
+    )
+
+
+def test_batches_are_journaled_and_the_dataset_written_once(dataset_path, tmp_path) -> None:
+    journal_path = str(tmp_path / "enrichment.jsonl")
+    original = Path(dataset_path).read_text(encoding="utf-8")
+    with pytest.raises(ConnectionError):
+        enrich(FlakyEnricher(fail_after=1), dataset_path, journal_path)
+
+    # The first batch is only in the journal
+    assert Path(dataset_path).read_text(encoding="utf-8") == original
+    [record] = JsonlJournal(journal_path).records()
+    assert [paper["pmid"] for paper in record["papers"]] == ["10", "11"]
+
+    resumed = FlakyEnricher()
+    dataset = enrich(resumed, dataset_path, journal_path)
+
+    assert resumed.fetched == [["12", "13"]]
+    # Replayed papers are not used as sources on resume
+    assert resumed.sources == ["1"]
+    assert not JsonlJournal(journal_path).exists()
+    on_disk = PaperDataset.model_validate_json(Path(dataset_path).read_text(encoding="utf-8"))
+    assert on_disk == dataset
+    assert [paper.pmid for paper in on_disk.papers] == ["1", "10", "11", "12", "13"]
+    metadata = on_disk.metadata
+    assert (metadata.total_papers, metadata.total_authors, metadata.papers_with_citations) == (5, 6, 4)
+
+
+def test_compaction_on_demand_skips_papers_already_in_the_dataset(dataset_path, tmp_path) -> None:
+    journal = JsonlJournal(tmp_path / "enrichment.jsonl")
+    for pmid in ["1", "10"]:
+        paper = Paper(pmid=pmid).model_dump(mode="json")
+        journal.append({"type": "papers", "papers": [paper], "citations": {}})
+
+    dataset = compact_journal(dataset_path, str(journal.path))
+
+    assert [paper.pmid for paper in dataset.papers] == ["1", "10"]
+    assert dataset.metadata.total_papers == 2
+    assert not journal.exists()
@@ -0,0 +1,33 @@
+"""Unit tests for finding related papers from similar-articles links."""
+
+import asyncio
+
+from biomedical_graphrag.data_sources.pubmed.paper_enrichment import PaperEnrichmentCollector
+from biomedical_graphrag.domain.paper import Paper
+
+
+class FakeAPI:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    async def fetch_similar_batch(self, pmids: list[str]) -> dict[str, list[tuple[str, int]]]:
+        self.requests.append(pmids)
+        return {
+            "1": [("2", 95), ("10", 80), ("11", 60), ("12", 10)],
+            "2": [("10", 90), ("13", 50), ("14", 40)],
+        }
+
+
+def test_candidates_are_ranked_by_score_across_sources() -> None:
+    enricher = PaperEnrichmentCollector()
+    enricher.api = FakeAPI()
+    existing = {"1", "2"}
+
+    new_pmids = asyncio.run(
+        enricher._find_related_by_links([Paper(pmid="1"), Paper(pmid="2")], existing, max_new=2)
+    )
+
+    # PMID 10 goes to source 2 (its best link); source 1 then takes 11 and 12
+    assert new_pmids == ["10", "11", "13", "12"]
+    assert existing == {"1", "2", "10", "11", "12", "13"}
+    assert enricher.api.requests == [["1", "2"]]
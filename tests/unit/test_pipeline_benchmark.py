@@ -0,0 +1,122 @@
+"""Unit tests for the offline pipeline benchmark and its local stand-ins."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.application.services.hybrid_service import tool_calling
+from biomedical_graphrag.benchmarks.fake_openai import FakeOpenAIConfig, _graph_calls, _retrieval_call
+from biomedical_graphrag.benchmarks.local_backends import InMemoryGraph, InMemoryGraphQuery
+from biomedical_graphrag.benchmarks.pipeline_benchmark import (
+    BenchmarkConfig,
+    percentile,
+    phase_key,
+    run_benchmark,
+)
+
+
+def make_graph() -> InMemoryGraphQuery:
+    pubmed_data = {
+        "papers": [
+            {
+                "pmid": "1",
+                "title": "CCR5 in HIV",
+                "authors": [{"name": "Ann Lee"}, {"name": "Bo Kim"}],
+                "mesh_terms": [{"term": "HIV Infections"}, {"term": "Receptors, CCR5"}],
+            },
+            {
+                "pmid": "2",
+                "title": "HIV reservoirs",
+                "authors": [{"name": "Ann Lee"}, {"name": "Cy Park"}],
+                "mesh_terms": [{"term": "HIV Infections"}],
+            },
+            {
+                "pmid": "3",
+                "title": "Tumor suppressors",
+                "authors": [{"name": "Bo Kim"}],
+                "mesh_terms": [{"term": "Neoplasms"}],
+            },
+        ]
+    }
+    gene_data = {
+        "genes": [
+            {"name": "CCR5", "aliases": "CKR5", "linked_pmids": ["1", "2"]},
+            {"name": "CD4", "aliases": "", "linked_pmids": ["1"]},
+            {"name": "TP53", "aliases": "", "linked_pmids": ["3"]},
+        ]
+    }
+    return InMemoryGraphQuery(InMemoryGraph(pubmed_data, gene_data))
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == pytest.approx(50.5)
+    assert percentile(values, 99) == pytest.approx(99.01)
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_phase_key_includes_labels() -> None:
+    assert phase_key({"name": "embedding"}) == "embedding"
+    assert phase_key({"name": "llm", "labels": {"step": "route"}}) == "llm[step=route]"
+
+
+def test_in_memory_graph_tools() -> None:
+    graph = make_graph()
+    assert graph.score_authors(["Ann Lee", "Bo Kim"], ["hiv"]) == [
+        {"author": "Ann Lee", "papers": 2},
+        {"author": "Bo Kim", "papers": 1},
+    ]
+    assert graph.get_related_papers_by_mesh("1") == [
+        {"pmid": "2", "title": "HIV reservoirs", "shared_terms": 1}
+    ]
+    assert graph.get_related_papers_by_mesh("1", exclude_pmids=["2"]) == []
+    collaborators = graph.get_collaborators_with_topics("ann", ["HIV"])
+    assert [c["collaborator"] for c in collaborators] == ["Bo Kim", "Cy Park"]
+    assert graph.get_genes_in_same_papers("ckr5") == [
+        {"gene": "CD4", "shared_papers": 1, "example_pmids": ["1"]}
+    ]
+    assert graph.get_graph_counts() == {"nodes": 12, "relationships": 13}
+
+
+def test_fake_model_routes_counter_examples_to_recommendations() -> None:
+    assert _retrieval_call("Find papers about HIV but not about cancer.") == (
+        "recommend_papers_based_on_constraints",
+        {"positive_examples": ["Find papers about HIV"], "negative_examples": ["cancer"]},
+    )
+    assert _retrieval_call("What is CCR5?")[0] == "retrieve_papers_hybrid"
+
+
+def test_fake_model_picks_graph_tools_from_prompt_entities() -> None:
+    prompt = (
+        "- PMIDs: 1, 2\n- Authors: Ann Lee (2 papers); Bo Kim (1 papers)\n"
+        "- MeSH Terms: HIV Infections, Neoplasms\n- Genes: None\n"
+    )
+    assert _graph_calls(prompt) == [
+        ("get_related_papers_by_mesh", {"pmid": "1"}),
+        (
+            "get_collaborators_with_topics",
+            {"author_name": "Ann Lee", "topics": ["HIV Infections", "Neoplasms"]},
+        ),
+    ]
+
+
+def test_run_benchmark_end_to_end() -> None:
+    backends = (tool_calling.backends.qdrant, tool_calling.backends.neo4j)
+    openai_client = tool_calling.openai_client
+
+    report = asyncio.run(
+        run_benchmark(
+            BenchmarkConfig(requests=4, concurrency=2, papers=20, graph_latency_ms=0),
+            FakeOpenAIConfig(ttft_ms=1, output_token_ms=0, embedding_latency_ms=0, summary_tokens=20),
+        )
+    )
+
+    assert report.errors == 0
+    assert report.latency.count == 4
+    assert report.phases["llm[step=summary]"].count == 4
+    assert report.tokens["output_tokens"] > 0
+    assert report.throughput_rps > 0
+    # The pipeline is pointed back at the real backends afterwards
+    assert (tool_calling.backends.qdrant, tool_calling.backends.neo4j) == backends
+    assert tool_calling.openai_client is openai_client
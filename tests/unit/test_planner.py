@@ -0,0 +1,92 @@
+"""Unit tests for the single-call query planner helpers."""
+
+import pytest
+
+from biomedical_graphrag.application.services.hybrid_service.planner import (
+    ToolCall,
+    UnresolvedPlaceholderError,
+    build_bindings,
+    resolve_arguments,
+    split_plan,
+)
+
+
+@pytest.fixture
+def ctx() -> dict[str, list[str]]:
+    return {
+        "pmids": ["111", "222"],
+        "authors": ["Jane Roe", "John Doe"],
+        "mesh_terms": ["HIV Infections", "Receptors, CCR5"],
+        "genes": ["CCR5"],
+    }
+
+
+class TestSplitPlan:
+    def test_separates_retrieval_and_graph_calls(self) -> None:
+        plan = split_plan(
+            [
+                ToolCall(name="get_related_papers_by_mesh", arguments={"pmid": "$top_pmid"}),
+                ToolCall(name="retrieve_papers_hybrid", arguments={"query": "CCR5"}),
+                ToolCall(name="retrieve_papers_hybrid", arguments={"query": "ignored"}),
+                ToolCall(name="not_a_tool"),
+            ]
+        )
+        assert plan.retrieval is not None
+        assert plan.retrieval.arguments == {"query": "CCR5"}
+        assert [c.name for c in plan.graph] == ["get_related_papers_by_mesh"]
+
+    def test_missing_retrieval(self) -> None:
+        plan = split_plan([ToolCall(name="get_genes_in_same_papers", arguments={"target_gene": "TP53"})])
+        assert plan.retrieval is None
+        assert len(plan.graph) == 1
+
+
+class TestBindings:
+    def test_prefers_scored_author(self, ctx: dict[str, list[str]]) -> None:
+        bindings = build_bindings(ctx, [{"author": "John Doe", "papers": 4}])
+        assert bindings["$top_author"] == "John Doe"
+        assert bindings["$top_pmid"] == "111"
+        assert bindings["$top_gene"] == "CCR5"
+        assert bindings["$mesh_terms"] == ["HIV Infections", "Receptors, CCR5"]
+
+    def test_falls_back_to_first_author(self, ctx: dict[str, list[str]]) -> None:
+        assert build_bindings(ctx, [])["$top_author"] == "Jane Roe"
+
+    def test_omits_empty_values(self) -> None:
+        bindings = build_bindings({"pmids": [], "authors": [], "mesh_terms": [], "genes": []}, [])
+        assert bindings == {}
+
+
+class TestResolveArguments:
+    def test_scalar_and_list_placeholders(self, ctx: dict[str, list[str]]) -> None:
+        bindings = build_bindings(ctx, [])
+        args = resolve_arguments(
+            {
+                "author_name": "$top_author",
+                "topics": ["$mesh_terms", "HIV Infections"],
+                "require_all": False,
+            },
+            bindings,
+        )
+        assert args == {
+            "author_name": "Jane Roe",
+            "topics": ["HIV Infections", "Receptors, CCR5"],
+            "require_all": False,
+        }
+
+    def test_literal_values_pass_through(self) -> None:
+        assert resolve_arguments({"target_gene": "TP53"}, {}) == {"target_gene": "TP53"}
+
+    def test_only_declared_placeholders_are_resolved(self, ctx: dict[str, list[str]]) -> None:
+        args = resolve_arguments(
+            {"topics": ["$mesh_terms", "$PATH"], "query": "$5 test"}, build_bindings(ctx, [])
+        )
+        assert args == {"topics": ["HIV Infections", "Receptors, CCR5", "$PATH"], "query": "$5 test"}
+
+    def test_lists_of_objects_are_kept_as_is(self) -> None:
+        filters = [{"field": "year", "gte": 2020}, {"field": "year", "gte": 2020}]
+        assert resolve_arguments({"filters": filters}, {}) == {"filters": filters}
+
+    def test_unresolved_placeholder_raises(self) -> None:
+        with pytest.raises(UnresolvedPlaceholderError):
+            resolve_arguments({"target_gene": "$top_gene"}, {})
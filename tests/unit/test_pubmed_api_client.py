@@ -0,0 +1,142 @@
+"""Unit tests for the PubMed E-utilities client."""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from biomedical_graphrag.data_sources.pubmed import pubmed_api_client
+from biomedical_graphrag.data_sources.pubmed.pubmed_api_client import PubMedAPIClient, SearchHistory
+
+LINKS = {
+    ("1", "pubmed_pubmed_citedin"): ["10", "11"],
+    ("1", "pubmed_pubmed_refs"): ["20"],
+    ("2", "pubmed_pubmed_refs"): ["21", "22"],
+}
+
+
+def linkset(pmid: str, linkname: str) -> dict:
+    links = LINKS.get((pmid, linkname), [])
+    dbs = [{"LinkName": linkname, "Link": [{"Id": i} for i in links]}] if links else []
+    return {"IdList": [pmid], "LinkSetDb": dbs}
+
+
+@pytest.fixture
+def elink_requests(monkeypatch) -> list[tuple[list[str], str]]:
+    sent: list[tuple[list[str], str]] = []
+
+    async def fake_elink(pmids: list[str], linkname: str) -> list:
+        sent.append((list(pmids), linkname))
+        if "3" in pmids and len(pmids) > 1:
+            raise RuntimeError("backend error")
+        if pmids == ["4"] and linkname == "pubmed_pubmed_refs":
+            raise RuntimeError("backend error")
+        return [linkset(pmid, linkname) for pmid in pmids]
+
+    monkeypatch.setattr(pubmed_api_client, "_elink_citations", fake_elink)
+    return sent
+
+
+def test_batches_share_requests_and_keep_links_per_pmid(elink_requests) -> None:
+    citations = asyncio.run(PubMedAPIClient().fetch_citations_batch(["1", "2"], batch_size=10))
+
+    assert citations == {
+        "1": {"cited_by": ["10", "11"], "references": ["20"]},
+        "2": {"cited_by": [], "references": ["21", "22"]},
+    }
+    # One request per link name, each carrying both PMIDs
+    assert sorted(elink_requests) == [
+        (["1", "2"], "pubmed_pubmed_citedin"),
+        (["1", "2"], "pubmed_pubmed_refs"),
+    ]
+
+
+def test_failed_batch_falls_back_to_single_pmids(elink_requests) -> None:
+    citations = asyncio.run(PubMedAPIClient().fetch_citations_batch(["1", "2", "3", "4"], batch_size=2))
+
+    assert citations["1"]["references"] == ["20"]
+    assert citations["3"] == {"cited_by": [], "references": []}
+    # PMID 4 failed on its own too: left out so it is not mistaken for "no citations"
+    assert "4" not in citations
+    # Only the batch holding PMID 3 was retried one PMID at a time
+    assert sorted(len(pmids) for pmids, _ in elink_requests) == [1, 1, 1, 1, 2, 2, 2, 2]
+
+
+def test_single_pmid_fetch_uses_the_same_parser(elink_requests) -> None:
+    assert asyncio.run(PubMedAPIClient().fetch_citations("1")) == {
+        "cited_by": ["10", "11"],
+        "references": ["20"],
+    }
+
+
+def test_similar_articles_are_scored_per_pmid(monkeypatch) -> None:
+    sent: list[list[str]] = []
+
+    async def fake_elink(pmids: list[str]) -> list:
+        sent.append(list(pmids))
+        scores = {"1": [("1", 900), ("5", 40), ("6", 70)], "2": [("2", 900), ("6", 55)]}
+        return [
+            {
+                "IdList": [pmid],
+                "LinkSetDb": [
+                    {
+                        "LinkName": "pubmed_pubmed",
+                        "Link": [{"Id": i, "Score": score} for i, score in scores[pmid]],
+                    }
+                ],
+            }
+            for pmid in pmids
+        ]
+
+    monkeypatch.setattr(pubmed_api_client, "_elink_similar", fake_elink)
+    similar = asyncio.run(PubMedAPIClient().fetch_similar_batch(["1", "2"]))
+
+    # The source itself is dropped and neighbors come highest score first
+    assert similar == {"1": [("6", 70), ("5", 40)], "2": [("6", 55)]}
+    assert sent == [["1", "2"]]
+
+
+class DatedPubMed(PubMedAPIClient):
+    """35 papers, one every 200 days from 2000; the history server is a dict."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.papers = {str(i): date(2000, 1, 1) + timedelta(days=200 * i) for i in range(35)}
+        self.stored: dict[str, list[str]] = {}
+        self.pages: list[tuple[int, int]] = []
+
+    async def search_history(self, query, mindate=None, maxdate=None) -> SearchHistory:
+        pmids = [
+            pmid
+            for pmid, published in self.papers.items()
+            if mindate is None or mindate <= published <= maxdate
+        ]
+        key = str(len(self.stored))
+        self.stored[key] = pmids
+        return SearchHistory("webenv", key, len(pmids), mindate, maxdate)
+
+    async def history_pmids(self, history: SearchHistory, start: int, count: int) -> list[str]:
+        self.pages.append((start, count))
+        return self.stored[history.query_key][start : start + count]
+
+
+def test_large_searches_are_split_into_date_ranges_under_the_cap(monkeypatch) -> None:
+    monkeypatch.setattr(pubmed_api_client, "ESEARCH_MAX_RESULTS", 10)
+    client = DatedPubMed()
+
+    pmids = asyncio.run(client.search_large("crispr", max_results=100, page_size=4))
+
+    assert sorted(pmids, key=int) == [str(i) for i in range(35)]
+    # Newest range first
+    assert pmids[0] != "0" and pmids.index("34") < pmids.index("0")
+    assert all(count <= 4 for _, count in client.pages)
+
+
+def test_large_search_stops_at_max_results(monkeypatch) -> None:
+    monkeypatch.setattr(pubmed_api_client, "ESEARCH_MAX_RESULTS", 10)
+    client = DatedPubMed()
+
+    pmids = asyncio.run(client.search_large("crispr", max_results=12, page_size=4))
+
+    assert len(pmids) == 12
+    assert sum(count for _, count in client.pages) == 12
@@ -0,0 +1,77 @@
+"""Unit tests for the journal behind resumable PubMed collections."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.data_sources.pubmed.pubmed_data_collector import PubMedDataCollector
+from biomedical_graphrag.domain.citation import CitationNetwork
+from biomedical_graphrag.domain.paper import Paper
+from biomedical_graphrag.utils.journal_util import JsonlJournal
+
+
+def test_journal_drops_a_torn_last_record(tmp_path) -> None:
+    journal = JsonlJournal(tmp_path / "run.jsonl")
+    journal.append({"n": 1})
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"n": 2')  # the process died mid-write
+
+    assert list(journal.records()) == [{"n": 1}]
+    journal.append({"n": 3})
+    assert list(journal.records()) == [{"n": 1}, {"n": 3}]
+
+
+class FlakyCollector(PubMedDataCollector):
+    """Serves five PMIDs; the paper fetch fails once after `fail_after` batches."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        super().__init__()
+        self.fail_after = fail_after
+        self.searches = 0
+        self.fetched: list[list[str]] = []
+        self.cited: list[list[str]] = []
+
+    async def search(self, query: str, max_results: int) -> list[str]:
+        self.searches += 1
+        return ["1", "2", "3", "4", "5"]
+
+    async def fetch_papers(self, paper_ids: list[str]) -> list[Paper]:
+        if self.fail_after is not None and len(self.fetched) == self.fail_after:
+            raise ConnectionError("NCBI unavailable")
+        self.fetched.append(paper_ids)
+        # PMID 4 has no PubMed record
+        return [Paper(pmid=pmid, title=f"Paper {pmid}") for pmid in paper_ids if pmid != "4"]
+
+    async def fetch_citation_network(self, paper_ids: list[str]) -> dict[str, CitationNetwork]:
+        self.cited.append(paper_ids)
+        return {pmid: CitationNetwork(pmid=pmid, cited_by=["9"]) for pmid in paper_ids}
+
+
+def test_interrupted_collection_resumes_after_the_last_batch(tmp_path) -> None:
+    path = str(tmp_path / "collection.jsonl")
+    interrupted = FlakyCollector(fail_after=1)
+    with pytest.raises(ConnectionError):
+        asyncio.run(interrupted.collect_dataset("crispr", 5, checkpoint_path=path, batch_size=2))
+
+    resumed = FlakyCollector()
+    dataset = asyncio.run(resumed.collect_dataset("crispr", 5, checkpoint_path=path, batch_size=2))
+
+    assert resumed.searches == 0
+    assert resumed.fetched == [["3", "4"], ["5"]]
+    assert [paper.pmid for paper in dataset.papers] == ["1", "2", "3", "5"]
+    assert set(dataset.citation_network) == {"1", "2", "3", "5"}
+
+    # Everything is journaled now: a rerun does no API work at all
+    rerun = FlakyCollector()
+    again = asyncio.run(rerun.collect_dataset("crispr", 5, checkpoint_path=path, batch_size=2))
+    assert (rerun.searches, rerun.fetched, rerun.cited) == (0, [], [])
+    assert again.papers == dataset.papers
+
+
+def test_checkpoint_of_another_query_is_discarded(tmp_path) -> None:
+    path = str(tmp_path / "collection.jsonl")
+    asyncio.run(FlakyCollector().collect_dataset("crispr", 5, checkpoint_path=path))
+
+    other = FlakyCollector()
+    asyncio.run(other.collect_dataset("cancer", 5, checkpoint_path=path))
+    assert other.searches == 1
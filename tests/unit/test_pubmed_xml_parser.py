@@ -0,0 +1,105 @@
+"""Unit tests for the streaming PubMed XML parser."""
+
+import asyncio
+import io
+
+from biomedical_graphrag.data_sources.pubmed import pubmed_data_collector
+from biomedical_graphrag.data_sources.pubmed.pubmed_data_collector import PubMedDataCollector
+from biomedical_graphrag.data_sources.pubmed.pubmed_xml_parser import iter_papers, parse_papers_xml
+
+ARTICLE = """
+<PubmedArticle>
+  <MedlineCitation Status="MEDLINE" Owner="NLM">
+    <PMID Version="1">{pmid}</PMID>
+    <Article PubModel="Print">
+      <Journal>
+        <JournalIssue CitedMedium="Internet">
+          <PubDate><Year>2021</Year><Month>Mar</Month></PubDate>
+        </JournalIssue>
+        <Title>Nature biotechnology</Title>
+      </Journal>
+      <ArticleTitle>Base editing of <i>BCL11A</i> in HSCs.</ArticleTitle>
+      <Abstract>
+        <AbstractText Label="BACKGROUND">Sickle cell disease.</AbstractText>
+        <AbstractText Label="RESULTS">Editing at 10<sup>6</sup> cells.</AbstractText>
+      </Abstract>
+      <AuthorList CompleteYN="Y">
+        <Author ValidYN="Y">
+          <LastName>Doudna</LastName><ForeName>Jennifer A</ForeName>
+          <AffiliationInfo><Affiliation>UC Berkeley.</Affiliation></AffiliationInfo>
+          <AffiliationInfo><Affiliation>HHMI.</Affiliation></AffiliationInfo>
+        </Author>
+        <Author ValidYN="Y"><CollectiveName>CRISPR Consortium</CollectiveName></Author>
+        <Author ValidYN="Y"><LastName>Anonymous</LastName></Author>
+      </AuthorList>
+    </Article>
+    <MeshHeadingList>
+      <MeshHeading>
+        <DescriptorName UI="D000755" MajorTopicYN="Y">Anemia, Sickle Cell</DescriptorName>
+        <QualifierName UI="Q000628" MajorTopicYN="N">therapy</QualifierName>
+      </MeshHeading>
+      <MeshHeading><DescriptorName UI="D006801" MajorTopicYN="N">Humans</DescriptorName></MeshHeading>
+    </MeshHeadingList>
+  </MedlineCitation>
+  <PubmedData>
+    <ArticleIdList>
+      <ArticleId IdType="pubmed">{pmid}</ArticleId>
+      <ArticleId IdType="doi">10.1038/s41587-021-0001</ArticleId>
+    </ArticleIdList>
+  </PubmedData>
+</PubmedArticle>
+"""
+
+
+def document(*pmids: str) -> bytes:
+    articles = "".join(ARTICLE.format(pmid=pmid) for pmid in pmids)
+    return (
+        '<?xml version="1.0" ?>\n'
+        '<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2025//EN" '
+        '"https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_250101.dtd">\n'
+        f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+    ).encode()
+
+
+def test_article_fields() -> None:
+    [paper] = parse_papers_xml(document("33589803"))
+
+    assert paper.pmid == "33589803"
+    assert paper.title == "Base editing of BCL11A in HSCs."
+    assert paper.abstract == "Sickle cell disease. Editing at 106 cells."
+    assert paper.journal == "Nature biotechnology"
+    assert paper.publication_date == "2021-03-01"
+    assert paper.doi == "10.1038/s41587-021-0001"
+    assert [a.name for a in paper.authors] == ["Jennifer A Doudna", "CRISPR Consortium"]
+    assert paper.authors[0].affiliations == ["UC Berkeley.", "HHMI."]
+    assert (paper.mesh_terms[0].ui, paper.mesh_terms[0].major_topic) == ("D000755", True)
+    assert paper.mesh_terms[0].qualifiers == ["therapy"]
+    assert paper.mesh_terms[1].qualifiers == []
+
+
+def test_articles_stream_and_are_freed() -> None:
+    source = io.BytesIO(document("1", "", "3"))
+    papers = iter_papers(source)
+
+    first = next(papers)
+    assert first.pmid == "1"
+    # Records without a PMID are skipped
+    assert [paper.pmid for paper in papers] == ["3"]
+
+
+def test_large_batches_are_parsed_in_a_worker_process(monkeypatch) -> None:
+    pmids = [str(i) for i in range(pubmed_data_collector.PROCESS_PARSE_MIN_PAPERS)]
+
+    class FakeAPI:
+        async def fetch_papers_xml(self, pmid_list: list[str]) -> bytes:
+            return document(*pmid_list)
+
+    monkeypatch.setattr(pubmed_data_collector, "_PARSE_POOL", None)
+    collector = PubMedDataCollector()
+    monkeypatch.setattr(collector, "api", FakeAPI())
+    papers = asyncio.run(collector.fetch_papers(pmids))
+
+    assert [paper.pmid for paper in papers] == pmids
+    pool = pubmed_data_collector._PARSE_POOL
+    assert pool is not None
+    pool.shutdown()
@@ -0,0 +1,144 @@
+"""Unit tests for the token-bucket rate limiter."""
+
+import asyncio
+from urllib.error import HTTPError
+
+import pytest
+from Bio import Entrez
+
+from biomedical_graphrag.data_sources import base
+from biomedical_graphrag.utils.rate_limit_util import TokenBucket, ncbi_rate
+
+
+class FakeTime:
+    """A clock whose sleep just moves time forward."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def test_rate_follows_the_api_key() -> None:
+    assert ncbi_rate("key") == 10
+    assert ncbi_rate("") == 3
+
+
+def test_burst_then_steady_rate() -> None:
+    time = FakeTime()
+    bucket = TokenBucket(rate=10, burst=3, clock=time, sleep=time.sleep)
+
+    async def run() -> None:
+        for _ in range(5):
+            await bucket.acquire()
+
+    asyncio.run(run())
+    # Three requests go straight out, then one every 100 ms
+    assert time.sleeps == [0.1, 0.1]
+
+
+def test_concurrent_callers_reserve_successive_slots() -> None:
+    time = FakeTime()
+    waits: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        waits.append(round(seconds, 6))
+
+    bucket = TokenBucket(rate=4, burst=1, clock=time, sleep=sleep)
+
+    async def run() -> None:
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    asyncio.run(run())
+    # Nobody sleeps while holding a lock: each waits for its own slot
+    assert sorted(waits) == [0.25, 0.5, 0.75]
+
+
+def test_throttling_halves_the_rate_and_recovers() -> None:
+    time = FakeTime()
+    bucket = TokenBucket(rate=10, burst=3, recovery_seconds=10, clock=time, sleep=time.sleep)
+
+    async def run() -> None:
+        await bucket.throttled()
+        await bucket.throttled()  # same burst of failures
+        assert bucket.current_rate == 5
+        await bucket.acquire()
+        assert time.sleeps == [0.2]
+
+    asyncio.run(run())
+    time.now += 5
+    assert bucket.current_rate == pytest.approx(10)
+
+
+def test_buckets_sharing_a_state_file_share_the_budget(tmp_path) -> None:
+    time = FakeTime()
+    path = tmp_path / "entrez.json"
+    first = TokenBucket(rate=10, burst=2, state_path=path, clock=time, sleep=time.sleep)
+    second = TokenBucket(rate=10, burst=2, state_path=path, clock=time, sleep=time.sleep)
+
+    async def run() -> None:
+        await first.acquire()
+        await second.acquire()
+        await first.acquire()
+        await second.throttled()
+
+    asyncio.run(run())
+    assert time.sleeps == [0.1]
+    assert first.current_rate == 5
+
+
+def test_entrez_call_slows_down_on_429(monkeypatch) -> None:
+    time = FakeTime()
+    bucket = TokenBucket(rate=10, burst=1, clock=time, sleep=time.sleep)
+    monkeypatch.setattr(base, "_ENTREZ_LIMITER", bucket)
+
+    attempts: list[int] = []
+
+    def too_many_requests() -> None:
+        attempts.append(1)
+        raise HTTPError("https://eutils", 429, "Too Many Requests", None, None)  # type: ignore[arg-type]
+
+    async def run() -> None:
+        assert await base.entrez_call(lambda: "ok") == "ok"
+        with pytest.raises(HTTPError):
+            await base.entrez_call(too_many_requests)
+
+    asyncio.run(run())
+    assert bucket.current_rate == pytest.approx(5, abs=0.2)
+    # Retried by entrez_call, each attempt waiting for the limiter
+    assert len(attempts) == base.settings.pubmed.max_tries
+
+
+def test_first_429_from_ncbi_reaches_the_limiter(monkeypatch) -> None:
+    monkeypatch.setattr(Entrez, "max_tries", Entrez.max_tries)
+    monkeypatch.setattr(base, "_ENTREZ_LIMITER", None)
+    monkeypatch.setattr(base.settings.pubmed, "requests_per_second", 1000.0)
+    bucket = base.entrez_rate_limiter()
+    throttled: list[float] = []
+
+    async def record_throttled() -> None:
+        throttled.append(bucket.current_rate)
+
+    monkeypatch.setattr(bucket, "throttled", record_throttled)
+    responses: list[int] = []
+
+    def urlopen(request):
+        responses.append(429)
+        raise HTTPError(request.full_url, 429, "Too Many Requests", None, None)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Entrez, "urlopen", urlopen)
+    monkeypatch.setattr(base.settings.pubmed, "max_tries", 1)
+
+    with pytest.raises(HTTPError):
+        asyncio.run(base.entrez_call(lambda: Entrez.esearch(db="pubmed", term="CCR5")))
+
+    # Biopython no longer retries on its own: the first 429 is the limiter's
+    assert Entrez.max_tries == 1
+    assert responses == [429]
+    assert throttled == [1000.0]
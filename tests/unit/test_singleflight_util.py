@@ -0,0 +1,81 @@
+"""Unit tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from biomedical_graphrag.utils.singleflight_util import SingleFlight
+
+
+def test_concurrent_calls_share_one_run() -> None:
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run() -> list[tuple[str, bool]]:
+        flights: SingleFlight[str] = SingleFlight()
+        results = await asyncio.gather(*(flights.do("q", work) for _ in range(5)))
+        assert len(flights) == 0
+        return results
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert [r for r, _ in results] == ["answer"] * 5
+    assert sum(shared for _, shared in results) == 4
+
+
+def test_different_keys_and_sequential_calls_run_separately() -> None:
+    calls: list[str] = []
+
+    async def run() -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        def work(key: str):
+            async def inner() -> str:
+                calls.append(key)
+                await asyncio.sleep(0)
+                return key
+
+            return inner
+
+        await asyncio.gather(flights.do("a", work("a")), flights.do("b", work("b")))
+        await flights.do("a", work("a"))
+
+    asyncio.run(run())
+    assert sorted(calls) == ["a", "a", "b"]
+
+
+def test_errors_reach_every_caller() -> None:
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run() -> list[BaseException | tuple[str, bool]]:
+        flights: SingleFlight[str] = SingleFlight()
+        return await asyncio.gather(flights.do("q", fail), flights.do("q", fail), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_cancelled_caller_does_not_cancel_shared_run() -> None:
+    async def work() -> str:
+        await asyncio.sleep(0.02)
+        return "answer"
+
+    async def run() -> tuple[str, bool]:
+        flights: SingleFlight[str] = SingleFlight()
+        first = asyncio.create_task(flights.do("q", work))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flights.do("q", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == ("answer", True)